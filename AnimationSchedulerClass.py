@@ -0,0 +1,275 @@
+import math
+import os
+import threading
+import time
+import tkinter
+
+# Share of one CPU core all animations together may use before decorative
+# ones are slowed down
+CPU_BUDGET = float(os.environ.get('HANYAMUSIC_ANIMATION_BUDGET', '0.15'))
+
+# Seconds without keyboard or mouse input after which decorative animations pause
+IDLE_AFTER = float(os.environ.get('HANYAMUSIC_ANIMATION_IDLE', '30'))
+
+
+class Animation:
+    def __init__(self, scheduler, name, step, interval_ms, widget=None, decorative=False):
+        """One animation driven by the AnimationScheduler.
+
+        Args:
+            scheduler: Owning scheduler
+            name: Name shown in the debug readout
+            step: Called once per frame; returning False ends the animation
+            interval_ms: Desired time between frames
+            widget: Widget the animation draws into; it pauses while the widget
+                    is not viewable and ends when the widget is destroyed
+            decorative: Decorative animations pause when the app is idle and are
+                        the ones slowed down when over the CPU budget
+        """
+        self.scheduler = scheduler
+        self.name = name
+        self.step = step
+        self.interval = interval_ms / 1000
+        self.widget = widget
+        self.decorative = decorative
+        self.next_due = time.monotonic()
+        self.state = "running"
+        self.frames = 0
+        # Exponentially weighted average cost of one frame, in seconds
+        self.cost = 0.0
+
+    @property
+    def active(self):
+        return self.state != "finished"
+
+    def effective_interval(self):
+        if self.decorative:
+            return self.interval * self.scheduler.throttle
+        return self.interval
+
+    def cancel(self):
+        """Stop the animation (safe to call more than once)"""
+        self.scheduler.remove(self)
+
+
+class AnimationScheduler:
+    def __init__(self, root, cpu_budget=CPU_BUDGET, idle_after=IDLE_AFTER):
+        """Drive all Tk animations from a single after() timer.
+
+        Each tick runs the animations that are due and sleeps until the next
+        one. Animations pause while their widget is not viewable, all of them
+        while the window is minimized or fully covered, and decorative ones
+        while nobody has touched the app for idle_after seconds. With nothing
+        to draw no timer is pending, so the idle app costs no CPU. When frames
+        cost more than cpu_budget of a core, decorative animations run at a
+        fraction of their frame rate until the cost drops again.
+
+        Args:
+            root: Tk root window
+            cpu_budget: Share of one core animations may use (0-1)
+            idle_after: Seconds without input before decorative animations pause
+        """
+        self.root = root
+        self.cpu_budget = cpu_budget
+        self.idle_after = idle_after
+
+        self._animations = []
+        self._after_id = None
+        self._due_at = None
+        self.window_hidden = False
+        self.last_input = time.monotonic()
+        self.idle = False
+        # Decorative animations run at 1/throttle of their frame rate
+        self.throttle = 1
+        self._last_budget_check = time.monotonic()
+        self.stats = {'ticks': 0, 'frames': 0, 'throttled': 0}
+
+        root.bind('<Map>', self._on_window_state, add="+")
+        root.bind('<Unmap>', self._on_window_state, add="+")
+        root.bind('<Visibility>', self._on_window_visibility, add="+")
+        for sequence in ('<Motion>', '<KeyPress>', '<ButtonPress>'):
+            root.bind_all(sequence, self._on_input, add="+")
+
+    # Registration
+
+    def add(self, name, step, interval_ms, widget=None, decorative=False):
+        """Start an animation; see Animation for the arguments.
+
+        Returns:
+            Animation: Handle whose cancel() stops it
+        """
+        animation = Animation(self, name, step, interval_ms, widget, decorative)
+        self._animations.append(animation)
+        self._wake()
+        return animation
+
+    def remove(self, animation):
+        animation.state = "finished"
+        if animation in self._animations:
+            self._animations.remove(animation)
+
+    # Window and input state
+
+    def _on_window_state(self, event):
+        if event.widget is not self.root:
+            return
+        try:
+            hidden = self.root.state() in ('iconic', 'withdrawn')
+        except tkinter.TclError:
+            return
+        self._set_window_hidden(hidden)
+
+    def _on_window_visibility(self, event):
+        if event.widget is not self.root:
+            return
+        self._set_window_hidden(event.state == 'VisibilityFullyObscured')
+
+    def _set_window_hidden(self, hidden):
+        if hidden == self.window_hidden:
+            return
+        self.window_hidden = hidden
+        print(f"[DEBUG] Animations {'paused (window hidden)' if hidden else 'resumed'}")
+        if not hidden:
+            self._wake()
+
+    def _on_input(self, event):
+        self.last_input = time.monotonic()
+        if self.idle:
+            self.idle = False
+            self._wake()
+
+    # Ticking
+
+    def _wake(self):
+        """Tick as soon as possible (replaces a later pending tick)"""
+        self._schedule(0)
+
+    def _schedule(self, delay):
+        due_at = time.monotonic() + delay
+        if self._after_id is not None:
+            if self._due_at is not None and self._due_at <= due_at:
+                return
+            self.root.after_cancel(self._after_id)
+        self._due_at = due_at
+        # Round up: a tick that fires before the frame is due would only reschedule
+        self._after_id = self.root.after(max(0, math.ceil(delay * 1000)), self._tick)
+
+    def _visible(self, animation):
+        """False while the animation's widget is not on screen; None once it is destroyed"""
+        widget = animation.widget
+        if widget is None:
+            return True
+        try:
+            if not widget.winfo_exists():
+                return None
+            return bool(widget.winfo_viewable())
+        except tkinter.TclError:
+            return None
+
+    def _tick(self):
+        self._after_id = None
+        self._due_at = None
+        self.stats['ticks'] += 1
+        now = time.monotonic()
+        if not self.idle and now - self.last_input > self.idle_after:
+            self.idle = True
+            print("[DEBUG] App idle, pausing decorative animations")
+
+        next_due = None
+        waiting_for_widget = False
+        for animation in list(self._animations):
+            if self.window_hidden or (self.idle and animation.decorative):
+                animation.state = "paused"
+                continue
+            visible = self._visible(animation)
+            if visible is None:
+                self.remove(animation)
+                continue
+            if not visible:
+                animation.state = "paused"
+                waiting_for_widget = True
+                continue
+            if animation.state == "paused":
+                animation.state = "running"
+                animation.next_due = now
+            if animation.next_due <= now:
+                self._run_frame(animation, now)
+                if not animation.active:
+                    continue
+            if next_due is None or animation.next_due < next_due:
+                next_due = animation.next_due
+
+        self._check_budget(now)
+        if next_due is not None:
+            self._schedule(max(0.0, next_due - time.monotonic()))
+        elif waiting_for_widget:
+            # Widgets give no event when an ancestor is shown again; look twice a second
+            self._schedule(0.5)
+        # Otherwise nothing is pending until input, a window event or add() wakes us
+
+    def _run_frame(self, animation, now):
+        start = time.perf_counter()
+        try:
+            keep_going = animation.step()
+        except tkinter.TclError:
+            # The widget went away mid-frame
+            keep_going = False
+        except Exception as e:
+            print(f"[DEBUG] Animation '{animation.name}' failed, stopping it: {e}")
+            keep_going = False
+        cost = time.perf_counter() - start
+        animation.cost = cost if animation.frames == 0 else animation.cost * 0.9 + cost * 0.1
+        animation.frames += 1
+        self.stats['frames'] += 1
+        if keep_going is False:
+            self.remove(animation)
+            return
+        # Skip frames we are too late for instead of bunching them up
+        animation.next_due = max(animation.next_due + animation.effective_interval(), now)
+
+    def load(self):
+        """Share of a core currently spent on running animations"""
+        return sum(a.cost / a.effective_interval() for a in self._animations if a.state == "running")
+
+    def _check_budget(self, now):
+        """Halve or double the decorative frame rate at most once a second"""
+        if now - self._last_budget_check < 1.0:
+            return
+        self._last_budget_check = now
+        load = self.load()
+        if load > self.cpu_budget and self.throttle < 8:
+            self.throttle *= 2
+            self.stats['throttled'] += 1
+            print(f"[DEBUG] Animations over CPU budget ({load:.0%} > {self.cpu_budget:.0%}), "
+                  f"decorative frame rate 1/{self.throttle}")
+        elif self.throttle > 1 and load * 2 < self.cpu_budget * 0.8:
+            self.throttle //= 2
+
+    def describe(self):
+        """Human-readable one-line-per-animation debug readout"""
+        lines = [
+            f"load={self.load():.1%} budget={self.cpu_budget:.0%} throttle=1/{self.throttle} "
+            f"idle={self.idle} window_hidden={self.window_hidden} ticks={self.stats['ticks']} "
+            f"frames={self.stats['frames']} timer={'pending' if self._after_id else 'none'}"
+        ]
+        for a in self._animations:
+            lines.append(
+                f"{a.name}: {a.state} every {a.effective_interval() * 1000:.0f}ms "
+                f"cost={a.cost * 1000:.2f}ms frames={a.frames}{' decorative' if a.decorative else ''}"
+            )
+        return "\n".join(lines)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_animation_scheduler(widget=None):
+    """Return the app's animation scheduler, creating it for widget's root window on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            if widget is None:
+                raise RuntimeError("The animation scheduler needs a widget on first use")
+            _scheduler = AnimationScheduler(widget._root())
+        return _scheduler
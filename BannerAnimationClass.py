@@ -1,8 +1,269 @@
 import customtkinter as ctk
 import math
 import random
+import time
+from collections import deque
 from datetime import datetime
 import colorsys
+from PIL import Image, ImageDraw, ImageTk
+from AnimationSchedulerClass import get_animation_scheduler
+
+
+class BannerPalette:
+    def __init__(self, colors, steps_per_color=512, intensity_levels=256):
+        """Blended banner colors precomputed for a palette.
+
+        The blend runs once per step of the palette cycle, with the same HSV
+        interpolation and easing the banner always used. Breathing only scales
+        HSV value, which scales RGB by the same factor, so the table for each
+        intensity level is a multiply away and is built the first time that
+        level is needed.
+
+        Args:
+            colors: Palette as hex strings, in cycle order
+            steps_per_color: Lookup resolution between two neighbouring colors
+            intensity_levels: Number of breathing-intensity levels between 0 and 1
+        """
+        self.colors = list(colors)
+        self.size = len(self.colors) * steps_per_color
+        self.intensity_levels = intensity_levels
+        self._tables = {}
+        
+        # Unscaled RGB (0-1) at each step of the cycle
+        self._base = []
+        total_colors = len(self.colors)
+        for step in range(self.size):
+            exact_color_pos = step / steps_per_color
+            color_index = int(exact_color_pos) % total_colors
+            color1 = self.colors[color_index]
+            color2 = self.colors[(color_index + 1) % total_colors]
+            color3 = self.colors[(color_index + 2) % total_colors]
+            t = exact_color_pos % 1.0
+            if t < 0.5:
+                self._base.extend(self.blend(color1, color2, t * 2))
+            else:
+                self._base.extend(self.blend(color2, color3, (t - 0.5) * 2))
+    
+    def table(self, intensity):
+        """RGB bytes for the whole cycle (3 per step) at a breathing intensity (0-1)"""
+        level = round(max(0.0, min(1.0, intensity)) * (self.intensity_levels - 1))
+        table = self._tables.get(level)
+        if table is None:
+            scale = level / (self.intensity_levels - 1) * 255
+            table = bytes(int(c * scale) for c in self._base)
+            self._tables[level] = table
+        return table
+    
+    def index(self, color_progress):
+        """Byte offset into a table for a position (0-1) in the palette cycle"""
+        return int(color_progress * self.size) % self.size * 3
+    
+    def blend(self, color1, color2, t):
+        """HSV interpolation with ultra-smooth easing; returns RGB floats (0-1) at full intensity"""
+        # Convert to RGB
+        c1_rgb = self.hex_to_rgb(color1)
+        c2_rgb = self.hex_to_rgb(color2)
+        
+        # Convert to HSV for better color blending
+        c1_hsv = colorsys.rgb_to_hsv(c1_rgb[0]/255, c1_rgb[1]/255, c1_rgb[2]/255)
+        c2_hsv = colorsys.rgb_to_hsv(c2_rgb[0]/255, c2_rgb[1]/255, c2_rgb[2]/255)
+        
+        # Ultra-smooth easing
+        t = self.ultra_smooth_ease_v2(t)
+        
+        # Handle hue wraparound for smooth transitions
+        h1, h2 = c1_hsv[0], c2_hsv[0]
+        if abs(h2 - h1) > 0.5:
+            if h1 > h2:
+                h2 += 1.0
+            else:
+                h1 += 1.0
+        
+        # Interpolate in HSV space
+        h = (h1 + (h2 - h1) * t) % 1.0
+        s = c1_hsv[1] + (c2_hsv[1] - c1_hsv[1]) * t
+        v = c1_hsv[2] + (c2_hsv[2] - c1_hsv[2]) * t
+        
+        # Ensure values are in valid range
+        s = max(0, min(1, s))
+        v = max(0, min(1, v))
+        
+        return colorsys.hsv_to_rgb(h, s, v)
+    
+    def ultra_smooth_ease_v2(self, t):
+        """Enhanced ultra-smooth easing function"""
+        t = max(0, min(1, t))
+        # Combination of multiple easing functions for ultimate smoothness
+        ease1 = t * t * t * (t * (t * 6 - 15) + 10)
+        ease2 = 1 - pow(1 - t, 4)
+        ease3 = t * t * (3 - 2 * t)
+        return (ease1 * 0.5 + ease2 * 0.3 + ease3 * 0.2)
+    
+    def hex_to_rgb(self, hex_color):
+        """Convert hex color to RGB tuple"""
+        hex_color = hex_color.lstrip('#')
+        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    
+    def describe(self):
+        """One-line debug readout"""
+        return (f"colors={len(self.colors)} steps={self.size} "
+                f"levels_built={len(self._tables)}/{self.intensity_levels}")
+
+
+class BannerGradientEngine:
+    def __init__(self, width=800, height=200, strips=600, overscan=50):
+        """Renders the banner's animated gradient into one image per frame.
+
+        The vertical strips are computed as a single row of pixels, which one
+        affine transform stretches to the banner size; the wavy bottom edge is
+        a single polygon. The banner pushes the result into one canvas image
+        item instead of recreating hundreds of rectangles every frame.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            strips: Number of color strips across the width
+            overscan: Extra strips computed on each side (the gradient sways sideways)
+        """
+        self.width = width
+        self.height = height
+        self.strips = strips
+        self.overscan = overscan
+        self.palette = BannerPalette(["#000000"])
+        self.wave_start_points = []
+        self.color_shift_offset = 0
+        self.breathing_offset = 0
+        self.generate_wave_start_points()
+
+    def set_colors(self, colors):
+        """Switch palettes; the blend tables are compiled here, not per frame"""
+        if list(colors) != self.palette.colors:
+            self.palette = BannerPalette(colors)
+    
+    def resize(self, width, height):
+        self.width = max(1, width)
+        self.height = max(1, height)
+
+    def generate_wave_start_points(self):
+        """Generate random wave start points for dynamic animation"""
+        self.wave_start_points = []
+        for i in range(5):  # Reduced from 7 to 5 for better performance
+            self.wave_start_points.append({
+                'x': random.uniform(0, self.width),
+                'y': random.uniform(0, self.height),
+                'speed': random.uniform(0.2, 1.0),  # Reduced speed range
+                'amplitude': random.uniform(15, 40),  # Reduced amplitude
+                'frequency': random.uniform(0.002, 0.008),  # Reduced frequency
+                'phase': random.uniform(0, 2 * math.pi),
+                'direction': random.choice([-1, 1])
+            })
+
+    def perlin_noise_1d(self, x, scale=0.05):  # Reduced scale for performance
+        """Simple 1D Perlin-like noise for smooth variations"""
+        x = x * scale
+        i = int(x)
+        f = x - i
+        # Smooth interpolation
+        u = f * f * f * (f * (f * 6 - 15) + 10)
+        return math.sin(i * 12.9898) * (1 - u) + math.sin((i + 1) * 12.9898) * u
+
+    def compute_strips(self, animation_offset, x_offset):
+        """Colors and bottom edges of all strips for one frame.
+
+        Returns:
+            tuple: (bytearray of RGB triples, list of bottom y per strip)
+        """
+        strips = self.strips
+        strip_width = self.width / strips
+        
+        # Calculate breathing effect for subtle color intensity changes
+        self.breathing_offset += 0.005  # Reduced from 0.01
+        breathing_intensity = (math.sin(self.breathing_offset) + 1) * 0.5
+        
+        # Color shift for dynamic palette rotation
+        self.color_shift_offset += 0.001  # Reduced from 0.002
+        
+        palette = self.palette
+        table = palette.table(breathing_intensity)
+        
+        row = bytearray()
+        bottoms = []
+        for i in range(-self.overscan, strips + self.overscan):
+            x = (i * strip_width) + x_offset
+            
+            # Simplified wave calculation for better performance
+            total_wave_offset = 0
+            for wave_point in self.wave_start_points:
+                # Update wave point position dynamically
+                wave_point['x'] += wave_point['speed'] * wave_point['direction'] * 0.05  # Reduced from 0.1
+                if wave_point['x'] < 0 or wave_point['x'] > self.width:
+                    wave_point['direction'] *= -1
+                
+                distance_from_wave = abs(x - wave_point['x'])
+                
+                primary_wave = math.sin(
+                    (distance_from_wave + animation_offset * wave_point['speed']) * 
+                    wave_point['frequency'] + wave_point['phase']
+                ) * wave_point['amplitude']
+                
+                # Simplified fade function
+                fade_factor = max(0, 1 - (distance_from_wave / 200))
+                total_wave_offset += primary_wave * fade_factor
+            
+            # Normalize wave offset
+            wave_offset = total_wave_offset / len(self.wave_start_points)
+            
+            # Enhanced color progression with multiple techniques
+            base_progress = ((i + animation_offset * 0.005) / strips) % 1.0  # Reduced from 0.008
+            
+            # Add wave influence to color progression for dynamic shifts
+            wave_influence = wave_offset * 0.0005  # Reduced from 0.001
+            color_progress = (base_progress + wave_influence + self.color_shift_offset) % 1.0
+            
+            # Blended color from the precompiled palette
+            index = palette.index(color_progress)
+            row += table[index:index + 3]
+            
+            bottoms.append(self.height + wave_offset + 20)  # Reduced from +30
+        return row, bottoms
+
+    def render(self, animation_offset, x_offset):
+        """Render one frame.
+
+        Args:
+            animation_offset: Animation clock of the banner
+            x_offset: Horizontal sway of the whole gradient in pixels
+
+        Returns:
+            PIL.Image.Image: RGB image of width x height
+        """
+        row, bottoms = self.compute_strips(animation_offset, x_offset)
+        strip_width = self.width / self.strips
+        strip_row = Image.frombytes("RGB", (len(bottoms), 1), bytes(row))
+        
+        # Pixel px shows the strip starting at or before it: strip index
+        # (px - x_offset) / strip_width, stored overscan columns into the row
+        image = strip_row.transform(
+            (self.width, self.height),
+            Image.Transform.AFFINE,
+            (1 / strip_width, 0, self.overscan - x_offset / strip_width, 0, 0, 0),
+            resample=Image.Resampling.NEAREST
+        )
+        
+        # Where a strip ends above the bottom, the black background shows through
+        if min(bottoms) < self.height:
+            edge = []
+            for i, bottom in enumerate(bottoms):
+                x = (i - self.overscan) * strip_width + x_offset
+                if -strip_width <= x <= self.width:
+                    edge.append((x, bottom))
+                    edge.append((x + strip_width, bottom))
+            if edge:
+                ImageDraw.Draw(image).polygon(
+                    edge + [(self.width, self.height + 1), (0, self.height + 1)], fill=(0, 0, 0)
+                )
+        return image
+
 
 class AnimatedBanner(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
@@ -15,13 +276,18 @@ class AnimatedBanner(ctk.CTkFrame):
         self.canvas_height = 200
         
         # Enhanced wave animation variables
-        self.wave_start_points = []
+        self.engine = BannerGradientEngine(self.canvas_width, self.canvas_height)
         self.particle_effects = []
-        self.color_shift_offset = 0
-        self.breathing_offset = 0
-        self.generate_wave_start_points()
         self.generate_particles()
         
+        # The gradient is one canvas image item updated in place; particles are
+        # persistent ovals that are moved rather than recreated
+        self._gradient_photo = None
+        self._gradient_item = None
+        self._particle_items = []
+        self._particle_colors = {}
+        self.frame_times = deque(maxlen=120)
+        
         # Performance optimization flags
         self.is_visible = True
         self.animation_active = True
@@ -56,26 +322,14 @@ class AnimatedBanner(ctk.CTkFrame):
         # Get initial greeting and colors
         self.update_greeting()
         
-        # Start animation
-        self.animate_banner()
+        # Start animation (paused by the scheduler while the banner is off screen)
+        self.animation = get_animation_scheduler(self).add(
+            "banner", self.animate_banner, 20, widget=self.canvas, decorative=True
+        )
         
         # Bind resize event
         self.canvas.bind('<Configure>', self.on_canvas_resize)
     
-    def generate_wave_start_points(self):
-        """Generate random wave start points for dynamic animation"""
-        self.wave_start_points = []
-        for i in range(5):  # Reduced from 7 to 5 for better performance
-            self.wave_start_points.append({
-                'x': random.uniform(0, self.canvas_width),
-                'y': random.uniform(0, self.canvas_height),
-                'speed': random.uniform(0.2, 1.0),  # Reduced speed range
-                'amplitude': random.uniform(15, 40),  # Reduced amplitude
-                'frequency': random.uniform(0.002, 0.008),  # Reduced frequency
-                'phase': random.uniform(0, 2 * math.pi),
-                'direction': random.choice([-1, 1])
-            })
-    
     def generate_particles(self):
         """Generate floating particles for extra visual appeal"""
         self.particle_effects = []
@@ -135,6 +389,7 @@ class AnimatedBanner(ctk.CTkFrame):
     def update_greeting(self):
         """Update greeting text and colors"""
         greeting, self.colors = self.get_time_based_greeting_and_colors()
+        self.engine.set_colors(self.colors)
         self.text_label.configure(text=greeting)
         self.text_shadow.configure(text=greeting)
     
@@ -142,152 +397,51 @@ class AnimatedBanner(ctk.CTkFrame):
         """Handle canvas resize"""
         self.canvas_width = event.width
         self.canvas_height = event.height
+        self.engine.resize(event.width, event.height)
         # Regenerate particles for new canvas size
         self.generate_particles()
     
-    def perlin_noise_1d(self, x, scale=0.05):  # Reduced scale for performance
-        """Simple 1D Perlin-like noise for smooth variations"""
-        x = x * scale
-        i = int(x)
-        f = x - i
-        # Smooth interpolation
-        u = f * f * f * (f * (f * 6 - 15) + 10)
-        return math.sin(i * 12.9898) * (1 - u) + math.sin((i + 1) * 12.9898) * u
-    
-    def hsv_to_hex(self, h, s, v):
-        """Convert HSV to hex color"""
-        rgb = colorsys.hsv_to_rgb(h, s, v)
-        return f"#{int(rgb[0]*255):02x}{int(rgb[1]*255):02x}{int(rgb[2]*255):02x}"
-    
     def create_ultra_smooth_gradient_wave(self, x_offset):
-        """Create ultra-smooth gradient wave animation with enhanced blending"""
-        self.canvas.delete("gradient")
-        self.canvas.delete("particles")
-        
-        # Reduced resolution for better performance
-        strips = 600  # Reduced from 1200 to 600
-        strip_width = self.canvas_width / strips
-        
-        # Calculate breathing effect for subtle color intensity changes
-        self.breathing_offset += 0.005  # Reduced from 0.01
-        breathing_intensity = (math.sin(self.breathing_offset) + 1) * 0.5
+        """Render the gradient for this frame and push it into the canvas image item"""
+        start = time.perf_counter()
+        image = self.engine.render(self.animation_offset, x_offset)
         
-        # Color shift for dynamic palette rotation
-        self.color_shift_offset += 0.001  # Reduced from 0.002
-        
-        for i in range(-50, strips + 50):  # Reduced extra strips
-            x = (i * strip_width) + x_offset
-            
-            # Simplified wave calculation for better performance
-            total_wave_offset = 0
-            for j, wave_point in enumerate(self.wave_start_points):
-                # Update wave point position dynamically
-                wave_point['x'] += wave_point['speed'] * wave_point['direction'] * 0.05  # Reduced from 0.1
-                if wave_point['x'] < 0 or wave_point['x'] > self.canvas_width:
-                    wave_point['direction'] *= -1
-                
-                distance_from_wave = abs(x - wave_point['x'])
-                
-                # Simplified wave calculation
-                primary_wave = math.sin(
-                    (distance_from_wave + self.animation_offset * wave_point['speed']) * 
-                    wave_point['frequency'] + wave_point['phase']
-                ) * wave_point['amplitude']
-                
-                # Removed secondary wave and noise for performance
-                combined_wave = primary_wave
-                
-                # Simplified fade function
-                fade_factor = max(0, 1 - (distance_from_wave / 200))
-                total_wave_offset += combined_wave * fade_factor
-            
-            # Normalize wave offset
-            wave_offset = total_wave_offset / len(self.wave_start_points)
-            
-            # Enhanced color progression with multiple techniques
-            base_progress = ((i + self.animation_offset * 0.005) / strips) % 1.0  # Reduced from 0.008
-            
-            # Add wave influence to color progression for dynamic shifts
-            wave_influence = wave_offset * 0.0005  # Reduced from 0.001
-            color_progress = (base_progress + wave_influence + self.color_shift_offset) % 1.0
-            
-            # Multi-color interpolation for ultra-smooth transitions
-            total_colors = len(self.colors)
-            exact_color_pos = color_progress * total_colors
-            color_index = int(exact_color_pos) % total_colors
-            next_color_index = (color_index + 1) % total_colors
-            next_next_color_index = (color_index + 2) % total_colors
-            
-            # Get three colors for cubic interpolation
-            color1 = self.colors[color_index]
-            color2 = self.colors[next_color_index]
-            color3 = self.colors[next_next_color_index]
-            
-            # Cubic interpolation factor
-            t = exact_color_pos % 1.0
-            
-            # Triple-color blending for ultimate smoothness
-            if t < 0.5:
-                # Blend between color1 and color2
-                blend_t = t * 2
-                interpolated_color = self.advanced_color_blend(color1, color2, blend_t, breathing_intensity)
-            else:
-                # Blend between color2 and color3
-                blend_t = (t - 0.5) * 2
-                interpolated_color = self.advanced_color_blend(color2, color3, blend_t, breathing_intensity)
-            
-            # Create gradient strip with wave offset
-            y1 = -20  # Reduced from -30
-            y2 = self.canvas_height + wave_offset + 20  # Reduced from +30
-            
-            # Only draw visible strips
-            if x > -strip_width * 2 and x < self.canvas_width + strip_width * 2:
-                self.canvas.create_rectangle(
-                    x, y1, x + strip_width + 1, y2,  # +1 to prevent gaps
-                    fill=interpolated_color,
-                    outline="",
-                    tags="gradient"
+        photo = self._gradient_photo
+        if photo is None or (photo.width(), photo.height()) != image.size:
+            # New size: a fresh PhotoImage, shown by the same canvas item
+            self._gradient_photo = ImageTk.PhotoImage(image, master=self.canvas)
+            if self._gradient_item is None:
+                self._gradient_item = self.canvas.create_image(
+                    0, 0, image=self._gradient_photo, anchor="nw", tags="gradient"
                 )
+                self.canvas.tag_lower(self._gradient_item)
+            else:
+                self.canvas.itemconfigure(self._gradient_item, image=self._gradient_photo)
+        else:
+            photo.paste(image)
         
-        # Add floating particles (simplified)
+        # Add floating particles
         if self.animation_active:
             self.draw_particles()
-    
-    def advanced_color_blend(self, color1, color2, t, intensity_mod=1.0):
-        """Advanced color blending with HSV interpolation and intensity modulation"""
-        # Convert to RGB
-        c1_rgb = self.hex_to_rgb(color1)
-        c2_rgb = self.hex_to_rgb(color2)
-        
-        # Convert to HSV for better color blending
-        c1_hsv = colorsys.rgb_to_hsv(c1_rgb[0]/255, c1_rgb[1]/255, c1_rgb[2]/255)
-        c2_hsv = colorsys.rgb_to_hsv(c2_rgb[0]/255, c2_rgb[1]/255, c2_rgb[2]/255)
-        
-        # Ultra-smooth easing
-        t = self.ultra_smooth_ease_v2(t)
         
-        # Handle hue wraparound for smooth transitions
-        h1, h2 = c1_hsv[0], c2_hsv[0]
-        if abs(h2 - h1) > 0.5:
-            if h1 > h2:
-                h2 += 1.0
-            else:
-                h1 += 1.0
-        
-        # Interpolate in HSV space
-        h = (h1 + (h2 - h1) * t) % 1.0
-        s = c1_hsv[1] + (c2_hsv[1] - c1_hsv[1]) * t
-        v = (c1_hsv[2] + (c2_hsv[2] - c1_hsv[2]) * t) * intensity_mod
-        
-        # Ensure values are in valid range
-        s = max(0, min(1, s))
-        v = max(0, min(1, v))
-        
-        return self.hsv_to_hex(h, s, v)
+        self.frame_times.append(time.perf_counter() - start)
+    
+    def average_frame_ms(self):
+        """Mean cost of the recent frames in milliseconds (0 before the first frame)"""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times) * 1000
     
     def draw_particles(self):
         """Draw floating particles for extra visual appeal"""
-        for particle in self.particle_effects:
+        while len(self._particle_items) < len(self.particle_effects):
+            self._particle_items.append(self.canvas.create_oval(0, 0, 0, 0, outline="", tags="particles"))
+        while len(self._particle_items) > len(self.particle_effects):
+            item = self._particle_items.pop()
+            self._particle_colors.pop(item, None)
+            self.canvas.delete(item)
+        
+        for particle, item in zip(self.particle_effects, self._particle_items):
             # Update particle position
             particle['x'] += particle['speed_x']
             particle['y'] += particle['speed_y']
@@ -303,48 +457,32 @@ class AnimatedBanner(ctk.CTkFrame):
             elif particle['y'] > self.canvas_height:
                 particle['y'] = 0
             
-            # Pulsing opacity
-            pulse = (math.sin(self.animation_offset * particle['pulse_speed']) + 1) * 0.5
-            current_opacity = particle['opacity'] * pulse
-            
             # Create particle color based on current gradient - FIXED INDEX ERROR
             color_index = int((particle['x'] / self.canvas_width) * len(self.colors))
             color_index = max(0, min(len(self.colors) - 1, color_index))  # Ensure valid index
             particle_color = self.colors[color_index]
             
-            # Draw particle
-            self.canvas.create_oval(
+            # Move the particle's oval; recolor only when it crosses into another color
+            self.canvas.coords(
+                item,
                 particle['x'] - particle['size'], particle['y'] - particle['size'],
-                particle['x'] + particle['size'], particle['y'] + particle['size'],
-                fill=particle_color, outline="",
-                tags="particles"
+                particle['x'] + particle['size'], particle['y'] + particle['size']
             )
-    
-    def ultra_smooth_ease_v2(self, t):
-        """Enhanced ultra-smooth easing function"""
-        t = max(0, min(1, t))
-        # Combination of multiple easing functions for ultimate smoothness
-        ease1 = t * t * t * (t * (t * 6 - 15) + 10)
-        ease2 = 1 - pow(1 - t, 4)
-        ease3 = t * t * (3 - 2 * t)
-        return (ease1 * 0.5 + ease2 * 0.3 + ease3 * 0.2)
-    
-    def hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+            if self._particle_colors.get(item) != particle_color:
+                self.canvas.itemconfigure(item, fill=particle_color)
+                self._particle_colors[item] = particle_color
     
     def animate_banner(self):
         """Animate the gradient banner with enhanced features"""
         if not self.winfo_exists() or not self.animation_active:
-            return
+            return False
         
         # Update animation offset
         self.animation_offset += self.animation_speed
         
         # Regenerate wave points occasionally for variety
         if self.animation_offset % 600 == 0:  # Increased from 400
-            self.generate_wave_start_points()
+            self.engine.generate_wave_start_points()
         
         # Add some particles occasionally
         if self.animation_offset % 300 == 0 and len(self.particle_effects) < 12:  # Reduced from 200 and 20
@@ -368,6 +506,3 @@ class AnimatedBanner(ctk.CTkFrame):
         # Update greeting periodically
         if self.animation_offset % 2400 == 0:  # Increased from 1800
             self.update_greeting()
-        
-        # Smooth 60 FPS animation
-        self.after(20, self.animate_banner)  # Increased from 16ms to 20ms for better performance
\ No newline at end of file
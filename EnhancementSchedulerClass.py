@@ -0,0 +1,159 @@
+import heapq
+import itertools
+import threading
+from RateLimiterClass import TokenBucket
+
+
+class EnhancementScheduler:
+    def __init__(self, worker, rate=3.0, burst=3, max_workers=2, name="enhance"):
+        """Run per-song jobs in order of distance from the visible viewport.
+
+        Args:
+            worker: Callable invoked with the payload of each job (on a worker thread)
+            rate: Jobs started per second (token-bucket refill rate)
+            burst: Number of jobs that may start back to back
+            max_workers: Number of worker threads
+            name: Prefix used for worker thread names
+        """
+        self.worker = worker
+        self.bucket = TokenBucket(rate, burst)
+        self.name = name
+
+        # key -> (index, payload)
+        self._pending = {}
+        # key -> (index, payload) of jobs taken by a worker that waits for a token
+        self._claimed = {}
+        # key -> priority the key was last pushed with (detects stale heap entries)
+        self._priorities = {}
+        self._heap = []
+        self._counter = itertools.count()
+        self._viewport = (0, 0)
+
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads = []
+        for i in range(max_workers):
+            thread = threading.Thread(target=self._run, name=f"{name}_{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _priority(self, index):
+        """Distance of a row index from the visible range (0 = on screen)"""
+        first, last = self._viewport
+        if index < first:
+            return first - index
+        if index > last:
+            return index - last
+        return 0
+
+    def _push(self, key, index):
+        """Push a heap entry for key (condition lock must be held)"""
+        priority = self._priority(index)
+        self._priorities[key] = priority
+        heapq.heappush(self._heap, (priority, next(self._counter), key))
+
+    def submit(self, key, index, payload):
+        """Queue a job, replacing any pending job with the same key"""
+        if self._stop_event.is_set():
+            return
+        with self._condition:
+            self._claimed.pop(key, None)
+            self._pending[key] = (index, payload)
+            self._push(key, index)
+            self._condition.notify()
+
+    def update_index(self, key, index):
+        """Move a pending job to a new row index"""
+        with self._condition:
+            if key in self._claimed:
+                _, payload = self._claimed[key]
+                self._claimed[key] = (index, payload)
+            elif key in self._pending:
+                _, payload = self._pending[key]
+                self._pending[key] = (index, payload)
+                self._push(key, index)
+
+    def discard(self, key):
+        """Drop a pending job (e.g. its row was removed)"""
+        with self._condition:
+            self._pending.pop(key, None)
+            self._claimed.pop(key, None)
+            self._priorities.pop(key, None)
+
+    def set_viewport(self, first, last):
+        """Re-rank all pending jobs against a new visible row range"""
+        with self._condition:
+            if (first, last) == self._viewport:
+                return
+            self._viewport = (first, last)
+            self._heap = []
+            self._priorities = {}
+            for key, (index, _) in self._pending.items():
+                self._push(key, index)
+            self._condition.notify_all()
+
+    def pending_count(self):
+        with self._condition:
+            return len(self._pending) + len(self._claimed)
+
+    def _pop_best(self):
+        """Pop the closest-to-viewport job, skipping stale heap entries (lock held).
+
+        Returns:
+            tuple: (key, index, payload), or None if no job is pending
+        """
+        while self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            if key not in self._pending or self._priorities.get(key) != priority:
+                continue
+            index, payload = self._pending.pop(key)
+            self._priorities.pop(key, None)
+            return key, index, payload
+        return None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            # Claim a live job before waiting for a token, so stale heap entries
+            # and discarded jobs cost no rate budget
+            with self._condition:
+                job = self._pop_best()
+                while job is None and not self._stop_event.is_set():
+                    self._condition.wait(0.5)
+                    job = self._pop_best()
+                if job is None:
+                    return
+                key, index, payload = job
+                self._claimed[key] = (index, payload)
+
+            acquired = self.bucket.acquire(stop_event=self._stop_event)
+
+            with self._condition:
+                # Return the claim and take the best job now, so a viewport change,
+                # resubmit or discard during the wait still decides what runs
+                claimed = self._claimed.pop(key, None)
+                if claimed is not None:
+                    self._pending[key] = claimed
+                    self._push(key, claimed[0])
+                job = self._pop_best() if acquired else None
+            if not acquired:
+                return
+            if job is None:
+                # Everything was discarded during the wait; the token was not used
+                self.bucket.refund()
+                continue
+            payload = job[2]
+
+            try:
+                self.worker(payload)
+            except Exception as e:
+                print(f"[DEBUG] {self.name} job failed: {e}")
+
+    def stop(self):
+        """Stop the workers and drop all pending jobs"""
+        self._stop_event.set()
+        with self._condition:
+            self._pending.clear()
+            self._claimed.clear()
+            self._priorities.clear()
+            self._heap = []
+            self._condition.notify_all()
@@ -0,0 +1,161 @@
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import extraction_worker
+
+
+class ExtractionError(Exception):
+    """Raised when a worker could not extract info for a URL."""
+
+
+class ExtractionPool:
+    def __init__(self, workers=2, cache_ttl=1800, cache_size=256):
+        """yt-dlp extraction in separate worker processes with a result cache.
+
+        Args:
+            workers: Number of worker processes; 0 runs extractions in the calling thread
+            cache_ttl: Seconds a successful result stays cached (stream URLs expire)
+            cache_size: Maximum number of cached results
+        """
+        self.workers = workers
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'in_process': 0, 'errors': 0}
+
+        if self.workers > 0:
+            # Start the workers in the background so app startup is not delayed
+            threading.Thread(target=self._warm_workers, daemon=True).start()
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None and self.workers > 0:
+                # 'spawn' avoids forking a process that already runs a Tk event loop;
+                # workers re-import main.py as __mp_main__, which its __main__ guards keep UI-free
+                context = multiprocessing.get_context('spawn')
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+
+    def _warm_workers(self):
+        try:
+            executor = self._get_executor()
+            futures = [executor.submit(extraction_worker.warm_up) for _ in range(self.workers)]
+            pids = {future.result(timeout=60) for future in futures}
+            print(f"[DEBUG] Extraction workers ready: {sorted(pids)}")
+        except Exception as e:
+            print(f"[DEBUG] Extraction worker warm-up failed, falling back to in-process: {e}")
+            self._disable_workers()
+
+    def _disable_workers(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            self.workers = 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _cache_key(self, url, opts):
+        return url + "|" + json.dumps(opts, sort_keys=True, default=str)
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, info = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return info
+
+    def _cache_put(self, key, info):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), info)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def extract(self, url, opts, cookie_browsers=None, use_cache=True, timeout=90):
+        """Extract info for url with the given yt-dlp options.
+
+        Blocks the calling thread (never call from the Tk thread) but not the
+        interpreter: the CPU-heavy work runs in a worker process.
+
+        Returns:
+            dict: Slimmed info dict (see INFO_FIELDS), or None if yt-dlp returned nothing
+
+        Raises:
+            ExtractionError: If extraction failed
+        """
+        self.stats['requests'] += 1
+        key = self._cache_key(url, opts)
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                return cached
+
+        request = {'url': url, 'opts': opts, 'cookie_browsers': cookie_browsers}
+        response = None
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                response = executor.submit(extraction_worker.extract, request).result(timeout=timeout)
+            except BrokenProcessPool as e:
+                print(f"[DEBUG] Extraction pool broke, falling back to in-process: {e}")
+                self._disable_workers()
+        if response is None:
+            self.stats['in_process'] += 1
+            response = extraction_worker.extract(request)
+
+        if not response.get('ok'):
+            self.stats['errors'] += 1
+            raise ExtractionError(response.get('error', 'Unknown extraction error'))
+
+        info = response.get('info')
+        if info is not None and use_cache:
+            self._cache_put(key, info)
+        return info
+
+    def describe(self):
+        """One-line debug readout"""
+        with self._cache_lock:
+            cached = len(self._cache)
+        return (f"workers={self.workers} cached={cached} requests={self.stats['requests']} "
+                f"cache_hits={self.stats['cache_hits']} in_process={self.stats['in_process']} "
+                f"errors={self.stats['errors']}")
+
+    def shutdown(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool():
+    """Return the shared extraction pool.
+
+    HANYAMUSIC_EXTRACTION_PROCESSES sets the number of worker processes
+    (default 2); 0 disables the pool and extracts in the calling thread.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                workers = int(os.environ.get('HANYAMUSIC_EXTRACTION_PROCESSES', '2'))
+            except ValueError:
+                workers = 2
+            _pool = ExtractionPool(workers=max(0, workers))
+        return _pool
@@ -1,15 +1,101 @@
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core import exceptions as google_exceptions
+import functools
 import hashlib
 import os
 import random
 import string
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from StallWatchdogClass import record_ui_thread_io
 
-class FirebaseManager:
-    def __init__(self):
-        """Initialize Firebase Admin SDK with the provided credentials."""
-        cred_path = os.path.join(os.path.dirname(__file__), 'hanyamusic-ac4ce-firebase-adminsdk-fbsvc-e2117ea06f.json')
+# Version of the song entry layout stored in playlists and liked songs.
+# 1: {'url'} only, 2: url plus the metadata the client already had when saving.
+SONG_SCHEMA_VERSION = 2
+
+# Fields copied from the client's song data into stored entries
+SONG_METADATA_FIELDS = ('title', 'uploader', 'duration', 'thumbnail_url')
+
+# Placeholder values the UI uses while metadata is still being fetched
+PLACEHOLDER_VALUES = ("", "Loading...", None)
+
+# User documents are keyed by the hashed username. Accounts registered before
+# that have auto-generated IDs and are found with an indexed equality query
+# until migrate_users.py (or a login) has moved them.
+LEGACY_USER_LOOKUP = True
+
+# Layout of a user's playlists. 1: every playlist (with its songs) inside one
+# 'playlists' array on the user's document. 2: one document per playlist under
+# playlists/<user>/lists, songs in its 'songs' subcollection keyed by videoId.
+PLAYLIST_SCHEMA_VERSION = 2
+
+# Layout of a user's liked songs. 1: a liked_urls array and a liked_meta map on
+# the user's liked_songs document, which passes Firestore's 1 MiB document limit
+# at about 10,000 songs. 2: one document per song under liked_songs/<user>/songs
+# keyed by videoId; the parent document keeps only liked_count.
+LIKED_SCHEMA_VERSION = 2
+
+# Firestore allows 500 writes per batch
+BATCH_LIMIT = 450
+
+# Read-only methods whose identical in-flight call_async() requests share one call
+COALESCED_METHODS = frozenset({
+    'is_username_available', 'verify_credentials', 'load_liked_set',
+    'get_user_liked_songs', 'get_user_liked_song_entries', 'get_liked_count',
+    'get_saved_songs_count', 'get_user_playlists', 'get_playlist_songs',
+})
+
+# HANYAMUSIC_ASSERT_IO=1 turns the "Firestore call on the Tk thread" warning into an AssertionError
+STRICT_IO_CHECK = os.environ.get('HANYAMUSIC_ASSERT_IO') == '1'
+
+# Thread running the Tk event loop (see mark_ui_thread); None disables the check
+_ui_thread = None
+
+
+def mark_ui_thread():
+    """Record the calling thread as the Tk thread for the Firestore-on-UI-thread check."""
+    global _ui_thread
+    _ui_thread = threading.current_thread()
+
+
+def _assert_off_ui_thread(name):
+    record_ui_thread_io('firestore', name)
+    if _ui_thread is None or threading.current_thread() is not _ui_thread:
+        return
+    message = f"Firestore call {name}() on the Tk thread; use call_async()"
+    if STRICT_IO_CHECK:
+        raise AssertionError(message)
+    print(f"[DEBUG] {message}\n" + "".join(traceback.format_stack(limit=8)[:-2]))
+
+
+def firestore_io(method):
+    """Mark a FirebaseManager method as doing network I/O (flagged when run on the Tk thread)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        _assert_off_ui_thread(method.__name__)
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class FirestoreBackend:
+    def __init__(self, cred_path: str = None):
+        """Live Firestore through the Firebase Admin SDK (the default FirebaseManager backend).
+        
+        A backend provides:
+            db: Client with the google-cloud-firestore surface FirebaseManager uses
+                (collection/document references, queries, batches, write_option)
+            run_transaction(function): Run function(transaction) in a transaction
+                and return its result
+        InMemoryFirestore (InMemoryFirestoreClass.py) is the offline stand-in.
+        
+        Args:
+            cred_path: Service account file (defaults to the one next to this module)
+        """
+        cred_path = cred_path or os.path.join(os.path.dirname(__file__), 'hanyamusic-ac4ce-firebase-adminsdk-fbsvc-e2117ea06f.json')
         cred = credentials.Certificate(cred_path)
         
         try:
@@ -18,8 +104,48 @@ class FirebaseManager:
             firebase_admin.initialize_app(cred)
             
         self.db = firestore.client()
+
+    def run_transaction(self, function):
+        """Run function(transaction) in a Firestore transaction (retried on contention)."""
+        return firestore.transactional(function)(self.db.transaction())
+
+
+class FirebaseManager:
+    def __init__(self, backend=None):
+        """Initialize Firebase Admin SDK with the provided credentials.
+        
+        Use get_firebase_manager() instead of constructing this directly: the
+        shared instance loads the certificate and builds the client only once.
+        
+        Args:
+            backend: Firestore backend (see FirestoreBackend); live Firestore by default
+        """
+        self.backend = backend or FirestoreBackend()
+        self.db = self.backend.db
+        
+        # Write journal for queued likes and playlist edits (see attach_journal)
+        self.journal = None
+        self._journal_lock = threading.Lock()
+        
+        # Liked video IDs per hashed username, loaded once per user and kept
+        # current by like_song/unlike_song
+        self._liked_sets = {}
+        self._liked_lock = threading.Lock()
+        # Last known liked_count per hashed username, for users whose set is not loaded
+        self._liked_counts = {}
+        
+        # (collection, hashed username) -> DocumentReference of the user's document
+        self._doc_refs = {}
+        self._doc_refs_lock = threading.Lock()
+        # Hashed usernames whose playlists use the per-playlist layout, and
+        # hashed username -> {playlist name: DocumentReference}
+        self._playlist_schema_ready = set()
+        self._playlist_index = {}
+        # Hashed usernames whose liked songs use the per-song layout
+        self._liked_schema_ready = set()
     
-    def _encrypt_data(self, data: str) -> str:
+    @staticmethod
+    def _encrypt_data(data: str) -> str:
         """Encrypt data using SHA-256 hashing.
         
         Args:
@@ -30,8 +156,9 @@ class FirebaseManager:
         """
         return hashlib.sha256(data.encode()).hexdigest()
     
-    def generate_recovery_code(self) -> str:
-        """Generate a random 6-digit alphanumeric code.
+    @staticmethod
+    def generate_recovery_code() -> str:
+        """Generate a random 6-digit alphanumeric code (needs no Firestore connection).
         
         Returns:
             str: 6-character alphanumeric code
@@ -39,8 +166,151 @@ class FirebaseManager:
         chars = string.ascii_letters + string.digits
         return ''.join(random.choices(chars, k=6))
     
+    def _song_url(self, video_id: str) -> str:
+        """Build the canonical YouTube URL stored for a song."""
+        return f"https://www.youtube.com/watch?v={video_id}"
+
+    def _video_id_from_url(self, url: str) -> str:
+        """Extract the video ID from a stored canonical song URL."""
+        if not url or 'v=' not in url:
+            return None
+        return url.split('v=', 1)[1].split('&', 1)[0]
+
+    def build_song_entry(self, song_data: dict) -> dict:
+        """Build the stored song entry from the song data the client already holds.
+        
+        Args:
+            song_data: Dictionary containing song information (videoId, title, uploader, etc.)
+            
+        Returns:
+            dict: Entry with url, videoId, known metadata and schema version
+        """
+        video_id = song_data.get('videoId')
+        entry = {
+            'url': self._song_url(video_id),
+            'videoId': video_id,
+            'schema_version': SONG_SCHEMA_VERSION,
+            'added_at': song_data.get('added_at') or datetime.utcnow().isoformat(),
+        }
+        for field in SONG_METADATA_FIELDS:
+            value = song_data.get(field)
+            if value not in PLACEHOLDER_VALUES:
+                entry[field] = value
+        if 'thumbnail_url' not in entry and video_id:
+            entry['thumbnail_url'] = f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
+        return entry
+
+    def is_song_entry_complete(self, entry: dict) -> bool:
+        """Check whether a stored entry carries enough metadata to display without YouTube.
+        
+        Args:
+            entry: Stored song entry
+            
+        Returns:
+            bool: True if title, uploader and duration are all stored
+        """
+        if not entry or entry.get('schema_version', 1) < SONG_SCHEMA_VERSION:
+            return False
+        return all(entry.get(field) not in PLACEHOLDER_VALUES for field in ('title', 'uploader', 'duration'))
+
+    def _user_ref(self, encrypted_username: str):
+        """Reference to the user document keyed by hashed username."""
+        return self.db.collection('users').document(encrypted_username)
+
+    def _find_legacy_user_doc(self, encrypted_username: str):
+        """Find a user document stored under an auto-generated ID.
+        
+        Args:
+            encrypted_username: Hashed username
+            
+        Returns:
+            DocumentSnapshot or None
+        """
+        if not LEGACY_USER_LOOKUP:
+            return None
+        # Single-field equality query: served by Firestore's automatic index
+        docs = self.db.collection('users').where('username', '==', encrypted_username).limit(1).stream()
+        for doc in docs:
+            if doc.id != encrypted_username:
+                return doc
+        return None
+
+    def _get_user_record(self, encrypted_username: str) -> dict:
+        """Load a user record with one document read (plus one indexed query for legacy accounts).
+        
+        Args:
+            encrypted_username: Hashed username
+            
+        Returns:
+            dict: Stored user data, or None if the user does not exist
+        """
+        snapshot = self._user_ref(encrypted_username).get()
+        if snapshot.exists:
+            return snapshot.to_dict()
+        
+        legacy_doc = self._find_legacy_user_doc(encrypted_username)
+        if legacy_doc is None:
+            return None
+        user_data = legacy_doc.to_dict()
+        self._migrate_user_doc(legacy_doc)
+        return user_data
+
+    def _migrate_user_doc(self, legacy_doc) -> bool:
+        """Move a legacy user document to its hashed-username document ID.
+        
+        Args:
+            legacy_doc: DocumentSnapshot stored under an auto-generated ID
+            
+        Returns:
+            bool: True if the document was moved or already had a keyed copy
+        """
+        user_data = legacy_doc.to_dict() or {}
+        encrypted_username = user_data.get('username')
+        if not encrypted_username:
+            return False
+        try:
+            self._user_ref(encrypted_username).create(user_data)
+        except google_exceptions.AlreadyExists:
+            # Keyed copy already exists (earlier migration); the legacy doc is redundant
+            pass
+        except Exception as e:
+            print(f"Error migrating user document {legacy_doc.id}: {str(e)}")
+            return False
+        legacy_doc.reference.delete()
+        return True
+
+    @firestore_io
+    def migrate_users(self, batch_size: int = 200) -> int:
+        """One-off migration of every legacy user document to a keyed document ID.
+        
+        Args:
+            batch_size: Documents read per page
+            
+        Returns:
+            int: Number of documents migrated
+        """
+        users_ref = self.db.collection('users')
+        migrated = 0
+        last_doc = None
+        while True:
+            query = users_ref.order_by('__name__').limit(batch_size)
+            if last_doc is not None:
+                query = query.start_after(last_doc)
+            docs = list(query.stream())
+            if not docs:
+                break
+            for doc in docs:
+                user_data = doc.to_dict() or {}
+                if user_data.get('username') and doc.id != user_data['username']:
+                    if self._migrate_user_doc(doc):
+                        migrated += 1
+            last_doc = docs[-1]
+        print(f"Migrated {migrated} user documents to hashed-username IDs")
+        return migrated
+
+    @firestore_io
     def is_username_available(self, username: str) -> bool:
-        """Check if a username is available by checking all documents in users collection.
+        """Check if a username is available with a direct document lookup.
         
         Args:
             username: Username to check
@@ -49,24 +319,18 @@ class FirebaseManager:
             bool: True if username is available, False otherwise
         """
         try:
-            users_ref = self.db.collection('users')
-            # Get all documents and check each username
-            docs = users_ref.stream()
-            
-            for doc in docs:
-                user_data = doc.to_dict()
-                stored_username = user_data.get('username', '')
-                # Compare with encrypted username
-                if stored_username == self._encrypt_data(username):
-                    return False
-            return True
+            encrypted_username = self._encrypt_data(username)
+            if self._user_ref(encrypted_username).get().exists:
+                return False
+            return self._find_legacy_user_doc(encrypted_username) is None
             
         except Exception as e:
             print(f"Error checking username availability: {str(e)}")
             return False
     
+    @firestore_io
     def register_user(self, username: str, password: str, recovery_code: str = None) -> tuple:
-        """Register a new user with auto-generated document ID.
+        """Register a new user in a document keyed by the hashed username.
         
         Args:
             username: User's username or email
@@ -86,7 +350,9 @@ class FirebaseManager:
         encrypted_recovery = self._encrypt_data(recovery_code)
         
         try:
-            # Store user data in Firestore with auto-generated document ID
+            if self._find_legacy_user_doc(encrypted_username) is not None:
+                return False, "Username already exists"
+            
             user_data = {
                 'username': encrypted_username,
                 'password': encrypted_password,
@@ -94,16 +360,20 @@ class FirebaseManager:
                 'created_at': firestore.SERVER_TIMESTAMP
             }
             
-            # Use add() to create document with auto-generated ID
-            doc_ref = self.db.collection('users').add(user_data)
+            # create() fails if the document exists, so two registrations of the
+            # same username cannot both succeed
+            self._user_ref(encrypted_username).create(user_data)
             return True, recovery_code
             
+        except google_exceptions.AlreadyExists:
+            return False, "Username already exists"
         except Exception as e:
             print(f"Error registering user: {str(e)}")
             return False, str(e)
     
+    @firestore_io
     def verify_credentials(self, username: str, password: str) -> bool:
-        """Verify user credentials by checking all documents.
+        """Verify user credentials with a direct document lookup.
         
         Args:
             username: Username or email
@@ -111,27 +381,122 @@ class FirebaseManager:
             
         Returns:
             bool: True if credentials are valid, False otherwise
+            
+        Raises:
+            Exception: If the lookup failed (e.g. Firestore unreachable), so
+                       callers can tell an outage from wrong credentials
         """
         encrypted_username = self._encrypt_data(username)
         encrypted_password = self._encrypt_data(password)
         
         try:
-            users_ref = self.db.collection('users')
-            docs = users_ref.stream()
-            
-            for doc in docs:
-                user_data = doc.to_dict()
-                if (user_data.get('username') == encrypted_username and 
-                    user_data.get('password') == encrypted_password):
-                    return True
-            return False
-            
+            user_data = self._get_user_record(encrypted_username)
         except Exception as e:
             print(f"Error verifying credentials: {str(e)}")
-            return False
+            raise
+        return user_data is not None and user_data.get('password') == encrypted_password
+
+    def _user_doc_ref(self, collection: str, encrypted_username: str):
+        """Reference to a user's document in liked_songs or playlists.
+        
+        New documents are keyed by hashed username so writes need no lookup.
+        Documents created before that have auto-generated IDs; they are found
+        once with an indexed query and the reference is cached for the session.
+        Both probes fetch no song data: the keyed document is read with a field
+        mask and the query returns document names only.
+        
+        Args:
+            collection: 'liked_songs' or 'playlists'
+            encrypted_username: Hashed username
+            
+        Returns:
+            DocumentReference
+        """
+        key = (collection, encrypted_username)
+        with self._doc_refs_lock:
+            ref = self._doc_refs.get(key)
+        if ref is not None:
+            return ref
+        
+        ref = self.db.collection(collection).document(encrypted_username)
+        if LEGACY_USER_LOOKUP and not ref.get(field_paths=['username']).exists:
+            # An empty projection would return every field; '__name__' returns none
+            query = self.db.collection(collection).where('username', '==', encrypted_username)
+            for doc in query.select(['__name__']).limit(1).stream():
+                ref = doc.reference
+        self.remember_user_doc(collection, encrypted_username, ref)
+        return ref
+
+    def remember_user_doc(self, collection: str, encrypted_username: str, ref):
+        """Cache the document reference for a user (e.g. one seen by a snapshot listener)."""
+        with self._doc_refs_lock:
+            self._doc_refs[(collection, encrypted_username)] = ref
+
+    def _liked_songs_ref(self, encrypted_username: str):
+        """Collection holding one document per liked song for a user."""
+        return self._user_doc_ref('liked_songs', encrypted_username).collection('songs')
+
+    @firestore_io
+    def ensure_liked_schema(self, encrypted_username: str):
+        """Move a user's liked songs from the single-document layout to per-song documents.
+        
+        Runs once per user per session (one document read when already migrated).
+        
+        Args:
+            encrypted_username: Hashed username
+            
+        Raises:
+            Exception: If the migration failed; liked songs must not be read or
+                       written in the new layout before it has completed
+        """
+        with self._doc_refs_lock:
+            if encrypted_username in self._liked_schema_ready:
+                return
+        
+        liked_ref = self._user_doc_ref('liked_songs', encrypted_username)
+        snapshot = liked_ref.get()
+        user_data = snapshot.to_dict() if snapshot.exists else {}
+        if snapshot.exists and user_data.get('liked_schema', 1) < LIKED_SCHEMA_VERSION:
+            self._migrate_liked_songs(liked_ref, encrypted_username, user_data)
+        
+        with self._doc_refs_lock:
+            self._liked_schema_ready.add(encrypted_username)
+
+    def _migrate_liked_songs(self, liked_ref, encrypted_username: str, user_data: dict):
+        """Write legacy liked songs as per-song documents, then drop the array and map.
+        
+        Song documents are keyed by videoId, so an interrupted or concurrent
+        migration rewrites the same documents instead of duplicating them.
+        """
+        liked_meta = user_data.get('liked_meta', {})
+        songs = {}
+        for url in user_data.get('liked_urls', []):
+            video_id = self._video_id_from_url(url)
+            if video_id and video_id not in songs:
+                entry = liked_meta.get(video_id) or {'url': url, 'videoId': video_id}
+                songs[video_id] = dict(entry, position=len(songs))
+        
+        songs_ref = liked_ref.collection('songs')
+        writes = list(songs.items())
+        for start in range(0, len(writes), BATCH_LIMIT):
+            batch = self.db.batch()
+            for video_id, song in writes[start:start + BATCH_LIMIT]:
+                batch.set(songs_ref.document(video_id), song)
+            batch.commit()
+        
+        liked_ref.set({
+            'username': encrypted_username,
+            'liked_schema': LIKED_SCHEMA_VERSION,
+            'liked_count': len(songs),
+            'liked_urls': firestore.DELETE_FIELD,
+            'liked_meta': firestore.DELETE_FIELD
+        }, merge=True)
+        if songs:
+            print(f"Migrated {len(songs)} liked songs to per-song documents")
 
+    @firestore_io
     def like_song(self, username: str, song_data: dict) -> bool:
-        """Add a song to user's liked songs.
+        """Add a song to user's liked songs (one write that also updates liked_count).
         
         Args:
             username: Username of the user
@@ -148,43 +513,9 @@ class FirebaseManager:
                 print("No video ID found in song data")
                 return False
             
-            # Check if user already has a liked songs document
-            liked_songs_ref = self.db.collection('liked_songs')
-            user_docs = liked_songs_ref.where('username', '==', encrypted_username).stream()
-            
-            song_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            # If user has existing liked songs document
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                liked_urls = user_data.get('liked_urls', [])
-                
-                # Check if song is already liked
-                if song_url in liked_urls:
-                    print(f"Song '{song_data.get('title')}' is already liked by user {username}")
-                    return True
-                
-                # Add new song URL to the list
-                liked_urls.append(song_url)
-                
-                # Update the document
-                doc.reference.update({
-                    'liked_urls': liked_urls,
-                    'updated_at': firestore.SERVER_TIMESTAMP
-                })
-                
-                print(f"Song '{song_data.get('title')}' added to liked songs for user {username}")
-                return True
-            
-            # If no existing document, create new one
-            new_user_data = {
-                'username': encrypted_username,
-                'liked_urls': [song_url],
-                'created_at': firestore.SERVER_TIMESTAMP,
-                'updated_at': firestore.SERVER_TIMESTAMP
-            }
+            self._write_like_changes(encrypted_username, [self.build_song_entry(song_data)], [])
+            self._set_cached_liked(encrypted_username, video_id, True)
             
-            liked_songs_ref.add(new_user_data)
             print(f"Song '{song_data.get('title')}' added to liked songs for user {username}")
             return True
             
@@ -192,8 +523,9 @@ class FirebaseManager:
             print(f"Error liking song: {str(e)}")
             return False
 
+    @firestore_io
     def unlike_song(self, username: str, video_id: str) -> bool:
-        """Remove a song from user's liked songs.
+        """Remove a song from user's liked songs (one write that also updates liked_count).
         
         Args:
             username: Username of the user
@@ -204,44 +536,224 @@ class FirebaseManager:
         """
         try:
             encrypted_username = self._encrypt_data(username)
-            song_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            # Find user's liked songs document
-            liked_songs_ref = self.db.collection('liked_songs')
-            user_docs = liked_songs_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                liked_urls = user_data.get('liked_urls', [])
-                
-                # Remove the song URL from the list
-                if song_url in liked_urls:
-                    liked_urls.remove(song_url)
-                    
-                    # If no more liked songs, delete the entire document
-                    if not liked_urls:
-                        doc.reference.delete()
-                        print(f"Removed last liked song for user {username}, deleted user collection")
-                    else:
-                        # Update the document with remaining URLs
-                        doc.reference.update({
-                            'liked_urls': liked_urls,
-                            'updated_at': firestore.SERVER_TIMESTAMP
-                        })
-                        print(f"Song with videoId '{video_id}' removed from liked songs for user {username}")
-                    
-                    return True
-                
-                print(f"Song with videoId '{video_id}' not found in liked songs for user {username}")
-                return False
-            
-            print(f"No liked songs document found for user {username}")
-            return False
+            self._write_like_changes(encrypted_username, [], [video_id])
+            self._set_cached_liked(encrypted_username, video_id, False)
+            print(f"Song with videoId '{video_id}' removed from liked songs for user {username}")
+            return True
             
         except Exception as e:
             print(f"Error unliking song: {str(e)}")
             return False
 
+    def attach_journal(self, journal):
+        """Use a WriteJournal for queued (offline-first) likes and playlist edits."""
+        self.journal = journal
+
+    def _get_journal(self):
+        """The attached write journal, starting one if needed.
+        
+        The shared manager uses the app's shared (file-backed) journal. Any
+        other manager, e.g. one over the in-memory backend, gets its own
+        memory-only journal so it never touches the app's journal file.
+        """
+        with self._journal_lock:
+            if self.journal is None:
+                # Imported here: WriteJournalClass imports this module
+                from WriteJournalClass import WriteJournal, get_write_journal
+                shared = _manager_future
+                if shared is not None and shared.done() and shared.exception() is None and shared.result() is self:
+                    get_write_journal()
+                else:
+                    self.attach_journal(WriteJournal(self, persistent=False))
+            return self.journal
+
+    @firestore_io
+    def apply_like_changes(self, username: str, liked_songs: list, unliked_ids: list):
+        """Apply many likes and unlikes in one batched write (no reads).
+        
+        Args:
+            username: Username of the user
+            liked_songs: Song data or stored entries to add to liked songs
+            unliked_ids: Video IDs to remove from liked songs
+            
+        Raises:
+            Exception: If the batch could not be committed (the caller retries)
+        """
+        entries = [self.build_song_entry(song) for song in liked_songs]
+        self._write_like_changes(self._encrypt_data(username), entries, unliked_ids)
+
+    def _write_like_changes(self, encrypted_username: str, entries: list, unliked_ids: list) -> int:
+        """Apply likes and unlikes with blind writes and keep liked_count in step.
+        
+        A like creates the song's document and an unlike deletes it with an
+        exists precondition, in one batch with an Increment of liked_count, so a
+        like is one write round trip and no read (after the once-per-session
+        ensure_liked_schema). A song already in the requested state, e.g. liked
+        on another device, fails its precondition and with it the batch; the
+        batch is then applied one song at a time, so only songs that changed
+        move the counter and retries are harmless. A re-like keeps the stored
+        metadata (backfill_song_metadata completes it).
+        
+        Each video is applied once: duplicates are dropped, and a song that is both
+        liked and unliked in one call ends up unliked.
+        
+        Args:
+            encrypted_username: Hashed username
+            entries: Song entries (build_song_entry) to like
+            unliked_ids: Video IDs to unlike
+            
+        Returns:
+            int: Number of songs whose like state changed
+        """
+        unliked_ids = list(dict.fromkeys(unliked_ids))
+        unliked = set(unliked_ids)
+        entries = list({entry['videoId']: entry for entry in entries if entry['videoId'] not in unliked}.values())
+        self.ensure_liked_schema(encrypted_username)
+        liked_ref = self._user_doc_ref('liked_songs', encrypted_username)
+        songs_ref = liked_ref.collection('songs')
+        
+        # Positions keep liked order without reading the collection
+        position = time.time_ns()
+        changes = [(entry['videoId'], dict(entry, position=entry.get('position') or position + i))
+                   for i, entry in enumerate(entries)]
+        changes += [(video_id, None) for video_id in unliked_ids]
+        
+        def commit(chunk):
+            batch = self.db.batch()
+            for video_id, song in chunk:
+                if song is None:
+                    batch.delete(songs_ref.document(video_id), option=self.db.write_option(exists=True))
+                else:
+                    batch.create(songs_ref.document(video_id), song)
+            delta = sum(-1 if song is None else 1 for _, song in chunk)
+            batch.set(liked_ref, {
+                'username': encrypted_username,
+                'liked_schema': LIKED_SCHEMA_VERSION,
+                'liked_count': firestore.Increment(delta),
+                'updated_at': firestore.SERVER_TIMESTAMP
+            }, merge=True)
+            batch.commit()
+            return delta
+        
+        applied = []
+        # The liked_count write makes BATCH_LIMIT + 1 writes per batch at most
+        for start in range(0, len(changes), BATCH_LIMIT):
+            chunk = changes[start:start + BATCH_LIMIT]
+            try:
+                commit(chunk)
+                applied.extend(chunk)
+                continue
+            except (google_exceptions.AlreadyExists, google_exceptions.NotFound):
+                if len(chunk) == 1:
+                    continue
+            for change in chunk:
+                try:
+                    commit([change])
+                    applied.append(change)
+                except (google_exceptions.AlreadyExists, google_exceptions.NotFound):
+                    # Already liked / not liked: nothing to change
+                    continue
+        
+        delta = sum(-1 if song is None else 1 for _, song in applied)
+        with self._liked_lock:
+            if encrypted_username in self._liked_counts:
+                self._liked_counts[encrypted_username] += delta
+        return len(applied)
+
+    def queue_like(self, username: str, song_data: dict, liked: bool) -> bool:
+        """Like or unlike a song locally at once and sync it through the write journal.
+        
+        Args:
+            username: Username of the user
+            song_data: Dictionary containing song information (videoId, title, ...)
+            liked: New like state
+            
+        Returns:
+            bool: The new like state
+        """
+        video_id = song_data.get('videoId')
+        self._set_cached_liked(self._encrypt_data(username), video_id, liked)
+        if liked:
+            self._get_journal().append('like', username, song=self.build_song_entry(song_data))
+        else:
+            self._get_journal().append('unlike', username, video_id=video_id)
+        return liked
+
+    def _set_cached_liked(self, encrypted_username: str, video_id: str, liked: bool):
+        """Apply a like/unlike to the in-memory liked set (if it has been loaded)."""
+        with self._liked_lock:
+            liked_set = self._liked_sets.get(encrypted_username)
+            if liked_set is None:
+                # A cached count would now be off by one; it is re-read on next use
+                self._liked_counts.pop(encrypted_username, None)
+                return
+            if liked:
+                liked_set.add(video_id)
+            else:
+                liked_set.discard(video_id)
+
+    def _store_liked_set(self, encrypted_username: str, video_ids):
+        """Replace the in-memory liked set from freshly read liked video IDs."""
+        video_ids = set(video_ids)
+        video_ids.discard(None)
+        # Changes still waiting in the write journal win over the server copy
+        if self.journal is not None:
+            for video_id, liked in self.journal.pending_like_overrides(encrypted_username).items():
+                if liked:
+                    video_ids.add(video_id)
+                else:
+                    video_ids.discard(video_id)
+        with self._liked_lock:
+            self._liked_sets[encrypted_username] = video_ids
+
+    def load_liked_set(self, username: str, refresh: bool = False) -> set:
+        """Load the user's liked video IDs into memory (one query, then cached).
+        
+        Args:
+            username: Username of the user
+            refresh: Re-read from Firestore even if already loaded
+            
+        Returns:
+            set: Copy of the liked video IDs
+        """
+        encrypted_username = self._encrypt_data(username)
+        with self._liked_lock:
+            liked_set = self._liked_sets.get(encrypted_username)
+            if liked_set is not None and not refresh:
+                return set(liked_set)
+        
+        # Only mark as loaded when the read succeeded, so a failed read is retried
+        self.get_user_liked_songs(username)
+        with self._liked_lock:
+            return set(self._liked_sets.get(encrypted_username, ()))
+
+    def is_liked_set_loaded(self, username: str) -> bool:
+        """Check whether liked_status can answer without network I/O."""
+        with self._liked_lock:
+            return self._encrypt_data(username) in self._liked_sets
+
+    def liked_status(self, username: str, video_ids: list, load: bool = True) -> dict:
+        """Look up the like state of many songs at once.
+        
+        Args:
+            username: Username of the user
+            video_ids: YouTube video IDs to check
+            load: Load the liked set if it is not in memory yet; with False,
+                  unknown state is reported as not liked and no I/O is done
+            
+        Returns:
+            dict: video_id -> bool
+        """
+        encrypted_username = self._encrypt_data(username)
+        with self._liked_lock:
+            liked_set = self._liked_sets.get(encrypted_username)
+            if liked_set is not None:
+                return {video_id: video_id in liked_set for video_id in video_ids}
+        if not load:
+            return {video_id: False for video_id in video_ids}
+        liked_set = self.load_liked_set(username)
+        return {video_id: video_id in liked_set for video_id in video_ids}
+
     def is_song_liked(self, username: str, video_id: str) -> bool:
         """Check if a song is liked by the user.
         
@@ -253,24 +765,13 @@ class FirebaseManager:
             bool: True if song is liked, False otherwise
         """
         try:
-            encrypted_username = self._encrypt_data(username)
-            song_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            # Query for user's liked songs
-            liked_songs_ref = self.db.collection('liked_songs')
-            user_docs = liked_songs_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                liked_urls = user_data.get('liked_urls', [])
-                return song_url in liked_urls
-            
-            return False
+            return self.liked_status(username, [video_id])[video_id]
             
         except Exception as e:
             print(f"Error checking if song is liked: {str(e)}")
             return False
 
+    @firestore_io
     def get_user_liked_songs(self, username: str) -> list:
         """Get all liked songs for a user.
         
@@ -282,21 +783,66 @@ class FirebaseManager:
         """
         try:
             encrypted_username = self._encrypt_data(username)
+            self.ensure_liked_schema(encrypted_username)
+            # Document IDs are the video IDs; '__name__' keeps the song data out of the response
+            query = self._liked_songs_ref(encrypted_username).order_by('position').select(['__name__'])
+            video_ids = [doc.id for doc in query.stream()]
+            self._store_liked_set(encrypted_username, video_ids)
+            return [self._song_url(video_id) for video_id in video_ids]
             
-            # Query for user's liked songs
-            liked_songs_ref = self.db.collection('liked_songs')
-            user_docs = liked_songs_ref.where('username', '==', encrypted_username).stream()
+        except Exception as e:
+            print(f"Error getting liked songs: {str(e)}")
+            return []
+
+    @firestore_io
+    def get_liked_songs_page(self, username: str, page_size: int = 100, start_after=None) -> tuple:
+        """Get one page of liked songs in liked order.
+        
+        Args:
+            username: Username of the user
+            page_size: Maximum number of songs to return
+            start_after: Cursor returned by the previous page, or None for the first page
             
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                return user_data.get('liked_urls', [])
+        Returns:
+            tuple: (songs: list, cursor) where cursor is None after the last page
+        """
+        encrypted_username = self._encrypt_data(username)
+        self.ensure_liked_schema(encrypted_username)
+        query = self._liked_songs_ref(encrypted_username).order_by('position').limit(page_size)
+        if start_after is not None:
+            query = query.start_after(start_after)
+        docs = list(query.stream())
+        cursor = docs[-1] if len(docs) == page_size else None
+        return [doc.to_dict() for doc in docs], cursor
+
+    @firestore_io
+    def get_user_liked_song_entries(self, username: str) -> list:
+        """Get all liked songs for a user with any stored metadata.
+        
+        Args:
+            username: Username of the user
             
-            return []
+        Returns:
+            list: Song entries in liked order; entries saved before metadata was
+                  stored only contain 'url' and 'videoId'
+        """
+        try:
+            entries = []
+            cursor = None
+            while True:
+                # Large pages: this reads the whole collection anyway
+                page, cursor = self.get_liked_songs_page(username, page_size=1000, start_after=cursor)
+                entries.extend(page)
+                if cursor is None:
+                    break
+            self._store_liked_set(self._encrypt_data(username), [entry.get('videoId') for entry in entries])
+            return entries
             
         except Exception as e:
-            print(f"Error getting liked songs: {str(e)}")
+            print(f"Error getting liked song entries: {str(e)}")
             return []
 
+    @firestore_io
     def toggle_song_like(self, username: str, song_data: dict) -> tuple:
         """Toggle like status of a song (like if not liked, unlike if liked).
         
@@ -334,6 +880,42 @@ class FirebaseManager:
             print(f"Error toggling song like: {str(e)}")
             return False, False, f"Error: {str(e)}"
 
+    def get_liked_count(self, username: str, load: bool = True):
+        """Number of liked songs, the one source for liked-count labels.
+        
+        Uses the in-memory liked set when loaded (it includes unsynced likes),
+        then the last known liked_count, then a field-mask read of the counter.
+        
+        Args:
+            username: Username of the user
+            load: Read from Firestore if nothing is cached (blocks; not on the Tk thread)
+            
+        Returns:
+            int: Liked songs count, or None if not cached and load is False (or the read failed)
+        """
+        encrypted_username = self._encrypt_data(username)
+        with self._liked_lock:
+            liked_set = self._liked_sets.get(encrypted_username)
+            if liked_set is not None:
+                return len(liked_set)
+            count = self._liked_counts.get(encrypted_username)
+        if count is not None or not load:
+            return count
+        
+        _assert_off_ui_thread('get_liked_count')
+        try:
+            snapshot = self._user_doc_ref('liked_songs', encrypted_username).get(field_paths=['liked_count'])
+            count = (snapshot.to_dict() or {}).get('liked_count') if snapshot.exists else 0
+            if count is None:
+                # Not counted yet: no write since the counter was introduced
+                return len(self.load_liked_set(username))
+        except Exception as e:
+            print(f"Error getting liked songs count: {str(e)}")
+            return None
+        with self._liked_lock:
+            self._liked_counts[encrypted_username] = count
+        return count
+
     def get_saved_songs_count(self, username: str) -> int:
         """Get the count of saved songs for a user.
         
@@ -343,80 +925,171 @@ class FirebaseManager:
         Returns:
             int: Number of saved songs (liked songs count)
         """
-        try:
-            encrypted_username = self._encrypt_data(username)
-            
-            # Query for user's liked songs
-            liked_songs_ref = self.db.collection('liked_songs')
-            user_docs = liked_songs_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                liked_urls = user_data.get('liked_urls', [])
-                return len(liked_urls)
-            
-            return 0
+        return self.get_liked_count(username) or 0
+
+    def _playlist_lists_ref(self, encrypted_username: str):
+        """Collection holding one document per playlist for a user."""
+        return self._user_doc_ref('playlists', encrypted_username).collection('lists')
+
+    def _playlist_doc_id(self, playlist: dict) -> str:
+        """Deterministic document ID for a legacy playlist, so migration is idempotent."""
+        key = f"{playlist.get('created_at', '')}|{playlist.get('name', '')}"
+        return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+    @firestore_io
+    def ensure_playlist_schema(self, encrypted_username: str) -> list:
+        """Move a user's playlists from the single-array layout to per-playlist documents.
+        
+        Runs once per user per session (one document read when already migrated).
+        
+        Args:
+            encrypted_username: Hashed username
             
-        except Exception as e:
-            print(f"Error getting saved songs count: {str(e)}")
-            return 0
+        Returns:
+            list: The legacy playlists array if the user still has the old layout
+                  (migration failed), so readers can fall back to it; otherwise None
+        """
+        with self._doc_refs_lock:
+            if encrypted_username in self._playlist_schema_ready:
+                return None
+        
+        user_ref = self._user_doc_ref('playlists', encrypted_username)
+        snapshot = user_ref.get()
+        user_data = snapshot.to_dict() if snapshot.exists else {}
+        if user_data.get('playlists_schema', 1) < PLAYLIST_SCHEMA_VERSION:
+            legacy_playlists = user_data.get('playlists', [])
+            try:
+                self._migrate_playlists(user_ref, encrypted_username, legacy_playlists)
+            except Exception as e:
+                print(f"Error migrating playlists: {str(e)}")
+                return legacy_playlists
+        
+        with self._doc_refs_lock:
+            self._playlist_schema_ready.add(encrypted_username)
+        return None
+
+    def _migrate_playlists(self, user_ref, encrypted_username: str, legacy_playlists: list):
+        """Write legacy playlists as per-playlist documents, then drop the array.
+        
+        Document IDs are derived from the legacy data, so an interrupted or
+        concurrent migration rewrites the same documents instead of duplicating them.
+        """
+        lists_ref = user_ref.collection('lists')
+        writes = []
+        for playlist in legacy_playlists:
+            list_ref = lists_ref.document(self._playlist_doc_id(playlist))
+            songs = {}
+            for song in playlist.get('songs', []):
+                video_id = song.get('videoId') or self._video_id_from_url(song.get('url'))
+                if video_id and video_id not in songs:
+                    songs[video_id] = dict(song, videoId=video_id, position=len(songs))
+            writes.append((list_ref, {
+                'name': playlist.get('name'),
+                'created_at': playlist.get('created_at') or datetime.utcnow().isoformat(),
+                'song_count': len(songs),
+                'updated_at': firestore.SERVER_TIMESTAMP
+            }))
+            for video_id, song in songs.items():
+                writes.append((list_ref.collection('songs').document(video_id), song))
+        
+        for start in range(0, len(writes), BATCH_LIMIT):
+            batch = self.db.batch()
+            for ref, data in writes[start:start + BATCH_LIMIT]:
+                batch.set(ref, data)
+            batch.commit()
         
+        user_ref.set({
+            'username': encrypted_username,
+            'playlists_schema': PLAYLIST_SCHEMA_VERSION,
+            'playlists': firestore.DELETE_FIELD
+        }, merge=True)
+        if legacy_playlists:
+            print(f"Migrated {len(legacy_playlists)} playlists to per-playlist documents")
+
+    def _cache_playlist_index(self, encrypted_username: str, docs):
+        """Remember name -> document reference for a user's playlists."""
+        with self._doc_refs_lock:
+            self._playlist_index[encrypted_username] = {doc.get('name'): doc.reference for doc in docs}
+
+    def remember_playlist_docs(self, encrypted_username: str, docs):
+        """Cache playlist references seen elsewhere (e.g. by a snapshot listener)."""
+        self._cache_playlist_index(encrypted_username, docs)
+
+    def _playlist_ref(self, encrypted_username: str, playlist_name: str):
+        """Document reference of a playlist by name, or None if it does not exist."""
+        with self._doc_refs_lock:
+            index = self._playlist_index.get(encrypted_username)
+            if index is not None and playlist_name in index:
+                return index[playlist_name]
+        
+        self.ensure_playlist_schema(encrypted_username)
+        docs = list(self._playlist_lists_ref(encrypted_username).where('name', '==', playlist_name).limit(1).stream())
+        if not docs:
+            return None
+        with self._doc_refs_lock:
+            self._playlist_index.setdefault(encrypted_username, {})[playlist_name] = docs[0].reference
+        return docs[0].reference
+
+    def playlist_from_doc(self, doc) -> dict:
+        """Playlist summary from a playlist document (songs are loaded separately).
+        
+        Args:
+            doc: DocumentSnapshot from the lists subcollection
+            
+        Returns:
+            dict: id, name, created_at, song_count and an empty songs list
+        """
+        data = doc.to_dict() or {}
+        return {
+            'id': doc.id,
+            'name': data.get('name'),
+            'created_at': data.get('created_at'),
+            'song_count': data.get('song_count', 0),
+            'songs': []
+        }
+
     #  Create a new playlist for the user
+    @firestore_io
     def create_playlist(self, username: str, playlist_name: str) -> bool:
-        """Create a new playlist for the user, or add to existing user's playlists array."""
+        """Create a new playlist document for the user."""
         try:
             encrypted_username = self._encrypt_data(username)
-            playlists_ref = self.db.collection('playlists')
+            self.ensure_playlist_schema(encrypted_username)
 
-            # Query for existing document for this user
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            user_doc = None
-            for doc in user_docs:
-                user_doc = doc
-                break
-
-            # Use client-side timestamp for created_at
-            new_playlist = {
+            list_ref = self._playlist_lists_ref(encrypted_username).document()
+            list_ref.set({
                 'name': playlist_name,
                 'created_at': datetime.utcnow().isoformat(),  # Use ISO string for compatibility
-                'songs': []
-            }
-
-            if user_doc:
-                # Update existing document: append to playlists array
-                doc_ref = user_doc.reference
-                doc_ref.update({
-                    'playlists': firestore.ArrayUnion([new_playlist])
-                })
-                print(f"Added playlist '{playlist_name}' to existing user {username}")
-            else:
-                # Create new document for this user
-                playlist_data = {
-                    'username': encrypted_username,
-                    'playlists': [new_playlist]
-                }
-                playlists_ref.add(playlist_data)
-                print(f"Created new playlist document for user {username} with playlist '{playlist_name}'")
+                'song_count': 0,
+                'updated_at': firestore.SERVER_TIMESTAMP
+            })
+            with self._doc_refs_lock:
+                self._playlist_index.setdefault(encrypted_username, {})[playlist_name] = list_ref
+            print(f"Added playlist '{playlist_name}' for user {username}")
             return True
 
         except Exception as e:
             print(f"Error creating playlist: {str(e)}")
             return False
 
+    @firestore_io
     def get_user_playlists(self, username: str) -> list:
-        """Get all playlists for a user as a list of playlist dicts."""
+        """Get playlist summaries for a user (name, created_at, song_count; songs not loaded)."""
         try:
             encrypted_username = self._encrypt_data(username)
-            playlists_ref = self.db.collection('playlists')
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                return user_data.get('playlists', [])
-            return []
+            legacy_playlists = self.ensure_playlist_schema(encrypted_username)
+            if legacy_playlists is not None:
+                # Not migrated yet: read the old layout
+                return [dict(p, song_count=len(p.get('songs', []))) for p in legacy_playlists]
+            
+            docs = list(self._playlist_lists_ref(encrypted_username).order_by('created_at').stream())
+            self._cache_playlist_index(encrypted_username, docs)
+            return [self.playlist_from_doc(doc) for doc in docs]
         except Exception as e:
             print(f"Error getting user playlists: {str(e)}")
             return []
             
+    @firestore_io
     def update_playlist_name(self, username: str, old_name: str, new_name: str) -> bool:
         """Update the name of a playlist for a user.
         
@@ -430,38 +1103,26 @@ class FirebaseManager:
         """
         try:
             encrypted_username = self._encrypt_data(username)
-            playlists_ref = self.db.collection('playlists')
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                playlists = user_data.get('playlists', [])
-                
-                # Find the playlist with the old name
-                for i, playlist in enumerate(playlists):
-                    if playlist.get('name') == old_name:
-                        # Update the playlist name
-                        playlists[i]['name'] = new_name
-                        
-                        # Update the document
-                        doc.reference.update({
-                            'playlists': playlists,
-                        })
-                        print(f"Updated playlist name from '{old_name}' to '{new_name}' for user {username}")
-                        return True
-                
+            list_ref = self._playlist_ref(encrypted_username, old_name)
+            if list_ref is None:
                 print(f"Playlist '{old_name}' not found for user {username}")
                 return False
             
-            print(f"No playlists document found for user {username}")
-            return False
+            list_ref.update({'name': new_name, 'updated_at': firestore.SERVER_TIMESTAMP})
+            with self._doc_refs_lock:
+                index = self._playlist_index.setdefault(encrypted_username, {})
+                index.pop(old_name, None)
+                index[new_name] = list_ref
+            print(f"Updated playlist name from '{old_name}' to '{new_name}' for user {username}")
+            return True
             
         except Exception as e:
             print(f"Error updating playlist name: {str(e)}")
             return False
             
+    @firestore_io
     def delete_playlist(self, username: str, playlist_name: str) -> bool:
-        """Delete a playlist for a user.
+        """Delete a playlist and its songs for a user.
         
         Args:
             username: Username of the user
@@ -472,42 +1133,87 @@ class FirebaseManager:
         """
         try:
             encrypted_username = self._encrypt_data(username)
-            playlists_ref = self.db.collection('playlists')
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                playlists = user_data.get('playlists', [])
-                
-                # Find and remove the playlist
-                for i, playlist in enumerate(playlists):
-                    if playlist.get('name') == playlist_name:
-                        # Remove the playlist
-                        playlists.pop(i)
-                        
-                        # If no more playlists, delete the entire document
-                        if not playlists:
-                            doc.reference.delete()
-                            print(f"Removed last playlist for user {username}, deleted user collection")
-                        else:
-                            # Update the document with remaining playlists
-                            doc.reference.update({
-                                'playlists': playlists,
-                            })
-                            print(f"Playlist '{playlist_name}' deleted for user {username}")
-                        
-                        return True
-                
+            list_ref = self._playlist_ref(encrypted_username, playlist_name)
+            if list_ref is None:
                 print(f"Playlist '{playlist_name}' not found for user {username}")
                 return False
             
-            print(f"No playlists document found for user {username}")
-            return False
+            # Firestore does not delete subcollections with their parent
+            while True:
+                song_docs = list(list_ref.collection('songs').select(['__name__']).limit(BATCH_LIMIT).stream())
+                if not song_docs:
+                    break
+                batch = self.db.batch()
+                for doc in song_docs:
+                    batch.delete(doc.reference)
+                batch.commit()
+            list_ref.delete()
+            
+            with self._doc_refs_lock:
+                self._playlist_index.get(encrypted_username, {}).pop(playlist_name, None)
+            print(f"Playlist '{playlist_name}' deleted for user {username}")
+            return True
             
         except Exception as e:
             print(f"Error deleting playlist: {str(e)}")
             return False
 
+    @firestore_io
+    def apply_playlist_add(self, username: str, playlist_name: str, song_data: dict):
+        """Write a song into a playlist: one batch with the song document and the counter increment.
+        
+        Args:
+            username: Username of the user
+            playlist_name: Name of the playlist
+            song_data: Song data or stored entry (must contain videoId)
+            
+        Raises:
+            google.api_core.exceptions.AlreadyExists: The song is already in the playlist
+            google.api_core.exceptions.NotFound: The playlist does not exist
+        """
+        encrypted_username = self._encrypt_data(username)
+        list_ref = self._playlist_ref(encrypted_username, playlist_name)
+        if list_ref is None:
+            raise google_exceptions.NotFound(f"Playlist '{playlist_name}' not found")
+        
+        # Create song object with the metadata the client already has;
+        # position keeps insertion order without reading the playlist
+        song_object = self.build_song_entry(song_data)
+        song_object['position'] = song_data.get('position') or time.time_ns()
+        
+        # create() rejects duplicates (the song document is keyed by videoId),
+        # which also keeps the counter from being incremented twice on a retry
+        batch = self.db.batch()
+        batch.create(list_ref.collection('songs').document(song_object['videoId']), song_object)
+        batch.update(list_ref, {
+            'song_count': firestore.Increment(1),
+            'updated_at': firestore.SERVER_TIMESTAMP
+        })
+        batch.commit()
+
+    @firestore_io
+    def apply_playlist_remove(self, username: str, playlist_name: str, video_id: str):
+        """Delete a song from a playlist: one batch with the delete and the counter decrement.
+        
+        Raises:
+            google.api_core.exceptions.NotFound: The playlist or song does not exist
+        """
+        encrypted_username = self._encrypt_data(username)
+        list_ref = self._playlist_ref(encrypted_username, playlist_name)
+        if list_ref is None:
+            raise google_exceptions.NotFound(f"Playlist '{playlist_name}' not found")
+        
+        # The exists precondition fails the batch (and the count decrement)
+        # if the song is not in the playlist
+        batch = self.db.batch()
+        batch.delete(list_ref.collection('songs').document(video_id), option=self.db.write_option(exists=True))
+        batch.update(list_ref, {
+            'song_count': firestore.Increment(-1),
+            'updated_at': firestore.SERVER_TIMESTAMP
+        })
+        batch.commit()
+
+    @firestore_io
     def add_song_to_playlist(self, username: str, playlist_name: str, song_data: dict) -> tuple:
         """Add a song to a specific playlist for a user.
         
@@ -519,59 +1225,23 @@ class FirebaseManager:
         Returns:
             tuple: (success: bool, message: str)
         """
+        if not song_data.get('videoId'):
+            return False, "No video ID found in song data"
+        
         try:
-            encrypted_username = self._encrypt_data(username)
-            video_id = song_data.get('videoId')
-            
-            if not video_id:
-                return False, "No video ID found in song data"
-            
-            # Create song URL
-            song_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            # Create song object with metadata
-            song_object = {
-                'url': song_url,
-            }
-            
-            playlists_ref = self.db.collection('playlists')
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                playlists = user_data.get('playlists', [])
-                
-                # Find the playlist with the specified name
-                for i, playlist in enumerate(playlists):
-                    if playlist.get('name') == playlist_name:
-                        # Check if song is already in the playlist
-                        songs = playlist.get('songs', [])
-                        for song in songs:
-                            if song.get('videoId') == video_id:
-                                return False, f"Song '{song_data.get('title')}' is already in playlist '{playlist_name}'"
-                        
-                        # Add the song to the playlist
-                        songs.append(song_object)
-                        playlists[i]['songs'] = songs
-                        
-                        # Update the document
-                        doc.reference.update({
-                            'playlists': playlists,
-                        })
-                        
-                        print(f"Added song '{song_data.get('title')}' to playlist '{playlist_name}' for user {username}")
-                        return True, f"Added '{song_data.get('title')}' to playlist '{playlist_name}'"
-                
-                # If we get here, playlist was not found
-                return False, f"Playlist '{playlist_name}' not found"
-            
-            # If we get here, no playlists document was found
-            return False, f"No playlists found for user {username}"
-            
+            self.apply_playlist_add(username, playlist_name, song_data)
+            print(f"Added song '{song_data.get('title')}' to playlist '{playlist_name}' for user {username}")
+            return True, f"Added '{song_data.get('title')}' to playlist '{playlist_name}'"
+            
+        except google_exceptions.AlreadyExists:
+            return False, f"Song '{song_data.get('title')}' is already in playlist '{playlist_name}'"
+        except google_exceptions.NotFound:
+            return False, f"Playlist '{playlist_name}' not found"
         except Exception as e:
             print(f"Error adding song to playlist: {str(e)}")
             return False, f"Error: {str(e)}"
 
+    @firestore_io
     def remove_song_from_playlist(self, username: str, playlist_name: str, video_id: str) -> tuple:
         """Remove a song from a specific playlist for a user.
         
@@ -584,52 +1254,63 @@ class FirebaseManager:
             tuple: (success: bool, message: str)
         """
         try:
-            encrypted_username = self._encrypt_data(username)
-            # Convert video_id to URL format for matching (this is what's stored in Firebase)
-            song_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            playlists_ref = self.db.collection('playlists')
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                playlists = user_data.get('playlists', [])
-                
-                # Find the playlist with the specified name
-                for i, playlist in enumerate(playlists):
-                    if playlist.get('name') == playlist_name:
-                        songs = playlist.get('songs', [])
-                        
-                        # Find and remove the song by matching URL
-                        for j, song in enumerate(songs):
-                            # Check if the song URL matches
-                            if song.get('url') == song_url:
-                                removed_song = songs.pop(j)
-                                playlists[i]['songs'] = songs
-                                
-                                # Update the document
-                                doc.reference.update({
-                                    'playlists': playlists,
-                                })
-                                
-                                song_title = removed_song.get('title', f"Song with ID {video_id}")
-                                print(f"Removed '{song_title}' from playlist '{playlist_name}' for user {username}")
-                                return True, f"Removed '{song_title}' from playlist '{playlist_name}'"
-                        
-                        # If we get here, song was not found in playlist
-                        print(f"Song URL '{song_url}' not found in playlist '{playlist_name}'")
-                        return False, f"Song not found in playlist '{playlist_name}'"
-                
-                # If we get here, playlist was not found
-                return False, f"Playlist '{playlist_name}' not found"
-            
-            # If we get here, no playlists document was found
-            return False, f"No playlists found for user {username}"
+            self.apply_playlist_remove(username, playlist_name, video_id)
+            print(f"Removed song {video_id} from playlist '{playlist_name}' for user {username}")
+            return True, f"Removed song from playlist '{playlist_name}'"
             
+        except google_exceptions.NotFound:
+            print(f"Song '{video_id}' not found in playlist '{playlist_name}'")
+            return False, f"Song not found in playlist '{playlist_name}'"
         except Exception as e:
             print(f"Error removing song from playlist: {str(e)}")
             return False, f"Error: {str(e)}"
 
+    def queue_playlist_add(self, username: str, playlist_name: str, song_data: dict) -> str:
+        """Record a playlist add in the write journal and return at once (synced in the background).
+        
+        Returns:
+            str: Message for the UI
+        """
+        song_entry = self.build_song_entry(song_data)
+        song_entry['position'] = time.time_ns()
+        self._get_journal().append('playlist_add', username, playlist_name=playlist_name, song=song_entry)
+        return f"Added '{song_data.get('title')}' to playlist '{playlist_name}'"
+
+    def queue_playlist_remove(self, username: str, playlist_name: str, video_id: str) -> str:
+        """Record a playlist removal in the write journal and return at once.
+        
+        Returns:
+            str: Message for the UI
+        """
+        self._get_journal().append('playlist_remove', username, playlist_name=playlist_name, video_id=video_id)
+        return f"Removed song from playlist '{playlist_name}'"
+
+    @firestore_io
+    def get_playlist_songs_page(self, username: str, playlist_name: str, page_size: int = 100, start_after=None) -> tuple:
+        """Get one page of songs from a playlist in stored order.
+        
+        Args:
+            username: Username of the user
+            playlist_name: Name of the playlist
+            page_size: Maximum number of songs to return
+            start_after: Cursor returned by the previous page, or None for the first page
+            
+        Returns:
+            tuple: (songs: list, cursor) where cursor is None after the last page
+        """
+        encrypted_username = self._encrypt_data(username)
+        list_ref = self._playlist_ref(encrypted_username, playlist_name)
+        if list_ref is None:
+            return [], None
+        
+        query = list_ref.collection('songs').order_by('position').limit(page_size)
+        if start_after is not None:
+            query = query.start_after(start_after)
+        docs = list(query.stream())
+        cursor = docs[-1] if len(docs) == page_size else None
+        return [doc.to_dict() for doc in docs], cursor
+
+    @firestore_io
     def get_playlist_songs(self, username: str, playlist_name: str) -> list:
         """Get all songs in a specific playlist for a user.
         
@@ -642,24 +1323,243 @@ class FirebaseManager:
         """
         try:
             encrypted_username = self._encrypt_data(username)
-            playlists_ref = self.db.collection('playlists')
-            user_docs = playlists_ref.where('username', '==', encrypted_username).stream()
-            
-            for doc in user_docs:
-                user_data = doc.to_dict()
-                playlists = user_data.get('playlists', [])
-                
-                # Find the playlist with the specified name
-                for playlist in playlists:
+            legacy_playlists = self.ensure_playlist_schema(encrypted_username)
+            if legacy_playlists is not None:
+                for playlist in legacy_playlists:
                     if playlist.get('name') == playlist_name:
                         return playlist.get('songs', [])
-                
-                # If we get here, playlist was not found
                 return []
             
-            # If we get here, no playlists document was found
-            return []
+            songs = []
+            cursor = None
+            while True:
+                page, cursor = self.get_playlist_songs_page(username, playlist_name, start_after=cursor)
+                songs.extend(page)
+                if cursor is None:
+                    return songs
             
         except Exception as e:
             print(f"Error getting playlist songs: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+    @firestore_io
+    def backfill_song_metadata(self, username: str, songs: list, playlist_name: str = None) -> int:
+        """Store fetched metadata on existing entries that were saved without it.
+        
+        Args:
+            username: Username of the user
+            songs: Song data dicts fetched by the client (videoId, title, uploader, duration, ...)
+            playlist_name: Playlist to backfill, or None for liked songs
+            
+        Returns:
+            int: Number of entries updated
+        """
+        fetched = {}
+        for song in songs:
+            video_id = song.get('videoId')
+            entry = self.build_song_entry(song) if video_id else None
+            if entry and self.is_song_entry_complete(entry):
+                fetched[video_id] = entry
+        if not fetched:
+            return 0
+        
+        try:
+            encrypted_username = self._encrypt_data(username)
+            
+            if playlist_name is None:
+                self.ensure_liked_schema(encrypted_username)
+                songs_ref = self._liked_songs_ref(encrypted_username)
+                where = "liked songs"
+            else:
+                list_ref = self._playlist_ref(encrypted_username, playlist_name)
+                if list_ref is None:
+                    return 0
+                songs_ref = list_ref.collection('songs')
+                where = f"playlist '{playlist_name}'"
+            
+            # Only the metadata fields are written; added_at and position stay as stored
+            updated = 0
+            for video_id, entry in fetched.items():
+                metadata = {field: entry[field] for field in SONG_METADATA_FIELDS if field in entry}
+                metadata['schema_version'] = SONG_SCHEMA_VERSION
+                try:
+                    songs_ref.document(video_id).update(metadata)
+                    updated += 1
+                except google_exceptions.NotFound:
+                    # Removed meanwhile
+                    continue
+            if updated:
+                print(f"Backfilled metadata for {updated} songs in {where} for user {username}")
+            return updated
+            
+        except Exception as e:
+            print(f"Error backfilling song metadata: {str(e)}")
+            return 0
+
+
+_manager_future = None
+_manager_lock = threading.Lock()
+
+
+def _create_manager(future):
+    try:
+        backend = None
+        if os.environ.get('HANYAMUSIC_FIRESTORE') == 'memory':
+            # Offline development: an empty in-memory database for this run
+            from InMemoryFirestoreClass import InMemoryFirestore
+            backend = InMemoryFirestore()
+            print("[DEBUG] Using in-memory Firestore")
+        future.set_result(FirebaseManager(backend))
+        print("[DEBUG] Firebase ready")
+    except Exception as e:
+        print(f"Error initializing Firebase: {str(e)}")
+        future.set_exception(e)
+
+
+def init_firebase_manager() -> Future:
+    """Start creating the shared FirebaseManager on a background thread.
+    
+    Safe to call repeatedly; after a failed attempt the next call retries.
+    
+    Returns:
+        Future: Resolves to the shared FirebaseManager
+    """
+    global _manager_future
+    with _manager_lock:
+        failed = (_manager_future is not None and _manager_future.done()
+                  and _manager_future.exception() is not None)
+        if _manager_future is None or failed:
+            _manager_future = Future()
+            threading.Thread(target=_create_manager, args=(_manager_future,), name="firebase_init", daemon=True).start()
+        return _manager_future
+
+
+def get_firebase_manager(timeout: float = None) -> FirebaseManager:
+    """Return the process-wide FirebaseManager, waiting for initialization if needed.
+    
+    Args:
+        timeout: Maximum seconds to wait (None waits until initialized)
+        
+    Returns:
+        FirebaseManager: The shared manager
+        
+    Raises:
+        Exception: Whatever initialization failed with
+    """
+    return init_firebase_manager().result(timeout)
+
+
+def get_firebase_manager_if_ready():
+    """Return the shared FirebaseManager if initialization has succeeded, else None.
+    
+    Never blocks, so it is safe on the Tk thread; work that needs the manager
+    regardless goes through call_async, which waits on the I/O thread.
+    """
+    future = init_firebase_manager()
+    if future.done() and future.exception() is None:
+        return future.result()
+    return None
+
+
+_io_executor = None
+_io_lock = threading.Lock()
+# Coalescing key -> Future of the in-flight call
+_in_flight = {}
+io_stats = {'calls': 0, 'coalesced': 0, 'errors': 0}
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="firebase_io")
+    return _io_executor
+
+
+def _run_io(method_name, args, kwargs):
+    # Resolving the manager here means callers never wait for initialization
+    return getattr(get_firebase_manager(), method_name)(*args, **kwargs)
+
+
+def _deliver(future, widget, callback, errback):
+    """Hand a finished call to its callbacks, on the Tk thread when a widget is given"""
+    def finish():
+        if widget is not None:
+            try:
+                if not widget.winfo_exists():
+                    return
+            except Exception:
+                return
+        error = future.exception()
+        if error is None:
+            if callback:
+                callback(future.result())
+        elif errback:
+            errback(error)
+        else:
+            print(f"Error in Firebase call: {str(error)}")
+    
+    if widget is None:
+        finish()
+        return
+    try:
+        widget.after(0, finish)
+    except Exception:
+        # Widget destroyed (or the Tk loop gone) before the result arrived
+        pass
+
+
+def call_async(method_name: str, *args, widget=None, callback=None, errback=None, **kwargs) -> Future:
+    """Run a FirebaseManager method on the Firebase I/O executor.
+    
+    Identical in-flight calls to read-only methods (COALESCED_METHODS) share
+    one request and one result.
+    
+    Args:
+        method_name: Name of the FirebaseManager method
+        *args: Positional arguments for the method
+        widget: Tk widget whose thread runs callback/errback (skipped once it is destroyed);
+                without one they run on the I/O thread
+        callback: Called with the method's return value
+        errback: Called with the exception if the method raised (default: printed)
+        **kwargs: Keyword arguments for the method
+        
+    Returns:
+        Future: Resolves to the method's return value
+    """
+    key = None
+    if method_name in COALESCED_METHODS:
+        key = (method_name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+    
+    with _io_lock:
+        io_stats['calls'] += 1
+        future = _in_flight.get(key) if key is not None else None
+        if future is not None:
+            io_stats['coalesced'] += 1
+        else:
+            future = _get_io_executor().submit(_run_io, method_name, args, kwargs)
+            if key is not None:
+                _in_flight[key] = future
+            future.add_done_callback(lambda f, key=key: _call_done(key, f))
+    
+    future.add_done_callback(lambda f: _deliver(f, widget, callback, errback))
+    return future
+
+
+def _call_done(key, future):
+    with _io_lock:
+        if key is not None and _in_flight.get(key) is future:
+            del _in_flight[key]
+        if future.exception() is not None:
+            io_stats['errors'] += 1
+
+
+def describe_io() -> str:
+    """One-line debug readout of the Firebase I/O executor"""
+    with _io_lock:
+        in_flight = len(_in_flight)
+    return (f"calls={io_stats['calls']} coalesced={io_stats['coalesced']} "
+            f"in_flight_reads={in_flight} errors={io_stats['errors']}")
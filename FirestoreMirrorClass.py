@@ -0,0 +1,352 @@
+import threading
+from FirebaseClass import FirebaseManager, get_firebase_manager
+
+
+class FirestoreMirror:
+    def __init__(self, username, firebase_manager=None):
+        """In-memory copy of a user's playlists and liked songs fed by Firestore snapshot listeners.
+
+        Firestore sends the documents once when the listeners attach and then
+        only changes, so the UI can read from here instead of querying.
+        Playlist summaries (name, song_count) are always mirrored; a playlist's
+        songs only while watch_playlist() is active for it. Liked songs are one
+        document each, so after the first snapshot a like or unlike sends only
+        that song.
+
+        Subscribers are called as callback(event, delta) with event one of:
+            'ready'     {} - initial data for liked songs and playlists has arrived
+            'liked'     {'added': [entries], 'removed': [video_ids], 'updated': [entries]}
+            'playlists' {'added': [names], 'removed': [names], 'renamed': [(old, new)],
+                         'counts': {name: song_count},
+                         'songs': {name: {'added': [entries], 'removed': [video_ids]}}}
+
+        Args:
+            username: Username of the logged-in user
+            firebase_manager: FirebaseManager to use (the shared one by default,
+                              resolved on the listener thread so start() never waits)
+        """
+        self.username = username
+        self.firebase = firebase_manager
+        self.encrypted_username = FirebaseManager._encrypt_data(username)
+
+        self.lock = threading.RLock()
+        self._playlists = []
+        self._liked_entries = []
+        self._subscribers = []
+        self._watches = []
+        # playlist id -> {'watch', 'songs', 'loaded', 'watchers'}
+        self._song_watches = {}
+        self._liked_loaded = threading.Event()
+        self._playlists_loaded = threading.Event()
+        self._stopped = False
+        self.stats = {'snapshots': 0, 'documents': 0}
+
+    def start(self):
+        """Attach the snapshot listeners (in the background: the playlists layout may need migrating first)"""
+        threading.Thread(target=self._attach, name="firestore_mirror", daemon=True).start()
+
+    def _attach(self):
+        try:
+            if self.firebase is None:
+                self.firebase = get_firebase_manager()
+            self.firebase.ensure_liked_schema(self.encrypted_username)
+            liked_query = self.firebase._liked_songs_ref(self.encrypted_username).order_by('position')
+            watches = [liked_query.on_snapshot(self._on_liked_snapshot)]
+            self.firebase.ensure_playlist_schema(self.encrypted_username)
+            lists_ref = self.firebase._playlist_lists_ref(self.encrypted_username)
+            watches.append(lists_ref.on_snapshot(self._on_playlists_snapshot))
+        except Exception as e:
+            print(f"[DEBUG] Could not attach Firestore listeners: {e}")
+            return
+        with self.lock:
+            self._watches = watches
+            stopped = self._stopped
+        if stopped:
+            self.stop()
+        else:
+            print(f"[DEBUG] Firestore mirror listening for user {self.username}")
+
+    def stop(self):
+        """Detach the listeners and drop all subscribers"""
+        with self.lock:
+            self._stopped = True
+            watches = self._watches + [w['watch'] for w in self._song_watches.values()]
+            self._watches = []
+            self._song_watches = {}
+            self._subscribers = []
+        for watch in watches:
+            try:
+                watch.unsubscribe()
+            except Exception as e:
+                print(f"[DEBUG] Error stopping Firestore listener: {e}")
+
+    # Subscriptions
+
+    def subscribe(self, callback, widget=None):
+        """Register for change notifications.
+
+        Args:
+            callback: Called as callback(event, delta)
+            widget: Optional Tk widget; if given, callbacks run on the Tk thread via
+                    widget.after and the subscription ends when the widget is destroyed
+
+        Returns:
+            callable: Function that removes the subscription
+        """
+        entry = (callback, widget)
+        with self.lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self.lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def _notify(self, event, delta):
+        with self.lock:
+            subscribers = list(self._subscribers)
+        for entry in subscribers:
+            callback, widget = entry
+            try:
+                if widget is None:
+                    callback(event, delta)
+                else:
+                    widget.after(0, lambda cb=callback: cb(event, delta))
+            except Exception as e:
+                # Typically a destroyed widget; stop delivering to it
+                print(f"[DEBUG] Dropping mirror subscriber after error: {e}")
+                with self.lock:
+                    if entry in self._subscribers:
+                        self._subscribers.remove(entry)
+
+    # Snapshot handlers (run on Firestore's listener thread)
+
+    def _count_snapshot(self, docs):
+        self.stats['snapshots'] += 1
+        self.stats['documents'] += len(docs)
+
+    def _on_liked_snapshot(self, docs, changes, read_time):
+        self._count_snapshot(docs)
+        entries = [doc.to_dict() for doc in docs]
+        self.firebase._store_liked_set(self.encrypted_username, [doc.id for doc in docs])
+
+        with self.lock:
+            old = {entry['videoId']: entry for entry in self._liked_entries}
+            self._liked_entries = entries
+        new = {entry['videoId']: entry for entry in entries}
+
+        was_loaded = self._liked_loaded.is_set()
+        self._liked_loaded.set()
+        if was_loaded:
+            delta = {
+                'added': [entry for vid, entry in new.items() if vid not in old],
+                'removed': [vid for vid in old if vid not in new],
+                'updated': [entry for vid, entry in new.items() if vid in old and old[vid] != entry],
+            }
+            if delta['added'] or delta['removed'] or delta['updated']:
+                self._notify('liked', delta)
+        self._check_ready(was_loaded)
+
+    def _on_playlists_snapshot(self, docs, changes, read_time):
+        self._count_snapshot(docs)
+        self.firebase.remember_playlist_docs(self.encrypted_username, docs)
+        playlists = sorted(
+            (self.firebase.playlist_from_doc(doc) for doc in docs),
+            key=lambda p: p.get('created_at') or ''
+        )
+
+        with self.lock:
+            old_playlists = self._playlists
+            self._playlists = playlists
+
+        was_loaded = self._playlists_loaded.is_set()
+        self._playlists_loaded.set()
+        if was_loaded:
+            delta = self._diff_playlists(old_playlists, playlists)
+            if delta['added'] or delta['removed'] or delta['renamed'] or delta['counts']:
+                self._notify('playlists', delta)
+        self._check_ready(was_loaded)
+
+    def _check_ready(self, was_loaded):
+        """Send 'ready' once, when the second collection finishes its initial load"""
+        if not was_loaded and self.is_ready():
+            self._notify('ready', {})
+
+    def _diff_playlists(self, old_playlists, new_playlists):
+        old_by_id = {p['id']: p for p in old_playlists}
+        new_by_id = {p['id']: p for p in new_playlists}
+        delta = {'added': [], 'removed': [], 'renamed': [], 'counts': {}, 'songs': {}}
+        for playlist_id, playlist in new_by_id.items():
+            old = old_by_id.get(playlist_id)
+            if old is None:
+                delta['added'].append(playlist['name'])
+                continue
+            if old['name'] != playlist['name']:
+                delta['renamed'].append((old['name'], playlist['name']))
+            if old['song_count'] != playlist['song_count']:
+                delta['counts'][playlist['name']] = playlist['song_count']
+        delta['removed'] = [p['name'] for playlist_id, p in old_by_id.items() if playlist_id not in new_by_id]
+        return delta
+
+    # Songs of open playlists
+
+    def _playlist_id(self, playlist_name):
+        with self.lock:
+            for playlist in self._playlists:
+                if playlist['name'] == playlist_name:
+                    return playlist['id']
+        return None
+
+    def watch_playlist(self, playlist_name):
+        """Mirror a playlist's songs until unwatch_playlist() (calls are counted).
+
+        Returns:
+            bool: True if the playlist is being watched
+        """
+        playlist_id = self._playlist_id(playlist_name)
+        if playlist_id is None:
+            return False
+        with self.lock:
+            watch = self._song_watches.get(playlist_id)
+            if watch is not None:
+                watch['watchers'] += 1
+                return True
+            watch = {'watch': None, 'songs': [], 'loaded': threading.Event(), 'watchers': 1}
+            self._song_watches[playlist_id] = watch
+
+        songs_query = (self.firebase._playlist_lists_ref(self.encrypted_username)
+                       .document(playlist_id).collection('songs').order_by('position'))
+        try:
+            watch['watch'] = songs_query.on_snapshot(
+                lambda docs, changes, read_time: self._on_songs_snapshot(playlist_id, docs)
+            )
+        except Exception as e:
+            print(f"[DEBUG] Could not watch playlist '{playlist_name}': {e}")
+            with self.lock:
+                self._song_watches.pop(playlist_id, None)
+            return False
+        return True
+
+    def unwatch_playlist(self, playlist_name):
+        playlist_id = self._playlist_id(playlist_name)
+        with self.lock:
+            watch = self._song_watches.get(playlist_id)
+            if watch is None:
+                return
+            watch['watchers'] -= 1
+            if watch['watchers'] > 0:
+                return
+            self._song_watches.pop(playlist_id, None)
+        if watch['watch'] is not None:
+            watch['watch'].unsubscribe()
+
+    def _on_songs_snapshot(self, playlist_id, docs):
+        self._count_snapshot(docs)
+        entries = [doc.to_dict() for doc in docs]
+        with self.lock:
+            watch = self._song_watches.get(playlist_id)
+            if watch is None:
+                return
+            old = {self._entry_video_id(s): s for s in watch['songs']}
+            watch['songs'] = entries
+            name = next((p['name'] for p in self._playlists if p['id'] == playlist_id), None)
+
+        was_loaded = watch['loaded'].is_set()
+        watch['loaded'].set()
+        if not was_loaded or name is None:
+            return
+        new = {self._entry_video_id(s): s for s in entries}
+        song_delta = {
+            'added': [s for vid, s in new.items() if vid not in old],
+            'removed': [vid for vid in old if vid not in new],
+        }
+        if song_delta['added'] or song_delta['removed']:
+            self._notify('playlists', {'added': [], 'removed': [], 'renamed': [], 'counts': {},
+                                       'songs': {name: song_delta}})
+
+    def _entry_video_id(self, entry):
+        return entry.get('videoId') or self.firebase._video_id_from_url(entry.get('url'))
+
+    # Reads (from memory)
+
+    def is_ready(self):
+        return self._liked_loaded.is_set() and self._playlists_loaded.is_set()
+
+    def wait_ready(self, timeout=None):
+        """Block until the initial snapshots have arrived; returns False on timeout"""
+        return self._liked_loaded.wait(timeout) and self._playlists_loaded.wait(timeout)
+
+    def get_playlists(self):
+        """Playlist summaries (id, name, created_at, song_count, empty songs); copies, safe to modify"""
+        with self.lock:
+            return [dict(p, songs=[]) for p in self._playlists]
+
+    def get_playlist_songs(self, playlist_name, timeout=None):
+        """Songs of a watched playlist, waiting up to timeout for its first snapshot.
+
+        Returns:
+            list: Song entries in stored order, or None if the playlist is not watched
+        """
+        playlist_id = self._playlist_id(playlist_name)
+        with self.lock:
+            watch = self._song_watches.get(playlist_id)
+        if watch is None or not watch['loaded'].wait(timeout):
+            return None
+        with self.lock:
+            return list(watch['songs'])
+
+    def get_liked_entries(self):
+        with self.lock:
+            return list(self._liked_entries)
+
+    def liked_count(self):
+        with self.lock:
+            return len(self._liked_entries)
+
+    def describe(self):
+        """One-line debug readout"""
+        with self.lock:
+            playlists = len(self._playlists)
+            liked = len(self._liked_entries)
+            watched = len(self._song_watches)
+        return (f"user={self.username} ready={self.is_ready()} playlists={playlists} liked={liked} "
+                f"watched_playlists={watched} snapshots={self.stats['snapshots']} "
+                f"documents={self.stats['documents']}")
+
+
+_mirror = None
+_mirror_lock = threading.Lock()
+
+
+def start_firestore_mirror(username):
+    """Start (or return) the mirror for username, replacing one for another user."""
+    global _mirror
+    with _mirror_lock:
+        if _mirror is not None and _mirror.username == username:
+            return _mirror
+        if _mirror is not None:
+            _mirror.stop()
+        _mirror = FirestoreMirror(username)
+        try:
+            _mirror.start()
+        except Exception as e:
+            print(f"[DEBUG] Could not start Firestore mirror: {e}")
+            _mirror = None
+        return _mirror
+
+
+def get_firestore_mirror(username=None):
+    """Return the running mirror (only if it belongs to username, when given)."""
+    mirror = _mirror
+    if mirror is None or (username is not None and mirror.username != username):
+        return None
+    return mirror
+
+
+def stop_firestore_mirror():
+    global _mirror
+    with _mirror_lock:
+        if _mirror is not None:
+            _mirror.stop()
+        _mirror = None
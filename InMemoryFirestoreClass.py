@@ -0,0 +1,524 @@
+import copy
+import json
+import queue
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from firebase_admin import firestore
+from google.api_core import exceptions as google_exceptions
+
+# Firestore limits the stand-in enforces, so changes that would fail in production fail here too
+MAX_WRITES_PER_COMMIT = 500
+MAX_DOCUMENT_BYTES = 1024 * 1024
+
+# Marks a field for removal while a write is being applied
+_DELETE = object()
+
+
+def split_field_path(path):
+    """Split a dotted field path into its segments (`quoted` segments may contain dots)."""
+    parts = []
+    current = ""
+    quoted = False
+    i = 0
+    while i < len(path):
+        char = path[i]
+        if char == "`":
+            quoted = not quoted
+        elif char == "\\" and quoted and i + 1 < len(path):
+            i += 1
+            current += path[i]
+        elif char == "." and not quoted:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+        i += 1
+    parts.append(current)
+    return parts
+
+
+def _get_path(data, parts):
+    for part in parts:
+        if not isinstance(data, dict) or part not in data:
+            raise KeyError(".".join(parts))
+        data = data[part]
+    return data
+
+
+def _set_path(data, parts, value):
+    for part in parts[:-1]:
+        if not isinstance(data.get(part), dict):
+            data[part] = {}
+        data = data[part]
+    if value is _DELETE:
+        data.pop(parts[-1], None)
+    else:
+        data[parts[-1]] = value
+
+
+def _resolve(current, value):
+    """Value stored when value is written over current (applies sentinels and transforms)"""
+    if value is firestore.DELETE_FIELD:
+        return _DELETE
+    if value is firestore.SERVER_TIMESTAMP:
+        return datetime.now(timezone.utc)
+    if isinstance(value, firestore.ArrayUnion):
+        existing = list(current) if isinstance(current, list) else []
+        return existing + [item for item in value.values if item not in existing]
+    if isinstance(value, firestore.ArrayRemove):
+        existing = list(current) if isinstance(current, list) else []
+        return [item for item in existing if item not in value.values]
+    if isinstance(value, firestore.Increment):
+        base = current if isinstance(current, (int, float)) and not isinstance(current, bool) else 0
+        return base + value.value
+    if isinstance(value, dict):
+        resolved = {}
+        for key, item in value.items():
+            item = _resolve(None, item)
+            if item is not _DELETE:
+                resolved[key] = item
+        return resolved
+    return copy.deepcopy(value)
+
+
+def _merge(target, data):
+    """set(merge=True): nested maps are merged field by field"""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            _merge(target[key], value)
+        else:
+            _set_path(target, [key], _resolve(target.get(key), value))
+
+
+def _document_size(data):
+    return len(json.dumps(data, default=str).encode('utf-8'))
+
+
+class InMemoryFirestore:
+    def __init__(self, latency=0.0, jitter=0.0, max_document_bytes=MAX_DOCUMENT_BYTES, seed=None):
+        """Firestore stand-in that keeps documents in memory (a FirebaseManager backend).
+
+        Implements the part of the client API FirebaseManager and FirestoreMirror
+        use: references, get with field masks, set/update/create/delete with
+        sentinels and transforms, '==' queries with order_by/limit/start_after/
+        select, batches, transactions and snapshot listeners. Every RPC costs
+        one simulated round trip; reads and writes are counted the way
+        Firestore bills them.
+
+        Args:
+            latency: Seconds added to every round trip
+            jitter: Extra random delay of up to this many seconds per round trip
+            max_document_bytes: Reject writes that make a document larger (None disables)
+            seed: Seed for the jitter
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.max_document_bytes = max_document_bytes
+        self._random = random.Random(seed)
+        self.lock = threading.RLock()
+        # collection path -> {document id: data}
+        self._collections = {}
+        self._listeners = []
+        self._events = None
+        self.stats = {}
+        self.reset_stats()
+        self.db = _Client(self)
+
+    # Backend interface
+
+    def run_transaction(self, function):
+        """Run function(transaction); transactions are serialized instead of retried."""
+        with self.lock:
+            transaction = _Transaction(self)
+            result = function(transaction)
+            transaction.commit()
+            return result
+
+    # Accounting
+
+    def reset_stats(self):
+        self.stats = {'round_trips': 0, 'reads': 0, 'writes': 0, 'bytes_read': 0}
+
+    def _round_trip(self):
+        self.stats['round_trips'] += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _count_reads(self, snapshots):
+        # A query that matches nothing is still billed one read
+        self.stats['reads'] += max(1, len(snapshots))
+        self.stats['bytes_read'] += sum(_document_size(s._data) for s in snapshots if s._data is not None)
+
+    # Storage
+
+    def _split(self, path):
+        collection_path, _, doc_id = path.rpartition('/')
+        return collection_path, doc_id
+
+    def _load(self, path):
+        collection_path, doc_id = self._split(path)
+        return self._collections.get(collection_path, {}).get(doc_id)
+
+    def _documents(self, collection_path):
+        return list(self._collections.get(collection_path, {}).items())
+
+    def _commit(self, writes):
+        """Apply writes atomically: every precondition is checked before anything changes"""
+        if len(writes) > MAX_WRITES_PER_COMMIT:
+            raise google_exceptions.InvalidArgument(
+                f"maximum {MAX_WRITES_PER_COMMIT} writes allowed per request, got {len(writes)}")
+        self._round_trip()
+        with self.lock:
+            staged = {}
+            for kind, path, data, option in writes:
+                current = staged[path] if path in staged else self._load(path)
+                staged[path] = self._apply_write(kind, path, current, data, option)
+            for path, data in staged.items():
+                if data is not None and self.max_document_bytes and _document_size(data) > self.max_document_bytes:
+                    raise google_exceptions.InvalidArgument(
+                        f"Document {path} exceeds the maximum size of {self.max_document_bytes} bytes")
+            for path, data in staged.items():
+                collection_path, doc_id = self._split(path)
+                documents = self._collections.setdefault(collection_path, {})
+                if data is None:
+                    documents.pop(doc_id, None)
+                else:
+                    documents[doc_id] = data
+            self.stats['writes'] += len(writes)
+            self._notify(set(staged))
+
+    def _apply_write(self, kind, path, current, data, option):
+        if kind == 'create':
+            if current is not None:
+                raise google_exceptions.AlreadyExists(f"Document already exists: {path}")
+            return _resolve(None, data)
+        if kind == 'set':
+            if option == 'merge':
+                merged = copy.deepcopy(current) if current is not None else {}
+                _merge(merged, data)
+                return merged
+            return _resolve(None, data)
+        if kind == 'update':
+            if current is None:
+                raise google_exceptions.NotFound(f"No document to update: {path}")
+            updated = copy.deepcopy(current)
+            for field_path, value in data.items():
+                parts = split_field_path(field_path)
+                try:
+                    existing = _get_path(updated, parts)
+                except KeyError:
+                    existing = None
+                _set_path(updated, parts, _resolve(existing, value))
+            return updated
+        if kind == 'delete':
+            if option is not None and option.exists and current is None:
+                raise google_exceptions.NotFound(f"No document to delete: {path}")
+            return None
+        raise ValueError(f"Unknown write {kind}")
+
+    # Snapshot listeners (called on a listener thread, like the real client)
+
+    def _listen(self, target, callback):
+        listener = {'target': target, 'callback': callback}
+        with self.lock:
+            self._listeners.append(listener)
+            self._dispatch(listener)
+        return _Watch(self, listener)
+
+    def _notify(self, changed_paths):
+        changed_collections = {self._split(path)[0] for path in changed_paths}
+        for listener in list(self._listeners):
+            target = listener['target']
+            if isinstance(target, _DocumentReference):
+                hit = target.path in changed_paths
+            else:
+                hit = target._collection_path in changed_collections
+            if hit:
+                self._dispatch(listener)
+
+    def _dispatch(self, listener):
+        target = listener['target']
+        if isinstance(target, _DocumentReference):
+            snapshots = [target._snapshot()]
+        else:
+            snapshots = target._run()
+        self._count_reads(snapshots)
+        if self._events is None:
+            self._events = queue.Queue()
+            threading.Thread(target=self._deliver_events, name="in_memory_firestore_listeners", daemon=True).start()
+        self._events.put((listener, snapshots))
+
+    def _deliver_events(self):
+        while True:
+            listener, snapshots = self._events.get()
+            if listener not in self._listeners:
+                continue
+            try:
+                listener['callback'](snapshots, [], datetime.now(timezone.utc))
+            except Exception as e:
+                print(f"[DEBUG] In-memory snapshot listener failed: {e}")
+
+    def describe(self):
+        """One-line debug readout"""
+        with self.lock:
+            documents = sum(len(docs) for docs in self._collections.values())
+        return (f"documents={documents} round_trips={self.stats['round_trips']} reads={self.stats['reads']} "
+                f"writes={self.stats['writes']} bytes_read={self.stats['bytes_read']} latency={self.latency}s")
+
+
+class _Watch:
+    def __init__(self, backend, listener):
+        self._backend = backend
+        self._listener = listener
+
+    def unsubscribe(self):
+        with self._backend.lock:
+            if self._listener in self._backend._listeners:
+                self._backend._listeners.remove(self._listener)
+
+
+class _WriteOption:
+    def __init__(self, exists=None):
+        self.exists = exists
+
+
+class _Client:
+    def __init__(self, backend):
+        self._backend = backend
+
+    def collection(self, name):
+        return _CollectionReference(self._backend, name)
+
+    def batch(self):
+        return _WriteBatch(self._backend)
+
+    def write_option(self, exists=None, **kwargs):
+        return _WriteOption(exists)
+
+
+class _DocumentSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self._data = data
+
+    @property
+    def id(self):
+        return self.reference.id
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field_path):
+        return copy.deepcopy(_get_path(self._data or {}, split_field_path(field_path)))
+
+
+class _DocumentReference:
+    def __init__(self, backend, path):
+        self._backend = backend
+        self.path = path
+
+    @property
+    def id(self):
+        return self.path.rpartition('/')[2]
+
+    @property
+    def parent(self):
+        return _CollectionReference(self._backend, self.path.rpartition('/')[0])
+
+    def __eq__(self, other):
+        return isinstance(other, _DocumentReference) and other.path == self.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def collection(self, name):
+        return _CollectionReference(self._backend, f"{self.path}/{name}")
+
+    def _snapshot(self, field_paths=None):
+        data = self._backend._load(self.path)
+        if data is not None:
+            if field_paths is None:
+                data = copy.deepcopy(data)
+            else:
+                masked = {}
+                for field_path in field_paths:
+                    parts = split_field_path(field_path)
+                    try:
+                        _set_path(masked, parts, copy.deepcopy(_get_path(data, parts)))
+                    except KeyError:
+                        pass
+                data = masked
+        return _DocumentSnapshot(self, data)
+
+    def get(self, field_paths=None, transaction=None, **kwargs):
+        if transaction is not None:
+            transaction._check_read()
+        self._backend._round_trip()
+        with self._backend.lock:
+            snapshot = self._snapshot(field_paths)
+        self._backend._count_reads([snapshot])
+        return snapshot
+
+    def create(self, document_data):
+        self._backend._commit([('create', self.path, document_data, None)])
+
+    def set(self, document_data, merge=False):
+        self._backend._commit([('set', self.path, document_data, 'merge' if merge else None)])
+
+    def update(self, field_updates, option=None):
+        self._backend._commit([('update', self.path, field_updates, option)])
+
+    def delete(self, option=None):
+        self._backend._commit([('delete', self.path, None, option)])
+
+    def on_snapshot(self, callback):
+        return self._backend._listen(self, callback)
+
+
+class _Query:
+    def __init__(self, backend, collection_path, filters=(), orders=(), limit=None, start_after=None, projection=None):
+        self._backend = backend
+        self._collection_path = collection_path
+        self._filters = tuple(filters)
+        self._orders = tuple(orders)
+        self._limit = limit
+        self._start_after = start_after
+        self._projection = projection
+
+    def _copy(self, **changes):
+        fields = {
+            'filters': self._filters, 'orders': self._orders, 'limit': self._limit,
+            'start_after': self._start_after, 'projection': self._projection,
+        }
+        fields.update(changes)
+        return _Query(self._backend, self._collection_path, **fields)
+
+    def where(self, field_path, op_string, value):
+        if op_string != '==':
+            raise NotImplementedError(f"In-memory Firestore only supports '==' filters, not {op_string!r}")
+        return self._copy(filters=self._filters + ((field_path, value),))
+
+    def order_by(self, field_path, direction='ASCENDING'):
+        return self._copy(orders=self._orders + ((field_path, direction == 'DESCENDING'),))
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def start_after(self, document):
+        return self._copy(start_after=document)
+
+    def select(self, field_paths):
+        return self._copy(projection=list(field_paths))
+
+    def _value(self, doc_id, data, field_path):
+        if field_path == '__name__':
+            return doc_id
+        return _get_path(data, split_field_path(field_path))
+
+    def _sort_key(self, doc_id, data):
+        return tuple(self._value(doc_id, data, field) for field, _ in self._orders) + (doc_id,)
+
+    def _run(self):
+        matches = []
+        for doc_id, data in self._backend._documents(self._collection_path):
+            try:
+                if any(self._value(doc_id, data, field) != value for field, value in self._filters):
+                    continue
+                # Like Firestore, documents without an order_by field are left out
+                self._sort_key(doc_id, data)
+            except KeyError:
+                continue
+            matches.append((doc_id, data))
+
+        for index in reversed(range(len(self._orders))):
+            field, descending = self._orders[index]
+            matches.sort(key=lambda item: self._value(item[0], item[1], field), reverse=descending)
+        if not self._orders:
+            matches.sort(key=lambda item: item[0])
+
+        if self._start_after is not None:
+            cursor = self._start_after
+            cursor_key = self._sort_key(cursor.id, cursor._data or {})
+            matches = [item for item in matches if self._after(self._sort_key(*item), cursor_key)]
+        if self._limit is not None:
+            matches = matches[:self._limit]
+
+        snapshots = []
+        for doc_id, data in matches:
+            reference = _DocumentReference(self._backend, f"{self._collection_path}/{doc_id}")
+            if self._projection is not None:
+                snapshots.append(reference._snapshot(self._projection))
+            else:
+                snapshots.append(_DocumentSnapshot(reference, copy.deepcopy(data)))
+        return snapshots
+
+    def _after(self, key, cursor_key):
+        for (field, descending), value, cursor_value in zip(self._orders, key, cursor_key):
+            if value != cursor_value:
+                return value < cursor_value if descending else value > cursor_value
+        return key[-1] > cursor_key[-1]
+
+    def stream(self, transaction=None, **kwargs):
+        self._backend._round_trip()
+        with self._backend.lock:
+            snapshots = self._run()
+        self._backend._count_reads(snapshots)
+        return iter(snapshots)
+
+    def get(self, transaction=None, **kwargs):
+        return list(self.stream(transaction))
+
+    def on_snapshot(self, callback):
+        return self._backend._listen(self, callback)
+
+
+class _CollectionReference(_Query):
+    def __init__(self, backend, collection_path):
+        super().__init__(backend, collection_path)
+
+    @property
+    def id(self):
+        return self._collection_path.rpartition('/')[2]
+
+    def document(self, document_id=None):
+        document_id = document_id or uuid.uuid4().hex[:20]
+        return _DocumentReference(self._backend, f"{self._collection_path}/{document_id}")
+
+
+class _WriteBatch:
+    def __init__(self, backend):
+        self._backend = backend
+        self._writes = []
+
+    def create(self, reference, document_data):
+        self._writes.append(('create', reference.path, document_data, None))
+
+    def set(self, reference, document_data, merge=False):
+        self._writes.append(('set', reference.path, document_data, 'merge' if merge else None))
+
+    def update(self, reference, field_updates, option=None):
+        self._writes.append(('update', reference.path, field_updates, option))
+
+    def delete(self, reference, option=None):
+        self._writes.append(('delete', reference.path, None, option))
+
+    def commit(self):
+        writes, self._writes = self._writes, []
+        if writes:
+            self._backend._commit(writes)
+
+
+class _Transaction(_WriteBatch):
+    def _check_read(self):
+        if self._writes:
+            raise ValueError("Firestore transactions require all reads to happen before any writes")
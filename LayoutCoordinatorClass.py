@@ -0,0 +1,106 @@
+import threading
+import time
+import tkinter
+
+# Resize work is batched into one pass per this many milliseconds
+FRAME_MS = 16
+
+
+class LayoutCoordinator:
+    def __init__(self, root, frame_ms=FRAME_MS):
+        """Run all resize work in one batched pass per frame.
+
+        Dragging a window edge delivers a burst of <Configure> events to every
+        resized widget. Widgets registered with watch() only record their new
+        size here; the first change schedules a pass frame_ms later, and that
+        pass calls each changed widget's callback once with its latest size, in
+        registration order (so containers registered first lay out first).
+        Events that only move a widget are ignored.
+
+        Args:
+            root: Tk root window
+            frame_ms: Time between layout passes while resizing
+        """
+        self.root = root
+        self.frame_ms = frame_ms
+        # key -> {'widget', 'callback', 'size'}
+        self._entries = {}
+        self._dirty = set()
+        self._after_id = None
+        self.last_pass_ms = 0.0
+        self.max_pass_ms = 0.0
+        self.stats = {'events': 0, 'passes': 0, 'callbacks': 0}
+
+    def watch(self, widget, callback, key=None):
+        """Call callback(width, height) at most once per frame when widget is resized.
+
+        Args:
+            widget: Widget whose <Configure> events are batched
+            callback: Layout work for the new size
+            key: Name shown in the debug readout (defaults to the widget path)
+        """
+        key = key or str(widget)
+        self._entries[key] = {'widget': widget, 'callback': callback, 'size': None}
+        widget.bind('<Configure>', lambda event: self._on_configure(key, event), add="+")
+        return key
+
+    def unwatch(self, key):
+        self._entries.pop(key, None)
+        self._dirty.discard(key)
+
+    def _on_configure(self, key, event):
+        entry = self._entries.get(key)
+        # A toplevel also receives its children's events through its bind tag
+        if entry is None or str(event.widget) != str(entry['widget']):
+            return
+        self.stats['events'] += 1
+        size = (event.width, event.height)
+        if size == entry['size']:
+            return
+        entry['size'] = size
+        self._dirty.add(key)
+        if self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._run)
+
+    def _run(self):
+        self._after_id = None
+        dirty, self._dirty = self._dirty, set()
+        start = time.perf_counter()
+        for key, entry in list(self._entries.items()):
+            if key not in dirty:
+                continue
+            try:
+                if not entry['widget'].winfo_exists():
+                    self.unwatch(key)
+                    continue
+                entry['callback'](*entry['size'])
+            except tkinter.TclError:
+                # The widget went away during the pass
+                self.unwatch(key)
+            except Exception as e:
+                print(f"[DEBUG] Layout pass for '{key}' failed: {e}")
+            self.stats['callbacks'] += 1
+        self.stats['passes'] += 1
+        self.last_pass_ms = (time.perf_counter() - start) * 1000
+        self.max_pass_ms = max(self.max_pass_ms, self.last_pass_ms)
+
+    def describe(self):
+        """One-line debug readout"""
+        return (f"watched={len(self._entries)} events={self.stats['events']} passes={self.stats['passes']} "
+                f"callbacks={self.stats['callbacks']} last_pass={self.last_pass_ms:.1f}ms "
+                f"max_pass={self.max_pass_ms:.1f}ms")
+
+
+_coordinator = None
+_coordinator_lock = threading.Lock()
+
+
+def get_layout_coordinator(widget=None):
+    """Return the app's layout coordinator, creating it for widget's root window on first use."""
+    global _coordinator
+    with _coordinator_lock:
+        if _coordinator is None:
+            if widget is None:
+                raise RuntimeError("The layout coordinator needs a widget on first use")
+            _coordinator = LayoutCoordinator(widget._root())
+        return _coordinator
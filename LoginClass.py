@@ -211,11 +211,19 @@ class LoginWindow(ctk.CTkToplevel):
             self.show_error("Please enter both username and password")
             return
             
-        # Use FirebaseManager to validate credentials
-        from FirebaseClass import FirebaseManager
-        firebase = FirebaseManager()
-        
-        if firebase.verify_credentials(username, password):
+        # Validate credentials on the Firebase I/O thread; the window stays responsive
+        from FirebaseClass import call_async
+        self.login_button.configure(state="disabled")
+        call_async(
+            'verify_credentials', username, password, widget=self,
+            callback=lambda valid: self.finish_login(username, remember_me, valid),
+            errback=self.login_failed
+        )
+    
+    def finish_login(self, username, remember_me, valid):
+        """Complete a login attempt once the credentials have been checked"""
+        self.login_button.configure(state="normal")
+        if valid:
             # Save session if remember me is checked
             self.session_manager.save_session(username, remember_me)
             
@@ -226,6 +234,12 @@ class LoginWindow(ctk.CTkToplevel):
         else:
             self.show_error("Invalid username or password")
     
+    def login_failed(self, error):
+        """The credentials could not be checked at all (network error, Firebase unavailable)"""
+        self.login_button.configure(state="normal")
+        print(f"Login check failed: {error}")
+        self.show_error("Couldn't reach the server. Check your connection and try again")
+    
     def show_error(self, message):
         """Display error message"""
         self.error_label.configure(text=message)
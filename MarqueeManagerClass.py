@@ -0,0 +1,156 @@
+import threading
+import tkinter
+import customtkinter as ctk
+from AnimationSchedulerClass import get_animation_scheduler
+
+
+class MarqueeManager:
+    def __init__(self, scheduler, speed=50.0, interval_ms=40, gap=40):
+        """Scroll all overflowing labels from one scheduler animation.
+
+        Each marquee is a canvas laid over its label holding the text twice,
+        one gap apart; a frame moves both items left by a few pixels and jumps
+        them back by one period when the first has scrolled out, so the label
+        text is never re-set and re-laid out. Marquees whose canvas is not on
+        screen (unmapped, or clipped away by a scrolling canvas or the window)
+        are skipped.
+
+        Args:
+            scheduler: AnimationScheduler that drives the frames
+            speed: Scroll speed in pixels per second
+            interval_ms: Time between frames
+            gap: Pixels between the end of the text and its next repetition
+        """
+        self.scheduler = scheduler
+        self.speed = speed
+        self.interval_ms = interval_ms
+        self.gap = gap
+        # str(label) -> marquee state
+        self._entries = {}
+        self._animation = None
+        self.stats = {'frames': 0, 'moved': 0, 'skipped': 0}
+
+    def add(self, label, text, font, bg, fg="#FFFFFF", on_double_click=None):
+        """Start scrolling text over label (replacing a marquee already on it).
+
+        Args:
+            label: Label the marquee covers; it keeps its text underneath
+            text: Text to scroll
+            font: Font of the label (a CTkFont or tkinter font)
+            bg: Background color behind the text
+            fg: Text color
+            on_double_click: Optional handler for double clicks on the marquee
+        """
+        self.remove(label)
+        height = max(label.winfo_height(), 1)
+        canvas = ctk.CTkCanvas(label.master, bg=bg, highlightthickness=0, height=height)
+        canvas.place(in_=label, x=0, y=0, relwidth=1.0, relheight=1.0)
+
+        period = font.measure(text) + self.gap
+        canvas.create_text(0, height / 2, text=text, font=font, fill=fg, anchor="w", tags="marquee")
+        canvas.create_text(period, height / 2, text=text, font=font, fill=fg, anchor="w", tags="marquee")
+        if on_double_click is not None:
+            canvas.bind("<Double-Button-1>", on_double_click)
+
+        entry = {'canvas': canvas, 'period': period, 'offset': 0.0, 'y': height / 2,
+                 'clips': self._clipping_ancestors(label)}
+        canvas.bind("<Configure>", lambda event: self._recenter(entry, event.height))
+        self._entries[str(label)] = entry
+
+        if self._animation is None or not self._animation.active:
+            self._animation = self.scheduler.add("marquees", self._step, self.interval_ms, decorative=True)
+
+    def remove(self, label):
+        """Stop the marquee on label; the label's own text shows again"""
+        entry = self._entries.pop(str(label), None)
+        if entry is None:
+            return
+        try:
+            entry['canvas'].destroy()
+        except tkinter.TclError:
+            pass
+
+    def _clipping_ancestors(self, widget):
+        """Scrolling canvases the widget sits in, and its window"""
+        clips = []
+        ancestor = widget.master
+        while ancestor is not None:
+            if isinstance(ancestor, tkinter.Canvas):
+                clips.append(ancestor)
+            ancestor = ancestor.master
+        clips.append(widget.winfo_toplevel())
+        return clips
+
+    def _recenter(self, entry, height):
+        y = height / 2
+        entry['canvas'].move("marquee", 0, y - entry['y'])
+        entry['y'] = y
+
+    def _rect(self, widget):
+        x, y = widget.winfo_rootx(), widget.winfo_rooty()
+        return x, y, x + widget.winfo_width(), y + widget.winfo_height()
+
+    def _on_screen(self, entry, clip_rects):
+        canvas = entry['canvas']
+        if not canvas.winfo_viewable():
+            return False
+        left, top, right, bottom = self._rect(canvas)
+        for clip in entry['clips']:
+            # Clip rectangles are shared by all marquees in a frame
+            rect = clip_rects.get(str(clip))
+            if rect is None:
+                rect = clip_rects[str(clip)] = self._rect(clip)
+            if right <= rect[0] or left >= rect[2] or bottom <= rect[1] or top >= rect[3]:
+                return False
+        return True
+
+    def _step(self):
+        if not self._entries:
+            self._animation = None
+            return False
+        self.stats['frames'] += 1
+        distance = self.speed * self._frame_interval()
+        clip_rects = {}
+        for key, entry in list(self._entries.items()):
+            canvas = entry['canvas']
+            try:
+                if not canvas.winfo_exists():
+                    del self._entries[key]
+                    continue
+                if not self._on_screen(entry, clip_rects):
+                    self.stats['skipped'] += 1
+                    continue
+                entry['offset'] += distance
+                if entry['offset'] >= entry['period']:
+                    # The first copy has scrolled out; the second is where it started
+                    entry['offset'] -= entry['period']
+                    canvas.move("marquee", entry['period'] - distance, 0)
+                else:
+                    canvas.move("marquee", -distance, 0)
+                self.stats['moved'] += 1
+            except tkinter.TclError:
+                self._entries.pop(key, None)
+
+    def _frame_interval(self):
+        """Seconds per frame, including any slowdown applied by the scheduler"""
+        if self._animation is None:
+            return self.interval_ms / 1000
+        return self._animation.effective_interval()
+
+    def describe(self):
+        """One-line debug readout"""
+        return (f"marquees={len(self._entries)} frames={self.stats['frames']} "
+                f"moved={self.stats['moved']} skipped_off_screen={self.stats['skipped']}")
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_marquee_manager(widget=None):
+    """Return the app's marquee manager, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = MarqueeManager(get_animation_scheduler(widget))
+        return _manager
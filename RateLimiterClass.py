@@ -0,0 +1,103 @@
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        """Token bucket rate limiter shared between threads.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold (burst size)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens earned since the last refill (lock must be held)"""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+
+    def set_rate(self, rate, capacity=None):
+        """Change the refill rate (and optionally the burst size)"""
+        with self.lock:
+            self._refill()
+            self.rate = float(rate)
+            if capacity is not None:
+                self.capacity = float(capacity)
+                self.tokens = min(self.tokens, self.capacity)
+
+    def try_acquire(self, tokens=1):
+        """Take tokens without waiting.
+
+        Returns:
+            bool: True if the tokens were taken, False if the bucket is short
+        """
+        with self.lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def refund(self, tokens=1):
+        """Put back tokens that were taken but not used (up to capacity)"""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + tokens)
+
+    def wait_time(self, tokens=1):
+        """Seconds until the requested tokens will be available"""
+        with self.lock:
+            self._refill()
+            missing = tokens - self.tokens
+            if missing <= 0:
+                return 0.0
+            return missing / self.rate if self.rate > 0 else float('inf')
+
+    def acquire(self, tokens=1, timeout=None, stop_event=None):
+        """Block until tokens are available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None waits forever)
+            stop_event: Optional threading.Event that aborts the wait when set
+
+        Returns:
+            bool: True if the tokens were taken, False on timeout or stop
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            if self.try_acquire(tokens):
+                return True
+            delay = self.wait_time(tokens)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            # Sleep in short slices so a stop request is noticed quickly
+            delay = min(max(delay, 0.005), 0.25)
+            if stop_event is not None:
+                if stop_event.wait(delay):
+                    return False
+            else:
+                time.sleep(delay)
+
+    def snapshot(self):
+        """Return the current bucket state for debug output"""
+        with self.lock:
+            self._refill()
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'tokens': round(self.tokens, 2),
+            }
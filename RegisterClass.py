@@ -1,12 +1,13 @@
 import customtkinter as ctk
 import re
-from FirebaseClass import FirebaseManager
+from FirebaseClass import FirebaseManager, call_async
 
 class RegisterPage(ctk.CTkToplevel):
     def __init__(self, switch_to_login_callback=None):
         super().__init__()
-        self.firebase = FirebaseManager()
         self.switch_to_login = switch_to_login_callback
+        # Pending debounced availability check (after id)
+        self._availability_check = None
         self.title("Register - HanyaMusic")
         self.geometry("600x650")  # Slightly taller to accommodate more fields
         self.resizable(False, False)
@@ -301,17 +302,25 @@ class RegisterPage(ctk.CTkToplevel):
                 self.username_error.configure(text="Username must be 3-20 alphanumeric characters")
                 return False
         
-        # Check if username already exists
-        if not self.firebase.is_username_available(username):
-            self.username_error.configure(text="Username is exist")
-            return False
-        
+        # Check availability once typing pauses; register_user rejects taken names anyway
         self.username_error.configure(text="")
+        if self._availability_check is not None:
+            self.after_cancel(self._availability_check)
+        self._availability_check = self.after(400, lambda: self.check_username_available(username))
         return True
     
+    def check_username_available(self, username):
+        """Look up username on the Firebase I/O thread and show the result if it is still current"""
+        self._availability_check = None
+        
+        def show(available):
+            if not available and self.username_var.get() == username:
+                self.username_error.configure(text="Username is exist")
+        call_async('is_username_available', username, widget=self, callback=show)
+    
     def generate_recovery_code(self):
         """Generate a new recovery code and update the entry field"""
-        code = self.firebase.generate_recovery_code()
+        code = FirebaseManager.generate_recovery_code()
         self.recovery_var.set(code)
         
         # Add a brief visual feedback
@@ -342,13 +351,22 @@ class RegisterPage(ctk.CTkToplevel):
             self.show_error("Password does not meet the requirements")
             return
         
-        # Register user (username availability already checked in validate_username)
-        success, result = self.firebase.register_user(username, password, recovery_code)
-        
+        # Register user on the Firebase I/O thread (taken usernames are rejected there)
+        self.register_btn.configure(state="disabled")
+        call_async(
+            'register_user', username, password, recovery_code, widget=self,
+            callback=lambda outcome: self.finish_register(*outcome),
+            errback=lambda error: self.finish_register(False, str(error))
+        )
+    
+    def finish_register(self, success, result):
+        self.register_btn.configure(state="normal")
         if success:
             self.show_info("Registration successful!\n\nYour recovery code is: {}\n\nPlease save this code in a safe place.".format(result))
             self.go_to_login()
         else:
+            if result == "Username already exists":
+                self.username_error.configure(text="Username is exist")
             self.show_error("Registration failed: {}".format(result))
     
     def show_error(self, message):
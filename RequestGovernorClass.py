@@ -0,0 +1,327 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import requests
+from RateLimiterClass import TokenBucket
+from StallWatchdogClass import record_ui_thread_io
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a host's circuit breaker is open."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        """Fail fast after repeated failures, then probe with a single request.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing a probe request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_for = reset_timeout
+        self.probe_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """Return 0 if a request may go out, otherwise seconds until the next probe"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return 0.0
+            remaining = self.opened_at + self.open_for - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return 0.0
+            return max(remaining, 0.1)
+
+    def release_probe(self):
+        """Give back a half-open probe that was claimed but never sent"""
+        with self.lock:
+            self.probe_in_flight = False
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self, open_for=None):
+        """Count a failure; open the circuit at the threshold or when told to back off"""
+        with self.lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold or open_for:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.open_for = max(open_for or 0, self.reset_timeout)
+
+    def snapshot(self):
+        with self.lock:
+            retry_in = 0.0
+            if self.state != self.CLOSED:
+                retry_in = max(0.0, self.opened_at + self.open_for - time.monotonic())
+            return {'state': self.state, 'failures': self.failures, 'retry_in': round(retry_in, 1)}
+
+
+class AdaptiveConcurrency:
+    def __init__(self, initial=4, minimum=1, maximum=8):
+        """Concurrency limit adjusted with AIMD (additive increase, multiplicative decrease).
+
+        Args:
+            initial: Starting number of concurrent requests
+            minimum: Lowest limit after repeated overload signals
+            maximum: Highest limit reached by additive increase
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Wait for a free slot; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining if remaining is not None else 0.5)
+            self.in_flight += 1
+            return True
+
+    def release(self, overloaded=False):
+        """Free a slot and adapt the limit to the outcome of the request"""
+        with self.condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if overloaded:
+                self.limit = max(self.minimum, self.limit / 2)
+            else:
+                # Roughly +1 per window of successful requests
+                self.limit = min(self.maximum, self.limit + 1.0 / max(self.limit, 1.0))
+            self.condition.notify_all()
+
+    def snapshot(self):
+        with self.condition:
+            return {'limit': round(self.limit, 2), 'in_flight': self.in_flight}
+
+
+class HostPolicy:
+    def __init__(self, rate, burst, max_concurrency, failure_threshold=5, reset_timeout=30.0):
+        """Rate limit, concurrency limit and circuit breaker for one host"""
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = AdaptiveConcurrency(
+            initial=max(1, max_concurrency // 2), minimum=1, maximum=max_concurrency
+        )
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.requests = 0
+        self.overloads = 0
+        self.rejected = 0
+
+
+class RequestGovernor:
+    # Status codes that mean "slow down" rather than "this request is bad"
+    OVERLOAD_STATUSES = (429, 503)
+
+    def __init__(self, default_rate=5.0, default_burst=5, default_concurrency=6):
+        """Shared outbound-request governor with per-host policies.
+
+        Args:
+            default_rate: Requests per second for hosts without explicit configuration
+            default_burst: Burst size for hosts without explicit configuration
+            default_concurrency: Maximum concurrent requests per unconfigured host
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.default_concurrency = default_concurrency
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def configure_host(self, host, rate, burst, max_concurrency, failure_threshold=5, reset_timeout=30.0):
+        """Set the policy for a host (replaces any existing policy)"""
+        with self.lock:
+            self.hosts[host] = HostPolicy(rate, burst, max_concurrency, failure_threshold, reset_timeout)
+
+    def _policy(self, host):
+        with self.lock:
+            policy = self.hosts.get(host)
+            if policy is None:
+                policy = HostPolicy(self.default_rate, self.default_burst, self.default_concurrency)
+                self.hosts[host] = policy
+            return policy
+
+    @contextmanager
+    def guard(self, host, timeout=30.0):
+        """Hold a rate-limited, concurrency-limited slot for one request to host.
+
+        Raises CircuitOpenError without waiting while the host's circuit is open.
+        Overload and transport errors raised inside the block (timeouts, 429/5xx,
+        connection errors) count as breaker failures; other errors, such as a
+        video that is unavailable, mean the host answered. The caller may also
+        call the yielded outcome's mark_overloaded() for soft failures such as 429.
+        """
+        record_ui_thread_io('http', host)
+        policy = self._policy(host)
+        retry_in = policy.breaker.allow()
+        if retry_in:
+            policy.rejected += 1
+            raise CircuitOpenError(host, retry_in)
+
+        try:
+            if not policy.bucket.acquire(timeout=timeout):
+                raise requests.Timeout(f"Rate limit wait for {host} timed out")
+            if not policy.concurrency.acquire(timeout=timeout):
+                raise requests.Timeout(f"Concurrency wait for {host} timed out")
+        except BaseException:
+            # Nothing was sent; a claimed half-open probe must not stay claimed
+            policy.breaker.release_probe()
+            raise
+
+        outcome = _RequestOutcome()
+        policy.requests += 1
+        try:
+            yield outcome
+        except Exception as e:
+            if _is_overload_error(e):
+                outcome.overloaded = True
+            elif _is_transport_error(e):
+                outcome.failed = True
+            raise
+        finally:
+            if outcome.overloaded:
+                policy.overloads += 1
+            policy.concurrency.release(overloaded=outcome.overloaded)
+            if outcome.failed or outcome.overloaded:
+                policy.breaker.record_failure(open_for=outcome.retry_after)
+            else:
+                policy.breaker.record_success()
+
+    def request(self, session, method, url, **kwargs):
+        """Send a request through the host's policy.
+
+        Args:
+            session: requests.Session (or the requests module) used to send
+            method: HTTP method name
+            url: Request URL
+            **kwargs: Passed through to session.request
+
+        Returns:
+            requests.Response
+        """
+        host = urlparse(url).netloc
+        with self.guard(host) as outcome:
+            response = session.request(method, url, **kwargs)
+            if response.status_code in self.OVERLOAD_STATUSES:
+                outcome.overloaded = True
+                outcome.retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            elif response.status_code >= 500:
+                outcome.failed = True
+            return response
+
+    def get(self, session, url, **kwargs):
+        return self.request(session, 'GET', url, **kwargs)
+
+    def snapshot(self):
+        """Return per-host state for debug output"""
+        with self.lock:
+            hosts = dict(self.hosts)
+        state = {}
+        for host, policy in hosts.items():
+            state[host] = {
+                'bucket': policy.bucket.snapshot(),
+                'concurrency': policy.concurrency.snapshot(),
+                'breaker': policy.breaker.snapshot(),
+                'requests': policy.requests,
+                'overloads': policy.overloads,
+                'rejected': policy.rejected,
+            }
+        return state
+
+    def describe(self):
+        """Human-readable one-line-per-host debug readout"""
+        lines = []
+        for host, state in sorted(self.snapshot().items()):
+            breaker = state['breaker']
+            concurrency = state['concurrency']
+            bucket = state['bucket']
+            line = (
+                f"{host}: breaker={breaker['state']}"
+                f"{' (retry in %.1fs)' % breaker['retry_in'] if breaker['state'] != CircuitBreaker.CLOSED else ''}"
+                f" concurrency={concurrency['in_flight']}/{concurrency['limit']}"
+                f" tokens={bucket['tokens']}/{bucket['capacity']}@{bucket['rate']}/s"
+                f" requests={state['requests']} overloads={state['overloads']} rejected={state['rejected']}"
+            )
+            lines.append(line)
+        return "\n".join(lines) if lines else "No outbound requests yet"
+
+
+class _RequestOutcome:
+    def __init__(self):
+        self.failed = False
+        self.overloaded = False
+        self.retry_after = None
+
+    def mark_overloaded(self, retry_after=None):
+        self.overloaded = True
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value):
+    """Seconds from a Retry-After header (HTTP-date form is ignored)"""
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_overload_error(error):
+    """Timeouts and 429s (including ones reported in yt-dlp messages) mean back off"""
+    if isinstance(error, (requests.Timeout, TimeoutError)):
+        return True
+    message = str(error).lower()
+    return '429' in message or 'too many requests' in message or 'timed out' in message
+
+
+def _is_transport_error(error):
+    """Connection failures and server errors (including ones in yt-dlp messages) count against the host"""
+    if isinstance(error, (requests.ConnectionError, ConnectionError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in (
+        'http error 5', 'urlopen error', 'connection', 'name resolution', 'network is unreachable'
+    ))
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_request_governor():
+    """Return the process-wide governor, creating it with YouTube host policies on first use."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            governor = RequestGovernor()
+            # Watch pages, oEmbed and yt-dlp extraction all hit www.youtube.com
+            governor.configure_host('www.youtube.com', rate=4.0, burst=6, max_concurrency=6)
+            # Thumbnails are static CDN files and tolerate more parallelism
+            governor.configure_host('img.youtube.com', rate=20.0, burst=20, max_concurrency=8)
+            _governor = governor
+        return _governor
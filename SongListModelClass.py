@@ -0,0 +1,132 @@
+class SongListModel:
+    def __init__(self, key_func=None):
+        """Ordered list of songs addressable by key (videoId by default).
+
+        Listeners are called as listener(event, **details) with event one of:
+            'reset'  (songs)
+            'insert' (index, key, song)
+            'remove' (index, key, song)
+            'update' (index, key, song)
+            'move'   (old_index, new_index, key, song)
+        """
+        self.key_func = key_func or (lambda song: song.get('videoId'))
+        self._order = []
+        self._songs = {}
+        # key -> index, valid for indexes below self._positions_valid_to
+        self._positions = {}
+        self._positions_valid_to = 0
+        self._listeners = []
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event, **details):
+        for listener in list(self._listeners):
+            try:
+                listener(event, **details)
+            except Exception as e:
+                print(f"[DEBUG] Song list listener failed on {event}: {e}")
+
+    def _invalidate_from(self, index):
+        """Positions at or after index have shifted"""
+        self._positions_valid_to = min(self._positions_valid_to, index)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, key):
+        return key in self._songs
+
+    def keys(self):
+        return list(self._order)
+
+    def songs(self):
+        return [self._songs[key] for key in self._order]
+
+    def get(self, key):
+        return self._songs.get(key)
+
+    def at(self, index):
+        return self._songs[self._order[index]]
+
+    def index_of(self, key):
+        """Index of key, or -1. Positions are re-indexed lazily after edits."""
+        if key not in self._songs:
+            return -1
+        index = self._positions.get(key)
+        if index is not None and index < self._positions_valid_to and self._order[index] == key:
+            return index
+        # Re-index the stale tail once; later lookups are O(1) again
+        for i in range(self._positions_valid_to, len(self._order)):
+            self._positions[self._order[i]] = i
+        self._positions_valid_to = len(self._order)
+        return self._positions[key]
+
+    def reset(self, songs):
+        """Replace the whole list (duplicate keys keep their first position)"""
+        self._order = []
+        self._songs = {}
+        for song in songs:
+            key = self.key_func(song)
+            if key is None or key in self._songs:
+                continue
+            self._order.append(key)
+            self._songs[key] = song
+        self._positions = {key: i for i, key in enumerate(self._order)}
+        self._positions_valid_to = len(self._order)
+        self._notify('reset', songs=self.songs())
+
+    def insert(self, index, song):
+        """Insert a song at index; an existing song with the same key is updated instead"""
+        key = self.key_func(song)
+        if key in self._songs:
+            self.update(song)
+            return self.index_of(key)
+        index = max(0, min(index, len(self._order)))
+        self._order.insert(index, key)
+        self._songs[key] = song
+        self._invalidate_from(index)
+        self._notify('insert', index=index, key=key, song=song)
+        return index
+
+    def append(self, song):
+        return self.insert(len(self._order), song)
+
+    def remove(self, key):
+        """Remove a song by key; returns the removed song or None"""
+        if key not in self._songs:
+            return None
+        index = self.index_of(key)
+        self._order.pop(index)
+        song = self._songs.pop(key)
+        self._positions.pop(key, None)
+        self._invalidate_from(index)
+        self._notify('remove', index=index, key=key, song=song)
+        return song
+
+    def update(self, song):
+        """Replace the data for an existing key without changing its position"""
+        key = self.key_func(song)
+        if key not in self._songs:
+            return False
+        self._songs[key] = song
+        self._notify('update', index=self.index_of(key), key=key, song=song)
+        return True
+
+    def move(self, key, new_index):
+        """Move a song to new_index"""
+        if key not in self._songs:
+            return False
+        old_index = self.index_of(key)
+        new_index = max(0, min(new_index, len(self._order) - 1))
+        if old_index == new_index:
+            return True
+        self._order.pop(old_index)
+        self._order.insert(new_index, key)
+        self._invalidate_from(min(old_index, new_index))
+        self._notify('move', old_index=old_index, new_index=new_index, key=key, song=self._songs[key])
+        return True
@@ -0,0 +1,261 @@
+import atexit
+import collections
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+# A heartbeat later than this (beyond its interval) counts as a stall and its stack is captured
+STALL_THRESHOLD_MS = float(os.environ.get('HANYAMUSIC_STALL_MS', '250'))
+
+# Smallest lag recorded in the histogram
+MIN_LAG_MS = 50
+
+# Histogram bucket upper bounds in ms; the last bucket is open-ended
+BUCKETS_MS = (100, 250, 500, 1000, 2000, 5000)
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that do I/O on behalf of screens; stalls are attributed to their caller
+SERVICE_MODULES = ('FirebaseClass.py', 'InMemoryFirestoreClass.py', 'RequestGovernorClass.py')
+
+
+class StallWatchdog:
+    def __init__(self, root, heartbeat_ms=200, stall_threshold_ms=STALL_THRESHOLD_MS,
+                 log_path=None, max_stalls=100):
+        """Measure how late Tk runs after() callbacks and capture the stack behind long stalls.
+
+        A heartbeat is scheduled on the Tk thread every heartbeat_ms; how late it
+        runs is the time the event loop was blocked. A monitor thread notices a
+        heartbeat that is overdue by stall_threshold_ms while the stall is still
+        going on and captures the Tk thread's stack, so the report names the code
+        that blocked rather than whatever ran afterwards. Lags are kept in a
+        histogram per UI action: the app function seen on the stack, or else the
+        last user input before the stall.
+
+        Firestore and HTTP calls made on the Tk thread are counted as well (see
+        record_ui_thread_io).
+
+        Args:
+            root: Tk root window
+            heartbeat_ms: Interval between heartbeats
+            stall_threshold_ms: Lag at which a stack is captured and the stall logged
+            log_path: File export() writes to (defaults to ~/.hanyamusic_stalls.json
+                      or a fallback location)
+            max_stalls: Number of recent stalls kept with their stacks
+        """
+        self.root = root
+        self.heartbeat = heartbeat_ms / 1000
+        self.stall_threshold = stall_threshold_ms / 1000
+        self.log_path = log_path or self._find_log_path()
+        self.ui_thread_id = threading.get_ident()
+
+        self.lock = threading.Lock()
+        # action -> {'counts': [per bucket], 'total_ms', 'max_ms'}
+        self.histogram = {}
+        self.stalls = collections.deque(maxlen=max_stalls)
+        # "kind name" -> {'count', 'where'}
+        self.ui_thread_io = {}
+        self.stats = {'beats': 0, 'lags': 0, 'stalls': 0}
+
+        self._last_beat = time.monotonic()
+        self._captured = None
+        self._last_input = (0.0, None)
+        self._stop = threading.Event()
+
+    def start(self):
+        """Start the heartbeat and the monitor thread (call on the Tk thread)"""
+        for sequence in ('<ButtonPress>', '<KeyPress>'):
+            self.root.bind_all(sequence, self._on_input, add="+")
+        self._last_beat = time.monotonic()
+        self.root.after(int(self.heartbeat * 1000), self._beat)
+        threading.Thread(target=self._monitor, name="stall_watchdog", daemon=True).start()
+        atexit.register(self.export)
+        print(f"[DEBUG] Stall watchdog on (threshold {self.stall_threshold * 1000:.0f}ms, log {self.log_path})")
+
+    def stop(self):
+        self._stop.set()
+
+    def _find_log_path(self):
+        """First writable location, in the same order the session file uses"""
+        locations = [
+            os.path.join(os.path.expanduser("~"), ".hanyamusic_stalls.json"),
+            os.path.join(tempfile.gettempdir(), "hanyamusic_stalls.json"),
+            os.path.join(os.getcwd(), ".hanyamusic_stalls.json")
+        ]
+        for location in locations:
+            directory = os.path.dirname(location) or "."
+            if os.access(directory, os.W_OK):
+                return location
+        return None
+
+    # Tk thread
+
+    def _on_input(self, event):
+        widget = event.widget if isinstance(event.widget, str) else type(event.widget).__name__
+        self._last_input = (time.monotonic(), f"{event.type} on {widget}")
+
+    def _beat(self):
+        if self._stop.is_set():
+            return
+        now = time.monotonic()
+        lag = now - self._last_beat - self.heartbeat
+        with self.lock:
+            captured, self._captured = self._captured, None
+            self._last_beat = now
+            self.stats['beats'] += 1
+        if lag * 1000 >= MIN_LAG_MS:
+            self._record(lag, captured)
+        try:
+            self.root.after(int(self.heartbeat * 1000), self._beat)
+        except Exception:
+            # The root window is gone
+            pass
+
+    def _record(self, lag, captured):
+        lag_ms = lag * 1000
+        stack = captured['stack'] if captured else None
+        action = captured['action'] if captured else self._input_action(time.monotonic() - lag)
+        bucket = len(BUCKETS_MS)
+        for i, bound in enumerate(BUCKETS_MS):
+            if lag_ms < bound:
+                bucket = i
+                break
+        with self.lock:
+            entry = self.histogram.setdefault(action, {'counts': [0] * (len(BUCKETS_MS) + 1),
+                                                       'total_ms': 0.0, 'max_ms': 0.0})
+            entry['counts'][bucket] += 1
+            entry['total_ms'] += lag_ms
+            entry['max_ms'] = max(entry['max_ms'], lag_ms)
+            self.stats['lags'] += 1
+            if lag >= self.stall_threshold:
+                self.stats['stalls'] += 1
+                self.stalls.append({'at': time.time() - lag, 'ms': round(lag_ms), 'action': action, 'stack': stack})
+        if lag >= self.stall_threshold:
+            print(f"[DEBUG] UI stall of {lag_ms:.0f}ms in {action}")
+
+    def _input_action(self, stall_started):
+        """The last user input if it came shortly before the stall"""
+        at, action = self._last_input
+        if action is not None and stall_started - at < 1.0:
+            return action
+        return "background"
+
+    # Monitor thread
+
+    def _monitor(self):
+        interval = min(self.heartbeat, self.stall_threshold) / 2
+        while not self._stop.wait(interval):
+            with self.lock:
+                overdue = time.monotonic() - self._last_beat - self.heartbeat
+                if overdue < self.stall_threshold or self._captured is not None:
+                    continue
+            frame = sys._current_frames().get(self.ui_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.format_stack(frame)
+            captured = {'stack': stack, 'action': self._action_from_stack(frame)}
+            with self.lock:
+                # Only if the heartbeat has not run in the meantime
+                if time.monotonic() - self._last_beat - self.heartbeat >= self.stall_threshold:
+                    self._captured = captured
+
+    def _action_from_stack(self, frame, include_service=True):
+        """Innermost app function on the stack, e.g. 'searchscreen.py:_add_card'.
+
+        When it is inside a service module the screen code that called it is
+        named first: 'main.py:load_playlists > FirebaseClass.py:get_user_playlists'.
+        """
+        service = None
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if os.path.dirname(filename) == APP_DIR and filename != os.path.abspath(__file__):
+                name = f"{os.path.basename(filename)}:{frame.f_code.co_name}"
+                if os.path.basename(filename) not in SERVICE_MODULES:
+                    return f"{name} > {service}" if service and include_service else name
+                if service is None:
+                    service = name
+            frame = frame.f_back
+        return service or "tk"
+
+    # UI-thread I/O
+
+    def record_ui_thread_io(self, kind, name):
+        """Count a blocking call if it is made on the Tk thread"""
+        if threading.get_ident() != self.ui_thread_id:
+            return
+        key = f"{kind} {name}"
+        where = self._action_from_stack(sys._getframe(1), include_service=False)
+        with self.lock:
+            entry = self.ui_thread_io.setdefault(key, {'count': 0, 'where': where})
+            entry['count'] += 1
+
+    # Reporting
+
+    def report(self):
+        """Histogram, recent stalls and UI-thread I/O as a JSON-serializable dict"""
+        with self.lock:
+            return {
+                'buckets_ms': [f"<{bound}" for bound in BUCKETS_MS] + [f">={BUCKETS_MS[-1]}"],
+                'histogram': {action: dict(entry, counts=list(entry['counts']))
+                              for action, entry in self.histogram.items()},
+                'stalls': list(self.stalls),
+                'ui_thread_io': {key: dict(entry) for key, entry in self.ui_thread_io.items()},
+                'stats': dict(self.stats),
+            }
+
+    def export(self, path=None):
+        """Write report() to a JSON file; returns the path or None"""
+        path = path or self.log_path
+        if not path:
+            return None
+        try:
+            temp_path = path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"[DEBUG] Could not write stall log: {e}")
+            return None
+        return path
+
+    def describe(self):
+        """Human-readable histogram, one line per action (slowest first)"""
+        report = self.report()
+        lines = [
+            f"beats={report['stats']['beats']} lags>={MIN_LAG_MS}ms={report['stats']['lags']} "
+            f"stalls>={self.stall_threshold * 1000:.0f}ms={report['stats']['stalls']} "
+            f"buckets={' '.join(report['buckets_ms'])}"
+        ]
+        for action, entry in sorted(report['histogram'].items(), key=lambda item: -item[1]['total_ms']):
+            counts = " ".join(str(count) for count in entry['counts'])
+            lines.append(f"{action}: [{counts}] total={entry['total_ms']:.0f}ms max={entry['max_ms']:.0f}ms")
+        for key, entry in report['ui_thread_io'].items():
+            lines.append(f"UI-thread I/O {key}: {entry['count']}x from {entry['where']}")
+        return "\n".join(lines)
+
+
+_watchdog = None
+
+
+def start_stall_watchdog(root):
+    """Start the process-wide watchdog on root's Tk thread (once)."""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = StallWatchdog(root)
+        _watchdog.start()
+    return _watchdog
+
+
+def get_stall_watchdog():
+    return _watchdog
+
+
+def record_ui_thread_io(kind, name):
+    """Report a blocking call to the watchdog; a no-op off the Tk thread or before it starts."""
+    watchdog = _watchdog
+    if watchdog is not None:
+        watchdog.record_ui_thread_io(kind, name)
@@ -0,0 +1,325 @@
+import customtkinter as ctk
+from LayoutCoordinatorClass import get_layout_coordinator
+
+
+class VirtualList(ctk.CTkFrame):
+    def __init__(self, parent, row_height, create_row, bind_row, buffer_rows=3, padx=15, pady=5,
+                 bg="#1a1a1a", separator_color=None, on_viewport_changed=None,
+                 autohide_scrollbar=False, bottom_padding=0, layout_rows=None, **kwargs):
+        """Scrollable list that only has widgets for the rows on screen.
+
+        Items are plain data. create_row(parent) builds one reusable row widget and
+        bind_row(row, index, item) fills it for an item. Rows are canvas windows
+        moved to index * row_height as the view scrolls; a row that scrolls out is
+        re-bound to an item scrolling in. However many items there are, the
+        widget count stays at the visible rows plus buffer_rows above and below,
+        and the scroll region covers every item so the scrollbar is exact.
+
+        Args:
+            parent: Parent widget
+            row_height: Height of every row in pixels, including padding
+            create_row: Called as create_row(parent) to build a row widget
+            bind_row: Called as bind_row(row, index, item) to show an item in a row
+            buffer_rows: Rows kept bound beyond each edge of the view
+            padx: Horizontal margin around rows
+            pady: Vertical margin around rows
+            bg: Background color
+            separator_color: If set, a line is drawn under every row
+            on_viewport_changed: Called as on_viewport_changed(first, last) with the
+                                 visible item range after scrolling or resizing
+            autohide_scrollbar: Hide the scrollbar while all items fit
+            bottom_padding: Extra scrollable space below the last item when they do not fit
+            layout_rows: Called as layout_rows(rows, width) when rows are shown at a
+                         new width (e.g. to re-wrap text); only bound rows are laid
+                         out, pooled ones catch up when they are bound again
+        """
+        super().__init__(parent, fg_color="transparent", **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.buffer_rows = buffer_rows
+        self.padx = padx
+        self.pady = pady
+        self.separator_color = separator_color
+        self.on_viewport_changed = on_viewport_changed
+        self.autohide_scrollbar = autohide_scrollbar
+        self.bottom_padding = bottom_padding
+        self.layout_rows = layout_rows
+        self._row_width = 1
+
+        self.items = []
+        # Pooled rows: {'widget', 'window', 'line', 'index', 'width'}
+        self._rows = []
+        self._bound = {}
+        self._free = []
+        self._footer = None
+        self._footer_window = None
+        self._footer_height = 40
+        self._viewport = (0, -1)
+        self.stats = {'binds': 0, 'rows_created': 0}
+        # Bind tag shared by the canvas and the widgets inside every row, so
+        # row events are handled by one binding (see bind_rows)
+        self._bindtag = f"VirtualList{id(self)}"
+        self._tag_sequences = []
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.canvas = ctk.CTkCanvas(self, bg=bg, highlightthickness=0)
+        self.scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        # Resizes are applied once per frame together with the rest of the app
+        self._layout_key = get_layout_coordinator(self).watch(self.canvas, self._on_canvas_resized)
+        self.canvas.bindtags((self._bindtag,) + self.canvas.bindtags())
+
+    # Items
+
+    def set_items(self, items):
+        """Replace all items and scroll back to the top"""
+        self.items = list(items)
+        self._release_all()
+        self.canvas.yview_moveto(0)
+        self._update_scrollregion()
+        self.update_rows()
+
+    def append_items(self, items):
+        self.items.extend(items)
+        # The previous last row gains its separator
+        for record in self._bound.values():
+            self._place(record)
+        self._update_scrollregion()
+        self.update_rows()
+
+    def insert_item(self, index, item):
+        self.items.insert(index, item)
+        self._items_shifted(index)
+
+    def remove_item(self, index):
+        self.items.pop(index)
+        self._items_shifted(index)
+
+    def move_item(self, old_index, new_index):
+        self.items.insert(new_index, self.items.pop(old_index))
+        self._items_shifted(min(old_index, new_index))
+
+    def update_item(self, index, item):
+        self.items[index] = item
+        self.refresh(index)
+
+    def _items_shifted(self, from_index):
+        """Items from from_index on changed position; re-bind the rows showing them"""
+        for index in [i for i in self._bound if i >= from_index]:
+            self._release(index)
+        # The row before may have become, or stopped being, the last one
+        if from_index - 1 in self._bound:
+            self._place(self._bound[from_index - 1])
+        self._update_scrollregion()
+        self.update_rows()
+
+    def refresh(self, index=None):
+        """Re-bind the row showing index (all bound rows if None) after its item changed"""
+        for bound_index, record in list(self._bound.items()):
+            if index is None or bound_index == index:
+                self.bind_row(record['widget'], bound_index, self.items[bound_index])
+                self.stats['binds'] += 1
+
+    def bound_rows(self):
+        """(index, row widget) for every row currently bound to an item"""
+        return [(index, record['widget']) for index, record in self._bound.items()]
+
+    def row_for_index(self, index):
+        """The row widget showing index, or None if it is not bound"""
+        record = self._bound.get(index)
+        return record['widget'] if record is not None else None
+
+    def index_at(self, x_root, y_root):
+        """Index of the item whose row is at a screen position, or None (gaps, outside)"""
+        x = x_root - self.canvas.winfo_rootx()
+        y = y_root - self.canvas.winfo_rooty()
+        if not (self.padx <= x < self.canvas.winfo_width() - self.padx and 0 <= y < self.canvas.winfo_height()):
+            return None
+        y = self.canvas.canvasy(y)
+        index = int(y // self.row_height)
+        offset = y - index * self.row_height
+        if not (0 <= index < len(self.items)) or not (self.pady <= offset < self.row_height - self.pady):
+            return None
+        return index
+
+    def bind_rows(self, sequence, handler):
+        """Call handler(event, index) for sequence anywhere over the list.
+
+        One binding on a bind tag carried by the canvas and every widget inside
+        the rows (buttons excluded; they handle their own clicks), rather than
+        one per widget per row. index is the item under the pointer, hit-tested
+        from its y position, or None over the gaps and outside the rows.
+        """
+        self.canvas.bind_class(
+            self._bindtag, sequence,
+            lambda event: handler(event, self.index_at(event.x_root, event.y_root))
+        )
+        self._tag_sequences.append(sequence)
+
+    def _tag_row_widgets(self, widget):
+        """Give widget and its descendants the list's bind tag, skipping buttons"""
+        if isinstance(widget, ctk.CTkButton):
+            return
+        widget.bindtags((self._bindtag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._tag_row_widgets(child)
+
+    def destroy(self):
+        get_layout_coordinator().unwatch(self._layout_key)
+        for sequence in self._tag_sequences:
+            self.canvas.unbind_class(self._bindtag, sequence)
+        super().destroy()
+
+    def visible_range(self):
+        """(first, last) indexes of the items currently in view; last < first when empty"""
+        return self._viewport
+
+    def set_footer(self, text=None, text_color="#FFFFFF"):
+        """Show a line of text after the last item (None removes it)"""
+        if text is None:
+            if self._footer is not None:
+                self.canvas.delete(self._footer_window)
+                self._footer.destroy()
+                self._footer = None
+                self._footer_window = None
+            self._update_scrollregion()
+            return
+        if self._footer is None:
+            self._footer = ctk.CTkLabel(self.canvas, font=ctk.CTkFont(size=14))
+            self._footer_window = self.canvas.create_window(
+                0, 0, window=self._footer, anchor="nw", height=self._footer_height
+            )
+        self._footer.configure(text=text, text_color=text_color)
+        self._update_scrollregion()
+
+    # Layout
+
+    def _content_height(self):
+        return len(self.items) * self.row_height + (self._footer_height if self._footer else 0)
+
+    def _update_scrollregion(self):
+        width = max(self.canvas.winfo_width(), 1)
+        height = self._content_height()
+        fits = height <= self.canvas.winfo_height()
+        if not fits:
+            height += self.bottom_padding
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+        if self.autohide_scrollbar:
+            if fits:
+                self.scrollbar.grid_remove()
+            else:
+                self.scrollbar.grid()
+        if self._footer is not None:
+            self.canvas.coords(self._footer_window, 0, len(self.items) * self.row_height)
+            self.canvas.itemconfigure(self._footer_window, width=width)
+
+    def _on_canvas_resized(self, width, height):
+        self._row_width = max(width - 2 * self.padx, 1)
+        for record in self._bound.values():
+            self._place(record)
+        self._layout([record for record in self._bound.values() if record['width'] != self._row_width])
+        self._update_scrollregion()
+        self.update_rows()
+
+    def _layout(self, records):
+        """Size rows for the current width and let the owner lay them out"""
+        if not records:
+            return
+        for record in records:
+            self.canvas.itemconfigure(record['window'], width=self._row_width)
+            record['width'] = self._row_width
+        if self.layout_rows:
+            self.layout_rows([record['widget'] for record in records], self._row_width)
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.update_rows()
+
+    def update_rows(self):
+        """Bind rows for the items in view (plus the buffer) and release the rest"""
+        if not self.items:
+            self._release_all()
+            self._set_viewport(0, -1)
+            return
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first_visible = max(0, int(top // self.row_height))
+        last_visible = min(len(self.items) - 1, int((top + height) // self.row_height))
+        first = max(0, first_visible - self.buffer_rows)
+        last = min(len(self.items) - 1, last_visible + self.buffer_rows)
+
+        for index in [i for i in self._bound if i < first or i > last]:
+            self._release(index)
+        for index in range(first, last + 1):
+            if index not in self._bound:
+                self._bind(index)
+        self._set_viewport(first_visible, last_visible)
+
+    def _set_viewport(self, first, last):
+        if (first, last) == self._viewport:
+            return
+        self._viewport = (first, last)
+        if self.on_viewport_changed:
+            self.on_viewport_changed(first, last)
+
+    def _new_row(self):
+        widget = self.create_row(self.canvas)
+        self._tag_row_widgets(widget)
+        window = self.canvas.create_window(
+            self.padx, 0, window=widget, anchor="nw",
+            height=self.row_height - 2 * self.pady, state="hidden"
+        )
+        line = None
+        if self.separator_color:
+            line = self.canvas.create_line(0, 0, 0, 0, fill=self.separator_color, state="hidden")
+        record = {'widget': widget, 'window': window, 'line': line, 'index': None, 'width': None}
+        self._rows.append(record)
+        self.stats['rows_created'] += 1
+        return record
+
+    def _bind(self, index):
+        record = self._free.pop() if self._free else self._new_row()
+        record['index'] = index
+        self._bound[index] = record
+        self.bind_row(record['widget'], index, self.items[index])
+        self.stats['binds'] += 1
+        if record['width'] != self._row_width:
+            self._layout([record])
+        self._place(record)
+
+    def _place(self, record):
+        """Move a bound row (and its separator) to its item's position"""
+        index = record['index']
+        y = index * self.row_height
+        self.canvas.coords(record['window'], self.padx, y + self.pady)
+        self.canvas.itemconfigure(record['window'], state="normal")
+        if record['line'] is not None:
+            width = self.canvas.winfo_width()
+            if index < len(self.items) - 1:
+                bottom = y + self.row_height - 0.5
+                self.canvas.coords(record['line'], self.padx + 5, bottom, width - self.padx - 5, bottom)
+                self.canvas.itemconfigure(record['line'], state="normal")
+            else:
+                self.canvas.itemconfigure(record['line'], state="hidden")
+
+    def _release(self, index):
+        record = self._bound.pop(index)
+        record['index'] = None
+        self.canvas.itemconfigure(record['window'], state="hidden")
+        if record['line'] is not None:
+            self.canvas.itemconfigure(record['line'], state="hidden")
+        self._free.append(record)
+
+    def _release_all(self):
+        for index in list(self._bound):
+            self._release(index)
+
+    def describe(self):
+        """One-line debug readout"""
+        first, last = self._viewport
+        return (f"items={len(self.items)} rows={len(self._rows)} bound={len(self._bound)} "
+                f"visible={first}-{last} binds={self.stats['binds']}")
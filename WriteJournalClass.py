@@ -0,0 +1,347 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from google.api_core import exceptions as google_exceptions
+from google.auth import exceptions as google_auth_exceptions
+from FirebaseClass import get_firebase_manager
+
+# Per playlist operation, errors meaning its result is already in place: the add
+# landed before (a retry after a lost acknowledgement), or the song or its
+# playlist is already gone for a remove. Nothing left to do for these.
+ALREADY_APPLIED = {
+    'playlist_add': (google_exceptions.AlreadyExists,),
+    'playlist_remove': (google_exceptions.NotFound,),
+}
+
+# Errors that mean the write can never succeed as recorded, e.g. NotFound for a
+# song added to a playlist that was deleted on another device
+PERMANENT_ERRORS = (
+    google_exceptions.InvalidArgument,
+    google_exceptions.PermissionDenied,
+    google_exceptions.FailedPrecondition,
+    google_exceptions.NotFound,
+)
+
+# Errors from an unreachable or overloaded backend; the entry is retried with
+# backoff. Anything else (e.g. an AttributeError from a bug) would fail the same
+# way on every retry, so it is treated as permanent too.
+TRANSIENT_ERRORS = (
+    google_exceptions.GoogleAPIError,
+    google_auth_exceptions.TransportError,
+    OSError,
+)
+
+
+class WriteJournal:
+    def __init__(self, firebase_manager, path=None, flush_delay=0.3, max_backoff=60.0, persistent=True):
+        """Durable queue of like and playlist-song mutations, flushed to Firestore in the background.
+
+        Callers apply a change to local state first and append it here; the UI
+        never waits on the network. Entries survive restarts (one JSON object per
+        line) and are removed once Firestore has accepted them. Entries that can
+        never be applied are moved to a .parked file next to the journal and
+        sent to subscribers, so the UI can undo what it showed.
+
+        Subscribers are called as callback(event, entries) with event 'parked'
+        and the journal entries that were given up on.
+
+        Args:
+            firebase_manager: FirebaseManager used to apply entries
+            path: Journal file (defaults to ~/.hanyamusic_journal or a fallback location)
+            flush_delay: Seconds to wait after a change so a burst of clicks goes out as one batch
+            max_backoff: Longest wait between retries while offline
+            persistent: False keeps entries in memory only (no journal file)
+        """
+        self.firebase = firebase_manager
+        self.path = (path or self._find_journal_path()) if persistent else None
+        self.flush_delay = flush_delay
+        self.max_backoff = max_backoff
+
+        self.lock = threading.Lock()
+        self._entries = self._load()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self.online = True
+        self._subscribers = []
+        self.stats = {'appended': 0, 'flushed': 0, 'parked': 0, 'batches': 0, 'failures': 0}
+
+        self._thread = threading.Thread(target=self._run, name="write_journal", daemon=True)
+        self._thread.start()
+        if self._entries:
+            print(f"[DEBUG] Write journal has {len(self._entries)} unsynced changes from a previous session")
+            self._wake.set()
+
+    def _find_journal_path(self):
+        """First writable location, in the same order the session file uses"""
+        locations = [
+            os.path.join(os.path.expanduser("~"), ".hanyamusic_journal"),
+            os.path.join(tempfile.gettempdir(), "hanyamusic_journal"),
+            os.path.join(os.getcwd(), ".hanyamusic_journal")
+        ]
+        for location in locations:
+            try:
+                with open(location, 'a'):
+                    pass
+                return location
+            except (PermissionError, OSError):
+                continue
+        return None
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return []
+        entries = []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A write cut short by a crash; everything before it is intact
+                        print("[DEBUG] Skipping damaged write journal line")
+        except OSError as e:
+            print(f"[DEBUG] Could not read write journal: {e}")
+        return entries
+
+    def _append_to_file(self, entry):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"[DEBUG] Could not write to journal (change kept in memory): {e}")
+
+    def _rewrite_file(self, entries):
+        """Replace the journal with the remaining entries (lock must be held)"""
+        if not self.path:
+            return
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"[DEBUG] Could not compact write journal: {e}")
+
+    def append(self, op, username, **data):
+        """Record a mutation and schedule a flush.
+
+        Args:
+            op: 'like', 'unlike', 'playlist_add' or 'playlist_remove'
+            username: Username of the user the change belongs to
+            **data: Operation fields (song, video_id, playlist_name)
+
+        Returns:
+            dict: The journal entry; its 'id' identifies it in the journal only
+                  (retries are made harmless by each write's precondition)
+        """
+        entry = dict(data, id=uuid.uuid4().hex, op=op, username=username, ts=time.time())
+        with self.lock:
+            self._entries.append(entry)
+            self._append_to_file(entry)
+        self.stats['appended'] += 1
+        self._wake.set()
+        return entry
+
+    def subscribe(self, callback, widget=None):
+        """Register for notifications about entries that could not be synced.
+
+        Args:
+            callback: Called as callback(event, entries)
+            widget: Optional Tk widget; if given, callbacks run on the Tk thread via
+                    widget.after and the subscription ends when the widget is destroyed
+
+        Returns:
+            callable: Function that removes the subscription
+        """
+        subscriber = (callback, widget)
+        with self.lock:
+            self._subscribers.append(subscriber)
+
+        def unsubscribe():
+            with self.lock:
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+        return unsubscribe
+
+    def _notify(self, event, entries):
+        with self.lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            callback, widget = subscriber
+            try:
+                if widget is None:
+                    callback(event, entries)
+                else:
+                    widget.after(0, lambda cb=callback: cb(event, entries))
+            except Exception as e:
+                # Typically a destroyed widget; stop delivering to it
+                print(f"[DEBUG] Dropping journal subscriber after error: {e}")
+                with self.lock:
+                    if subscriber in self._subscribers:
+                        self._subscribers.remove(subscriber)
+
+    def pending(self, username=None):
+        with self.lock:
+            return [e for e in self._entries if username is None or e['username'] == username]
+
+    def pending_like_overrides(self, encrypted_username):
+        """Like state per video ID from unsynced like/unlike entries of a user (latest wins)"""
+        overrides = {}
+        for entry in self.pending():
+            if self.firebase._encrypt_data(entry['username']) != encrypted_username:
+                continue
+            if entry['op'] == 'like':
+                overrides[entry['song']['videoId']] = True
+            elif entry['op'] == 'unlike':
+                overrides[entry['video_id']] = False
+        return overrides
+
+    # Flushing
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            self._wake.wait()
+            if self._stop.is_set():
+                return
+            # Let a burst of clicks accumulate into one batch
+            if self._stop.wait(self.flush_delay):
+                return
+            self._wake.clear()
+            try:
+                self._flush_once()
+                backoff = 1.0
+                self.online = True
+            except Exception as e:
+                self.stats['failures'] += 1
+                self.online = False
+                print(f"[DEBUG] Write journal flush failed ({len(self.pending())} pending), retrying in {backoff:.0f}s: {e}")
+                if self._stop.wait(backoff):
+                    return
+                backoff = min(backoff * 2, self.max_backoff)
+                self._wake.set()
+
+    def flush_now(self):
+        """Ask the background thread to flush without the usual delay"""
+        self._wake.set()
+
+    def _is_permanent(self, error):
+        return isinstance(error, PERMANENT_ERRORS) or not isinstance(error, TRANSIENT_ERRORS)
+
+    def _park(self, entries, error):
+        """Take entries that can never be applied out of the queue, keeping a copy for inspection"""
+        self.stats['parked'] += len(entries)
+        print(f"[DEBUG] Parking {len(entries)} journal entries ({entries[0]['op']} for {entries[0]['username']}): {error!r}")
+        if self.path:
+            try:
+                with open(self.path + ".parked", 'a', encoding='utf-8') as f:
+                    for entry in entries:
+                        f.write(json.dumps(dict(entry, error=repr(error))) + "\n")
+            except OSError as e:
+                print(f"[DEBUG] Could not write parked journal entries: {e}")
+        self._notify('parked', entries)
+
+    def _flush_once(self):
+        """Apply all pending entries; raises after a transient failure so the caller retries.
+
+        Each user's likes go out as one batch, independently of other users and
+        of playlist edits, so one failing batch holds nothing else back.
+        Permanent failures are parked instead of retried.
+        """
+        entries = self.pending()
+        if not entries:
+            return
+
+        done_ids = set()
+        retry_error = None
+        try:
+            # Likes are independent of each other: collapse to the final state per
+            # song and send each user's changes as a single batched write
+            likes_by_user = {}
+            for entry in entries:
+                if entry['op'] in ('like', 'unlike'):
+                    likes_by_user.setdefault(entry['username'], []).append(entry)
+            for username, like_entries in likes_by_user.items():
+                final = {}
+                for entry in like_entries:
+                    if entry['op'] == 'like':
+                        final[entry['song']['videoId']] = entry['song']
+                    else:
+                        final[entry['video_id']] = None
+                liked = [song for song in final.values() if song is not None]
+                unliked = [video_id for video_id, song in final.items() if song is None]
+                try:
+                    self.firebase.apply_like_changes(username, liked, unliked)
+                    self.stats['batches'] += 1
+                except Exception as e:
+                    if not self._is_permanent(e):
+                        retry_error = retry_error or e
+                        continue
+                    self._park(like_entries, e)
+                done_ids.update(entry['id'] for entry in like_entries)
+
+            # Playlist edits can depend on each other, so they go out in order.
+            # Each is a single write whose precondition makes a retry harmless.
+            for entry in entries:
+                if entry['op'] not in ('playlist_add', 'playlist_remove'):
+                    continue
+                try:
+                    if entry['op'] == 'playlist_add':
+                        self.firebase.apply_playlist_add(entry['username'], entry['playlist_name'], entry['song'])
+                    else:
+                        self.firebase.apply_playlist_remove(entry['username'], entry['playlist_name'], entry['video_id'])
+                except ALREADY_APPLIED[entry['op']]:
+                    pass
+                except Exception as e:
+                    if not self._is_permanent(e):
+                        # Later edits may depend on this one; retry them all in order
+                        retry_error = retry_error or e
+                        break
+                    self._park([entry], e)
+                done_ids.add(entry['id'])
+        finally:
+            if done_ids:
+                with self.lock:
+                    self._entries = [e for e in self._entries if e['id'] not in done_ids]
+                    self._rewrite_file(self._entries)
+                self.stats['flushed'] += len(done_ids)
+        if retry_error is not None:
+            raise retry_error
+
+    def describe(self):
+        """One-line debug readout"""
+        return (f"pending={len(self.pending())} online={self.online} appended={self.stats['appended']} "
+                f"flushed={self.stats['flushed']} batches={self.stats['batches']} "
+                f"parked={self.stats['parked']} failures={self.stats['failures']} path={self.path}")
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def get_write_journal():
+    """Return the shared write journal, creating it (and attaching it to the shared FirebaseManager) on first use."""
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            manager = get_firebase_manager()
+            _journal = WriteJournal(manager)
+            manager.attach_journal(_journal)
+        return _journal
@@ -0,0 +1,163 @@
+"""Per-frame cost of the AnimatedBanner gradient.
+
+Measures the gradient engine on its own (wall and CPU time per frame, no
+display needed) and, when a display is available, the full Tk frame both the
+current way (one PhotoImage paste) and the old way (one canvas rectangle per
+strip, recreated every frame).
+
+    python benchmarks/banner_benchmark.py
+    python benchmarks/banner_benchmark.py --sizes 800x200,1920x200 --frames 300
+    python benchmarks/banner_benchmark.py --engine-only
+
+Needs Pillow (and customtkinter, which BannerAnimationClass imports).
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from PIL import ImageTk  # noqa: E402
+from BannerAnimationClass import AnimatedBanner, BannerGradientEngine  # noqa: E402
+
+ANIMATION_SPEED = 1.2
+
+
+def make_engine(width, height):
+    engine = BannerGradientEngine(width, height)
+    _, colors = AnimatedBanner.get_time_based_greeting_and_colors(None)
+    engine.set_colors(colors)
+    return engine
+
+
+def frame_offsets(frame):
+    """Animation clock and sway for a frame, as AnimatedBanner.animate_banner computes them"""
+    offset = frame * ANIMATION_SPEED
+    return offset, math.sin(offset * 0.01) * 20 + math.cos(offset * 0.02) * 15
+
+
+def summarize(label, size, wall, cpu, tk_calls=None):
+    wall_ms = sorted(t * 1000 for t in wall)
+    p95 = wall_ms[min(len(wall_ms) - 1, int(len(wall_ms) * 0.95))]
+    return {
+        'path': label,
+        'size': size,
+        'mean_ms': statistics.mean(wall_ms),
+        'p95_ms': p95,
+        'cpu_ms': sum(cpu) / len(cpu) * 1000,
+        'tk_calls': tk_calls,
+    }
+
+
+def bench_engine(width, height, frames):
+    engine = make_engine(width, height)
+    wall, cpu = [], []
+    for frame in range(frames):
+        offset, sway = frame_offsets(frame)
+        start, start_cpu = time.perf_counter(), time.process_time()
+        engine.render(offset, sway)
+        wall.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - start_cpu)
+    return summarize("engine render", f"{width}x{height}", wall, cpu)
+
+
+def bench_tk_image(root, width, height, frames):
+    """Current path: render, paste into the PhotoImage shown by one canvas item"""
+    canvas = root.banner_canvas
+    canvas.delete("all")
+    engine = make_engine(width, height)
+    photo = ImageTk.PhotoImage(engine.render(0, 0), master=canvas)
+    canvas.create_image(0, 0, image=photo, anchor="nw")
+    wall, cpu = [], []
+    for frame in range(frames):
+        offset, sway = frame_offsets(frame)
+        start, start_cpu = time.perf_counter(), time.process_time()
+        photo.paste(engine.render(offset, sway))
+        root.update_idletasks()
+        wall.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - start_cpu)
+    return summarize("tk image paste", f"{width}x{height}", wall, cpu, tk_calls=1)
+
+
+def bench_tk_rectangles(root, width, height, frames):
+    """Old path: delete everything and create one rectangle per visible strip"""
+    canvas = root.banner_canvas
+    canvas.delete("all")
+    engine = make_engine(width, height)
+    strip_width = width / engine.strips
+    wall, cpu, calls = [], [], []
+    for frame in range(frames):
+        offset, sway = frame_offsets(frame)
+        start, start_cpu = time.perf_counter(), time.process_time()
+        row, bottoms = engine.compute_strips(offset, sway)
+        canvas.delete("gradient")
+        count = 1
+        for i, bottom in enumerate(bottoms):
+            x = (i - engine.overscan) * strip_width + sway
+            if -strip_width <= x <= width + strip_width:
+                color = "#%02x%02x%02x" % tuple(row[i * 3:i * 3 + 3])
+                canvas.create_rectangle(x, -20, x + strip_width + 1, bottom,
+                                        fill=color, outline="", tags="gradient")
+                count += 1
+        root.update_idletasks()
+        wall.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - start_cpu)
+        calls.append(count)
+    return summarize("tk rectangles (old)", f"{width}x{height}", wall, cpu, tk_calls=round(statistics.mean(calls)))
+
+
+def open_display(width, height):
+    try:
+        import tkinter
+        root = tkinter.Tk()
+    except Exception as e:
+        print(f"No display, skipping the Tk measurements ({e})")
+        return None
+    root.banner_canvas = tkinter.Canvas(root, width=width, height=height, highlightthickness=0, bg="#000000")
+    root.banner_canvas.pack()
+    root.update()
+    return root
+
+
+def parse_sizes(value):
+    sizes = []
+    for part in value.split(','):
+        width, height = part.lower().split('x')
+        sizes.append((int(width), int(height)))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=parse_sizes, default=[(800, 200), (1920, 200)],
+                        help="Comma-separated WIDTHxHEIGHT banner sizes (default 800x200,1920x200)")
+    parser.add_argument('--frames', type=int, default=200, help="Frames per measurement")
+    parser.add_argument('--engine-only', action='store_true', help="Skip the Tk measurements")
+    args = parser.parse_args()
+
+    results = []
+    for width, height in args.sizes:
+        results.append(bench_engine(width, height, args.frames))
+        root = None if args.engine_only else open_display(width, height)
+        if root is not None:
+            try:
+                results.append(bench_tk_image(root, width, height, args.frames))
+                results.append(bench_tk_rectangles(root, width, height, args.frames))
+            finally:
+                root.destroy()
+
+    header = f"{'path':<22} {'size':<10} {'mean ms':>9} {'p95 ms':>8} {'cpu ms':>8} {'Tk calls':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        calls = '-' if r['tk_calls'] is None else str(r['tk_calls'])
+        print(f"{r['path']:<22} {r['size']:<10} {r['mean_ms']:>9.2f} {r['p95_ms']:>8.2f} "
+              f"{r['cpu_ms']:>8.2f} {calls:>9}")
+    print("Frame budget at the banner's 20 ms timer: 20.00 ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Offline benchmark of FirebaseManager operations against the in-memory Firestore.
+
+Seeds users of different sizes, then measures round trips, billed reads and
+writes, bytes read and wall time per operation with simulated network latency.
+
+    python benchmarks/firebase_benchmark.py
+    python benchmarks/firebase_benchmark.py --liked 10,1000 --playlists 1,200 --latency 40
+    python benchmarks/firebase_benchmark.py --json results.json
+    python benchmarks/firebase_benchmark.py --baseline results.json   # exit 1 on regressions
+
+Exits with status 1 if seeding a profile or any operation fails: a failure is
+a result (e.g. a document over Firestore's size limit), not something to skip.
+
+Needs firebase-admin installed (for the Firestore sentinel types) but no
+credentials or network.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from FirebaseClass import FirebaseManager  # noqa: E402
+from InMemoryFirestoreClass import InMemoryFirestore  # noqa: E402
+
+PASSWORD = "benchmark-password"
+SONGS_PER_PLAYLIST = 20
+
+# Counters compared against a baseline; wall time is too noisy to gate on
+GATED_METRICS = ('round_trips', 'reads', 'writes')
+
+
+def make_song(index):
+    video_id = f"vid{index:08d}"
+    return {
+        'videoId': video_id,
+        'title': f"Benchmark song number {index} (official audio)",
+        'uploader': f"Benchmark artist {index % 97}",
+        'duration': 180 + index % 120,
+        'thumbnail_url': f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """FirebaseManager logs every operation; keep the report readable"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def seed_user(backend, username, liked, playlists):
+    """Create a user with liked songs and playlists (without simulated latency)"""
+    latency, backend.latency = backend.latency, 0.0
+    try:
+        with quiet():
+            manager = FirebaseManager(backend)
+            success, result = manager.register_user(username, PASSWORD)
+            if not success:
+                raise RuntimeError(f"registration failed: {result}")
+            for start in range(0, liked, 500):
+                songs = [make_song(i) for i in range(start, min(liked, start + 500))]
+                manager.apply_like_changes(username, songs, [])
+            for p in range(playlists):
+                name = f"Playlist {p + 1}"
+                if not manager.create_playlist(username, name):
+                    raise RuntimeError(f"could not create {name}")
+                for s in range(SONGS_PER_PLAYLIST):
+                    manager.apply_playlist_add(username, name, make_song(1_000_000 + s))
+    finally:
+        backend.latency = latency
+
+
+def build_operations(username):
+    """Operation name -> function(manager, iteration); each runs once per iteration"""
+    new_song = lambda i: make_song(2_000_000 + i)
+    return {
+        'login': lambda m, i: m.verify_credentials(username, PASSWORD),
+        'like': lambda m, i: m.like_song(username, new_song(i)),
+        'unlike': lambda m, i: m.unlike_song(username, new_song(i)['videoId']),
+        'liked count': lambda m, i: m.get_liked_count(username),
+        'load liked songs': lambda m, i: m.get_user_liked_song_entries(username),
+        'list playlists': lambda m, i: m.get_user_playlists(username),
+        'add song': lambda m, i: m.add_song_to_playlist(username, "Playlist 1", new_song(i)),
+        'remove song': lambda m, i: m.remove_song_from_playlist(username, "Playlist 1", new_song(i)['videoId']),
+        'playlist songs': lambda m, i: m.get_playlist_songs(username, "Playlist 1"),
+    }
+
+
+def measure(backend, operation, repeat, cold):
+    """Average cost of one call; cold uses a fresh FirebaseManager (empty caches) per call"""
+    manager = FirebaseManager(backend)
+    totals = {'round_trips': 0, 'reads': 0, 'writes': 0, 'bytes_read': 0}
+    elapsed = 0.0
+    for i in range(repeat):
+        if cold:
+            manager = FirebaseManager(backend)
+        backend.reset_stats()
+        start = time.perf_counter()
+        with quiet():
+            operation(manager, i)
+        elapsed += time.perf_counter() - start
+        for key in totals:
+            totals[key] += backend.stats[key]
+    result = {key: value / repeat for key, value in totals.items()}
+    result['ms'] = elapsed / repeat * 1000
+    return result
+
+
+def run(args):
+    results = []
+    for liked in args.liked:
+        for playlists in args.playlists:
+            profile = f"liked={liked} playlists={playlists}"
+            backend = InMemoryFirestore(latency=args.latency / 1000, jitter=args.jitter / 1000, seed=1)
+            username = f"bench_{liked}_{playlists}"
+            try:
+                seed_user(backend, username, liked, playlists)
+            except Exception as e:
+                print(f"{profile}: seeding failed: {e}")
+                results.append({'profile': profile, 'operation': 'seed', 'error': str(e)})
+                continue
+            for name, operation in build_operations(username).items():
+                if args.only and name not in args.only:
+                    continue
+                try:
+                    result = measure(backend, operation, args.repeat, args.cold)
+                except Exception as e:
+                    results.append({'profile': profile, 'operation': name, 'error': str(e)})
+                    continue
+                results.append(dict(result, profile=profile, operation=name))
+    return results
+
+
+def print_table(results):
+    header = f"{'profile':<28} {'operation':<18} {'ms':>9} {'trips':>7} {'reads':>9} {'writes':>7} {'KiB read':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if 'error' in r:
+            print(f"{r['profile']:<28} {r['operation']:<18} FAILED: {r['error']}")
+            continue
+        print(f"{r['profile']:<28} {r['operation']:<18} {r['ms']:>9.1f} {r['round_trips']:>7.1f} "
+              f"{r['reads']:>9.1f} {r['writes']:>7.1f} {r['bytes_read'] / 1024:>10.1f}")
+
+
+def compare(results, baseline_path):
+    """Report operations whose counters grew against a saved run; returns the number of regressions"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['profile'], r['operation']): r for r in json.load(f)}
+    regressions = 0
+    for r in results:
+        old = baseline.get((r['profile'], r['operation']))
+        if old is None:
+            continue
+        if 'error' in r and 'error' not in old:
+            print(f"REGRESSION {r['profile']} {r['operation']}: now fails ({r['error']})")
+            regressions += 1
+            continue
+        if 'error' in r or 'error' in old:
+            continue
+        for metric in GATED_METRICS:
+            if r[metric] > old[metric] + 1e-9:
+                print(f"REGRESSION {r['profile']} {r['operation']}: {metric} {old[metric]:.1f} -> {r[metric]:.1f}")
+                regressions += 1
+    return regressions
+
+
+def parse_sizes(value):
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--liked', type=parse_sizes, default=[10, 100, 1000, 10000],
+                        help="Comma-separated liked-song counts (default 10,100,1000,10000)")
+    parser.add_argument('--playlists', type=parse_sizes, default=[1, 20, 200],
+                        help="Comma-separated playlist counts (default 1,20,200)")
+    parser.add_argument('--latency', type=float, default=30.0, help="Simulated round-trip latency in ms")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Extra random latency of up to this many ms")
+    parser.add_argument('--repeat', type=int, default=5, help="Calls per operation")
+    parser.add_argument('--cold', action='store_true', help="Fresh FirebaseManager (no session caches) per call")
+    parser.add_argument('--only', type=lambda v: [part.strip() for part in v.split(',')],
+                        help="Comma-separated operation names to run")
+    parser.add_argument('--json', help="Write results to this file")
+    parser.add_argument('--baseline', help="Compare against results saved with --json; exit 1 on regressions")
+    args = parser.parse_args()
+
+    results = run(args)
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    failures = [r for r in results if 'error' in r]
+    for r in failures:
+        print(f"FAILED {r['profile']} {r['operation']}: {r['error']}", file=sys.stderr)
+    regressions = compare(results, args.baseline) if args.baseline else 0
+    if failures or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
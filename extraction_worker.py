@@ -0,0 +1,70 @@
+"""Entry points run inside the extraction worker processes (see ExtractionPoolClass.py).
+
+Spawned workers import this module to unpickle their tasks, so it imports
+nothing but yt-dlp: no Tk, Firebase or app modules.
+"""
+import os
+import yt_dlp
+
+# Only these keys cross the process boundary; full yt-dlp info dicts are large
+# and pickling them would eat most of what moving the work out of process saves.
+INFO_FIELDS = (
+    'id', 'title', 'uploader', 'channel', 'duration', 'view_count',
+    'url', 'format', 'format_id', 'width', 'height', 'vcodec', 'acodec', 'abr', 'ext',
+)
+FORMAT_FIELDS = ('format_id', 'url', 'width', 'height', 'vcodec', 'acodec', 'abr', 'ext')
+
+
+def slim_info(info):
+    """Reduce a yt-dlp info dict to the fields the app uses"""
+    if not info:
+        return None
+    slim = {key: info.get(key) for key in INFO_FIELDS if key in info}
+    formats = info.get('formats') or []
+    slim['formats'] = [
+        {key: fmt.get(key) for key in FORMAT_FIELDS if key in fmt}
+        for fmt in formats
+    ]
+    return slim
+
+
+def need_cookies(error):
+    """YouTube bot checks and throttling can usually be passed with browser cookies"""
+    lower_msg = str(error).lower()
+    return ('confirm you' in lower_msg and 'bot' in lower_msg) or ('sign in to confirm' in lower_msg) or ('429' in lower_msg)
+
+
+def extract(request):
+    """Run one extraction request.
+
+    Request: {'url': str, 'opts': dict, 'cookie_browsers': list or None}
+    Response: {'ok': True, 'info': dict or None} or {'ok': False, 'error': str}
+    """
+    url = request['url']
+    opts = request['opts']
+    try:
+        try:
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                return {'ok': True, 'info': slim_info(ydl.extract_info(url, download=False))}
+        except Exception as e_first:
+            browsers = request.get('cookie_browsers') or []
+            if not browsers or not need_cookies(e_first):
+                raise
+            # Try common browsers for cookies
+            for browser_name in browsers:
+                try:
+                    cookie_opts = dict(opts)
+                    cookie_opts['cookiesfrombrowser'] = (browser_name,)
+                    with yt_dlp.YoutubeDL(cookie_opts) as ydl:
+                        return {'ok': True, 'info': slim_info(ydl.extract_info(url, download=False))}
+                except Exception:
+                    continue
+            # If all cookie attempts fail, report the original error
+            raise e_first
+    except Exception as e:
+        return {'ok': False, 'error': str(e)}
+
+
+def warm_up():
+    """Start the worker (yt-dlp is imported with this module) and report its PID"""
+    return os.getpid()
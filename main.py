@@ -1,13 +1,15 @@
 import sys, os, shutil, importlib
 sys.dont_write_bytecode = True
-importlib.invalidate_caches()
-try:
-	root = os.path.dirname(os.path.abspath(__file__))
-	for dp, dns, fns in os.walk(root):
-		if os.path.basename(dp) == '__pycache__':
-			shutil.rmtree(dp, ignore_errors=True)
-except Exception:
-	pass
+# Extraction workers re-import this module as __mp_main__: only the app clears caches
+if __name__ == "__main__":
+	importlib.invalidate_caches()
+	try:
+		root = os.path.dirname(os.path.abspath(__file__))
+		for dp, dns, fns in os.walk(root):
+			if os.path.basename(dp) == '__pycache__':
+				shutil.rmtree(dp, ignore_errors=True)
+	except Exception:
+		pass
 import customtkinter as ctk
 from PIL import Image, ImageTk
 import os
@@ -20,10 +22,17 @@ import json
 from functools import lru_cache
 import math
 from LoginClass import LoginWindow
-from FirebaseClass import FirebaseManager
+from FirebaseClass import get_firebase_manager_if_ready, init_firebase_manager, call_async, mark_ui_thread, describe_io
 from datetime import datetime
 from BannerAnimationClass import AnimatedBanner
 from SessionManagerClass import SessionManager
+from ExtractionPoolClass import get_extraction_pool
+from FirestoreMirrorClass import start_firestore_mirror, get_firestore_mirror, stop_firestore_mirror
+from WriteJournalClass import get_write_journal
+from AnimationSchedulerClass import get_animation_scheduler
+from MarqueeManagerClass import get_marquee_manager
+from StallWatchdogClass import start_stall_watchdog, get_stall_watchdog
+from LayoutCoordinatorClass import get_layout_coordinator
 
 # Setup
 ctk.set_appearance_mode("dark")
@@ -61,13 +70,15 @@ class App(ctk.CTk):
         # State
         self.menu_visible = False
         self.side_menu_visible = False
+        self.side_menu_animation = None
+        self.spinner_animation = None
+        # Playlist name -> widgets of its card, for applying mirror changes in place
+        self._playlist_card_widgets = {}
         self.search_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)  # Increased workers
         self.current_search_future = None
         self.current_search_query = ""
         self.search_delay = 200  # Reduced delay for better responsiveness
         self.after_id = None
-        self._resize_in_progress = False
-        self._resize_after_id = None
 
         # Pre-compiled regex patterns and cache
         self.duration_cache = {}
@@ -104,8 +115,30 @@ class App(ctk.CTk):
         self.create_music_player_area()
         self.create_side_menu()  # Create sidebar last so it appears on top
         
-        # Bind window events
-        self.bind('<Configure>', self._on_window_configure)
+        # Window resizes are handled in the same once-per-frame layout pass as the screens
+        get_layout_coordinator(self).watch(self, self._on_window_resized, key="window")
+        
+        # One timer drives the banner, spinner, side menu and marquees
+        get_animation_scheduler(self)
+        
+        # Debug readout of the outbound request governor (rate limits, AIMD, circuit breakers)
+        self.bind('<F12>', self.print_debug_state)
+        
+        # Firestore calls made from this thread are flagged (they belong on call_async)
+        mark_ui_thread()
+        
+        # Measure event-loop stalls (and blocking calls made on this thread)
+        start_stall_watchdog(self)
+        
+        # Load the Firebase credentials and client off the Tk thread, then start
+        # syncing any likes/playlist edits left unsynced by a previous session
+        init_firebase_manager().add_done_callback(
+            lambda future: get_write_journal().subscribe(self.on_journal_event, widget=self)
+            if future.exception() is None else None
+        )
+        
+        # Start yt-dlp extraction workers now so the first song does not wait for them
+        get_extraction_pool()
         
         # Check for existing session and auto-login
         self.after(100, self.check_existing_session)
@@ -239,33 +272,46 @@ class App(ctk.CTk):
         self.side_menu.place(relx=-0.3, rely=0, relwidth=0.2, relheight=1.0, anchor="nw")
         
         # Animate the menu sliding in
-        def animate_in(progress=0):
-            if progress <= 1.0 and self.side_menu_visible:
-                # Calculate position based on progress (-0.3 to 0.0)
-                relx = -0.3 + (0.3 * progress)
-                self.side_menu.place(relx=relx, rely=0, relwidth=0.2, relheight=1.0, anchor="nw")
-                if progress < 1.0:
-                    self.after(10, lambda: animate_in(progress + 0.1))
-        
-        animate_in()
+        progress = 0
+        def animate_in():
+            nonlocal progress
+            if progress > 1.0 or not self.side_menu_visible:
+                return False
+            # Calculate position based on progress (-0.3 to 0.0)
+            relx = -0.3 + (0.3 * progress)
+            self.side_menu.place(relx=relx, rely=0, relwidth=0.2, relheight=1.0, anchor="nw")
+            if progress >= 1.0:
+                return False
+            progress += 0.1
+        
+        self._start_side_menu_animation(animate_in)
     
     def hide_side_menu(self):
         """Hide the side menu with animation"""
         self.side_menu_visible = False
         
         # Animate the menu sliding out
-        def animate_out(progress=0):
-            if progress <= 1.0 and not self.side_menu_visible:
-                # Calculate position based on progress (0.0 to -0.3)
-                relx = -0.3 + (0.3 * (1 - progress))
-                self.side_menu.place(relx=relx, rely=0, relwidth=0.2, relheight=1.0, anchor="nw")
-                if progress < 1.0:
-                    self.after(10, lambda: animate_out(progress + 0.1))
-                else:
-                    # Hide completely when animation is done
-                    self.side_menu.place_forget()
+        progress = 0
+        def animate_out():
+            nonlocal progress
+            if progress > 1.0 or self.side_menu_visible:
+                return False
+            # Calculate position based on progress (0.0 to -0.3)
+            relx = -0.3 + (0.3 * (1 - progress))
+            self.side_menu.place(relx=relx, rely=0, relwidth=0.2, relheight=1.0, anchor="nw")
+            if progress >= 1.0:
+                # Hide completely when animation is done
+                self.side_menu.place_forget()
+                return False
+            progress += 0.1
         
-        animate_out()
+        self._start_side_menu_animation(animate_out)
+    
+    def _start_side_menu_animation(self, step):
+        """Run a slide step every 10 ms, replacing a slide still in progress"""
+        if self.side_menu_animation is not None:
+            self.side_menu_animation.cancel()
+        self.side_menu_animation = get_animation_scheduler(self).add("side menu", step, 10)
         
     def on_home_clicked(self):
         """Handle home menu item click"""
@@ -491,6 +537,7 @@ class App(ctk.CTk):
         self.update_side_menu_content()
         
         # Refresh the playlist section to show playlists instead of login prompt
+        self.start_data_mirror()
         self.load_playlists_from_firebase()
         self.refresh_playlist_section()
 
@@ -502,6 +549,7 @@ class App(ctk.CTk):
         self.session_manager.clear_session()
         
         # Clear user state
+        stop_firestore_mirror()
         self.current_user = None
         self.logged_in = False
         
@@ -535,6 +583,7 @@ class App(ctk.CTk):
         self.session_manager.clear_session()
         
         # Clear user state
+        stop_firestore_mirror()
         self.current_user = None
         self.logged_in = False
         
@@ -731,6 +780,7 @@ class App(ctk.CTk):
         # Clear existing cards
         for widget in parent_frame.winfo_children():
             widget.destroy()
+        self._playlist_card_widgets = {}
         
         # Create a horizontal scrollable frame for cards
         canvas = ctk.CTkCanvas(parent_frame, bg="#1a1a1a", highlightthickness=0)
@@ -855,59 +905,50 @@ class App(ctk.CTk):
         # Store reference to original playlist name for editing
         name_label.original_text = playlist_name
         
+        # Double click opens the playlist
+        if playlist["is_default"]:
+            open_playlist = lambda event: self.show_saved_songs_playlist()
+        else:
+            open_playlist = lambda event, p=playlist: self.show_playlist_songs(p)
+        
         # Check if text is too long and add marquee effect
         def check_and_setup_marquee():
-            # Update the widget to get accurate measurements
+            if not name_label.winfo_exists():
+                return
             name_label_container.update_idletasks()
-            name_label.update_idletasks()
             
             # Get the actual width of the container and required text width
+            # (original_text follows renames applied by on_mirror_changed)
             container_width = name_label_container.winfo_width()
-            
-            # Use a temporary label to measure text width
-            temp_label = ctk.CTkLabel(name_label_container, text=playlist_name, font=ctk.CTkFont(size=18, weight="bold"))
-            temp_label.pack()
-            temp_label.update_idletasks()
-            text_width = temp_label.winfo_reqwidth()
-            temp_label.destroy()
+            text_width = name_label.cget("font").measure(name_label.original_text)
             
             # If text is too long, start marquee effect
             if text_width > container_width and container_width > 0:
-                self.start_marquee_effect(name_label, playlist_name, container_width)
+                self.start_marquee_effect(name_label, name_label.original_text, open_playlist if self.logged_in else None)
         
         # Schedule marquee check after widget is properly rendered
         self.after(100, check_and_setup_marquee)
         
-        # Song count - use Firebase for "Saved Songs", local count for other playlists
-        if playlist["is_default"] and self.logged_in:
-            # Get count from Firebase for "Saved Songs"
-            firebase = FirebaseManager()
-            song_count = firebase.get_saved_songs_count(self.current_user)
-        else:
-            # Use local count for other playlists
-            song_count = len(playlist["songs"])
-        
+        # Song count from the cached counters; fetched in the background if unknown
+        song_count = self.get_song_count(playlist)
         count_label = ctk.CTkLabel(
             content_frame,
-            text=f"{song_count} song{'s' if song_count != 1 else ''}",
+            text=self.format_song_count(song_count),
             font=ctk.CTkFont(size=14),
             text_color="#888888"
         )
         count_label.pack(pady=(0, 15))
-        if playlist["is_default"] and self.logged_in:
-            def _update_count():
-                try:
-                    fm = FirebaseManager()
-                    cnt = fm.get_saved_songs_count(self.current_user)
-                except Exception as e:
-                    print(f"Saved songs count error: {e}")
-                    cnt = 0
-                self.after(0, lambda: count_label.configure(
-                    text=f"{cnt} song{'s' if cnt != 1 else ''}"
-                ))
-            threading.Thread(target=_update_count, daemon=True).start()
-        else:
-            count_label.configure(text=f"{len(playlist['songs'])} song{'s' if len(playlist['songs']) != 1 else ''}")
+        self._playlist_card_widgets[playlist_name] = {
+            'playlist': playlist,
+            'name_label': name_label,
+            'count_label': count_label,
+            'check_marquee': check_and_setup_marquee,
+        }
+        if song_count is None and self.logged_in:
+            call_async(
+                'get_liked_count', self.current_user, widget=count_label,
+                callback=lambda cnt: count_label.configure(text=self.format_song_count(cnt or 0))
+            )
 
         # Action buttons
         button_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
@@ -946,24 +987,13 @@ class App(ctk.CTk):
         
         # Add click functionality for playlists - bind to both card and content_frame
         if self.logged_in:
-            if playlist["is_default"]:
-                # For "Saved Songs" playlist
-                card.bind("<Double-Button-1>", lambda event: self.show_saved_songs_playlist())
-                content_frame.bind("<Double-Button-1>", lambda event: self.show_saved_songs_playlist())
-                # Also bind to individual elements
-                icon_label.bind("<Double-Button-1>", lambda event: self.show_saved_songs_playlist())
-                name_label.bind("<Double-Button-1>", lambda event: self.show_saved_songs_playlist())
-                count_label.bind("<Double-Button-1>", lambda event: self.show_saved_songs_playlist())
-                name_container.bind("<Double-Button-1>", lambda event: self.show_saved_songs_playlist())
-            else:
-                # For custom playlists
-                card.bind("<Double-Button-1>", lambda event, p=playlist: self.show_playlist_songs(p))
-                content_frame.bind("<Double-Button-1>", lambda event, p=playlist: self.show_playlist_songs(p))
-                # Also bind to individual elements
-                icon_label.bind("<Double-Button-1>", lambda event, p=playlist: self.show_playlist_songs(p))
-                name_label.bind("<Double-Button-1>", lambda event, p=playlist: self.show_playlist_songs(p))
-                count_label.bind("<Double-Button-1>", lambda event, p=playlist: self.show_playlist_songs(p))
-                name_container.bind("<Double-Button-1>", lambda event, p=playlist: self.show_playlist_songs(p))
+            card.bind("<Double-Button-1>", open_playlist)
+            content_frame.bind("<Double-Button-1>", open_playlist)
+            # Also bind to individual elements
+            icon_label.bind("<Double-Button-1>", open_playlist)
+            name_label.bind("<Double-Button-1>", open_playlist)
+            count_label.bind("<Double-Button-1>", open_playlist)
+            name_container.bind("<Double-Button-1>", open_playlist)
         
         return card
 
@@ -1037,80 +1067,20 @@ class App(ctk.CTk):
         
         entry.bind('<Escape>', on_escape)
 
-    def start_marquee_effect(self, label, original_text, container_width):
-        """Start the marquee scrolling effect for long playlist names - SCROLLS LEFT TO RIGHT"""
-        if not hasattr(self, 'marquee_jobs'):
-            self.marquee_jobs = {}
-        
-        # Stop any existing marquee for this label
-        label_id = str(label)
-        if label_id in self.marquee_jobs:
-            try:
-                self.after_cancel(self.marquee_jobs[label_id])
-            except:
-                pass
-        
-        # Add spacing for smooth scrolling
-        extended_text = "       " + original_text + "               "  # Add spaces at both ends
-        text_length = len(extended_text)
-        
-        def marquee_scroll(position=0):
-            if not label.winfo_exists():
-                return
-                
-            try:
-                # Calculate how many characters can fit
-                char_width = 10  # Approximate character width
-                max_chars = max(1, container_width // char_width)
-                
-                # Create sliding window effect - MOVING LEFT TO RIGHT
-                if position + max_chars < text_length:
-                    # Show text from current position
-                    visible_text = extended_text[position:position + max_chars]
-                    next_position = position + 1
-                else:
-                    # Reset to beginning when we reach the end
-                    visible_text = extended_text[:max_chars]
-                    next_position = 0
-                
-                label.configure(text=visible_text)
-                
-                # Schedule next frame
-                job_id = self.after(200, lambda: marquee_scroll(next_position))
-                self.marquee_jobs[label_id] = job_id
-                
-            except Exception as e:
-                # If there's an error, show truncated original text
-                try:
-                    char_width = 10
-                    max_chars = max(1, container_width // char_width)
-                    display_text = original_text[:max_chars] + "..." if len(original_text) > max_chars else original_text
-                    label.configure(text=display_text)
-                except:
-                    pass
-        
-        # Start the marquee effect
-        marquee_scroll()
+    def start_marquee_effect(self, label, original_text, on_double_click=None):
+        """Scroll a playlist name that does not fit its card (drawn over the label, which keeps its text)"""
+        get_marquee_manager(self).add(
+            label,
+            original_text,
+            font=label.cget("font"),
+            bg="#2a2a2a",  # Card background
+            fg=label.cget("text_color"),
+            on_double_click=on_double_click
+        )
 
     def stop_marquee_effect(self, label):
         """Stop the marquee effect for a specific label"""
-        if not hasattr(self, 'marquee_jobs'):
-            return
-            
-        label_id = str(label)
-        if label_id in self.marquee_jobs:
-            try:
-                self.after_cancel(self.marquee_jobs[label_id])
-                del self.marquee_jobs[label_id]
-            except:
-                pass
-        
-        # Restore original text if it exists
-        if hasattr(label, 'original_text'):
-            try:
-                label.configure(text=label.original_text)
-            except:
-                pass
+        get_marquee_manager(self).remove(label)
 
     def show_saved_songs_playlist(self):
         """Show saved songs playlist using PlaylistScreen"""
@@ -1223,12 +1193,12 @@ class App(ctk.CTk):
         if new_name and new_name != old_name:
             # Update in Firebase if user is logged in and it's not the default playlist
             if self.logged_in and not playlist["is_default"]:
-                firebase = FirebaseManager()
-                success = firebase.update_playlist_name(self.current_user, old_name, new_name)
-                if success:
-                    print(f"Updated playlist name from '{old_name}' to '{new_name}' in Firebase")
-                else:
-                    print(f"Failed to update playlist name in Firebase")
+                def renamed(success):
+                    if success:
+                        print(f"Updated playlist name from '{old_name}' to '{new_name}' in Firebase")
+                    else:
+                        print(f"Failed to update playlist name in Firebase")
+                call_async('update_playlist_name', self.current_user, old_name, new_name, widget=self, callback=renamed)
             
             # Update locally regardless of Firebase success
             playlist["name"] = new_name
@@ -1244,19 +1214,22 @@ class App(ctk.CTk):
     def add_new_playlist(self):
         """Add a new playlist and save to Firebase"""
         playlist_name = f"Playlist {self.next_playlist_number}"
+        # Reserve the number now so a second click before the save finishes gets the next one
+        self.next_playlist_number += 1
 
-        # Save to Firebase
-        firebase = FirebaseManager()
-        success = firebase.create_playlist(self.current_user, playlist_name)
-        if success:
+        def created(success):
+            if not success:
+                return
             new_playlist = {
                 "name": playlist_name,
                 "songs": [],
                 "is_default": False
             }
             self.playlists.append(new_playlist)
-            self.next_playlist_number += 1
             self.refresh_playlist_cards()
+
+        # Save to Firebase
+        call_async('create_playlist', self.current_user, playlist_name, widget=self, callback=created)
     
     def edit_playlist_name(self, index):
         """Edit playlist name"""
@@ -1321,12 +1294,12 @@ class App(ctk.CTk):
         
         # Delete from Firebase if user is logged in
         if self.logged_in:
-            firebase = FirebaseManager()
-            success = firebase.delete_playlist(self.current_user, playlist_name)
-            if success:
-                print(f"Deleted playlist '{playlist_name}' from Firebase")
-            else:
-                print(f"Failed to delete playlist '{playlist_name}' from Firebase")
+            def deleted(success):
+                if success:
+                    print(f"Deleted playlist '{playlist_name}' from Firebase")
+                else:
+                    print(f"Failed to delete playlist '{playlist_name}' from Firebase")
+            call_async('delete_playlist', self.current_user, playlist_name, widget=self, callback=deleted)
         
         # Remove the playlist locally regardless of Firebase success
         self.playlists.pop(index)
@@ -1340,6 +1313,19 @@ class App(ctk.CTk):
             return
         
         playlist = self.playlists[index]
+        if not playlist["songs"] and playlist.get("song_count") and self.logged_in:
+            # Playlist summaries do not carry songs; load them first
+            def start_playing(songs):
+                self.current_playlist = songs
+                self.current_song_index = 0
+                self.on_song_selected(songs[0], songs, 0)
+            
+            call_async(
+                'get_playlist_songs', self.current_user, playlist["name"], widget=self,
+                callback=lambda songs: songs and start_playing(songs)
+            )
+            return
+        
         if not playlist["songs"]:
             # Show empty playlist message
             print(f"Playlist '{playlist['name']}' is empty")
@@ -1433,7 +1419,7 @@ class App(ctk.CTk):
             
             count_label = ctk.CTkLabel(
                 info_frame,
-                text=f"({len(playlist['songs'])} songs)",
+                text=f"({self.format_song_count(self.get_song_count(playlist) or 0)})",
                 font=ctk.CTkFont(size=12),
                 text_color="#888888"
             )
@@ -1462,8 +1448,15 @@ class App(ctk.CTk):
     
     def show_success_message(self, message):
         """Show a temporary success message"""
+        self._show_message(message, "#1DB954")
+
+    def show_error_message(self, message):
+        """Show a temporary error message"""
+        self._show_message(message, "#FF6B6B")
+
+    def _show_message(self, message, color):
         # Create a temporary message overlay
-        msg_frame = ctk.CTkFrame(self, fg_color="#1DB954", corner_radius=10)
+        msg_frame = ctk.CTkFrame(self, fg_color=color, corner_radius=10)
         msg_frame.place(relx=0.5, rely=0.1, anchor="center")
         
         msg_label = ctk.CTkLabel(
@@ -1746,16 +1739,37 @@ class App(ctk.CTk):
         self.view_cache[view_count] = result
         return result
 
+    def _search_screen_alive(self):
+        """True while the search view is still the content of main_frame"""
+        screen = getattr(self, 'search_screen', None)
+        return screen is not None and screen.winfo_exists() and screen.master is self.main_frame
+
     def show_loading(self):
         """Show animated loading state with a modern spinner"""
-        # Clear existing widgets
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        if self._search_screen_alive():
+            # Keep the search view and its cards for the next results; cover it meanwhile
+            container = self.search_screen.show_loading_overlay()
+        else:
+            # Clear existing widgets
+            for widget in self.main_frame.winfo_children():
+                widget.destroy()
+            
+            # Create container for centered content
+            container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+            container.pack(expand=True, fill="both")
         
-        # Create container for centered content
-        container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        container.pack(expand=True, fill="both")
+        if not container.winfo_children():
+            self._build_spinner(container)
         
+        # Start the animation
+        if self.spinner_animation is not None:
+            self.spinner_animation.cancel()
+        self.spinner_animation = get_animation_scheduler(self).add(
+            "spinner", self.animate_spinner, 100, widget=self.spinner_canvas
+        )
+
+    def _build_spinner(self, container):
+        """Create the "Searching" label and spinner canvas in container"""
         # Add loading text with dot animation
         self.loading_text = ctk.CTkLabel(
             container,
@@ -1787,14 +1801,11 @@ class App(ctk.CTk):
             "#1DB954", "#1ed760", "#4dff9d", 
             "#4dff9d", "#1ed760", "#1DB954"
         ]
-        
-        # Start the animation
-        self.animate_spinner()
 
     def animate_spinner(self):
         """Animate the loading spinner"""
         if not hasattr(self, 'spinner_canvas') or not self.spinner_canvas.winfo_exists():
-            return
+            return False
             
         canvas = self.spinner_canvas
         canvas.delete("all")
@@ -1827,9 +1838,6 @@ class App(ctk.CTk):
         dots = "." * ((self.spinner_angle // 60) % 4)
         if hasattr(self, 'loading_text') and self.loading_text.winfo_exists():
             self.loading_text.configure(text=f"Searching{dots}")
-        
-        # Schedule next frame
-        self.after(100, self.animate_spinner)
 
     def add_alpha_to_hex(self, hex_color, alpha):
         """Add alpha value to a hex color"""
@@ -1866,30 +1874,45 @@ class App(ctk.CTk):
 
     def display_results(self, results):
         """Display search results"""
-        # Clear previous results
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        start = time.perf_counter()
+        if self.spinner_animation is not None:
+            self.spinner_animation.cancel()
+            self.spinner_animation = None
+        
+        reused = self._search_screen_alive() and self.search_screen.current_user == self.current_user
+        if reused:
+            # Re-bind the existing cards to the new results
+            self.search_screen.set_results(results)
+            self.search_screen.hide_loading_overlay()
+        else:
+            # Clear previous results
+            for widget in self.main_frame.winfo_children():
+                widget.destroy()
+                
+            # Create search results screen with current user
+            self.search_screen = SearchScreen(self.main_frame, results, self.load_more_results, self.current_user)
+            self.search_screen.pack(fill="both", expand=True)
             
-        # Create search results screen with current user
-        self.search_screen = SearchScreen(self.main_frame, results, self.load_more_results, self.current_user)
-        self.search_screen.pack(fill="both", expand=True)
-        
-        # Set song selection callback
-        self.search_screen.set_song_selection_callback(self.on_song_selected)
-        
-        # Set add to playlist callback
-        self.search_screen.set_add_to_playlist_callback(self.add_song_to_playlist)
-        
-        # NEW: Set playlist update callback to refresh counts
-        self.search_screen.set_playlist_update_callback(self.on_playlist_updated)
+            # Set song selection callback
+            self.search_screen.set_song_selection_callback(self.on_song_selected)
+            
+            # Set add to playlist callback
+            self.search_screen.set_add_to_playlist_callback(self.add_song_to_playlist)
+            
+            # NEW: Set playlist update callback to refresh counts
+            self.search_screen.set_playlist_update_callback(self.on_playlist_updated)
         
         # Remove focus from search bar and stop listening to keyboard
         self.focus_set()  # Move focus to main window
         self.searchbar.unbind('<KeyRelease>')
         self.search_enabled = False
         
-        # Finalize display after a short delay to ensure everything is rendered
-        self.after(100, lambda: self.finalize_display(self.search_screen))
+        if reused:
+            self.update_idletasks()
+            print(f"[DEBUG] Search results shown in {(time.perf_counter() - start) * 1000:.1f}ms (view reused)")
+        else:
+            # Finalize display after a short delay to ensure everything is rendered
+            self.after(100, lambda: self.finalize_display(self.search_screen))
     
     def on_song_selected(self, song_data, playlist, current_index):
         """Called when a song is selected from the search results"""
@@ -1949,8 +1972,8 @@ class App(ctk.CTk):
     def finalize_display(self, search_screen):
         """Finalize display setup after UI is rendered"""
         try:
-            # Update scroll region
-            search_screen.canvas.configure(scrollregion=search_screen.canvas.bbox("all"))
+            # Bind cards for the now-known canvas size
+            search_screen.results_list.update_rows()
             search_screen.canvas.update_idletasks()
             
             # Force a single update to ensure everything is drawn
@@ -1959,20 +1982,8 @@ class App(ctk.CTk):
         except Exception as e:
             print(f"Error finalizing display: {e}")
 
-    def _on_window_configure(self, event):
-        """Handle window resize events with debounce"""
-        # Only handle resize events for the main window, not child widgets
-        if event.widget == self:
-            if not self._resize_in_progress:
-                self._resize_in_progress = True
-                if self._resize_after_id:
-                    self.after_cancel(self._resize_after_id)
-                self._resize_after_id = self.after(100, self._process_resize)
-    
-    def _process_resize(self):
-        """Process window resize - update menu position if visible"""
-        self._resize_in_progress = False
-        
+    def _on_window_resized(self, width, height):
+        """Process window resize (once per frame) - update menu position if visible"""
         # Update user menu position if visible
         if self.user_menu_visible:
             self.update_user_menu_position()
@@ -2060,6 +2071,7 @@ class App(ctk.CTk):
             self.update_side_menu_content()
             
             # Refresh the playlist section to show playlists
+            self.start_data_mirror()
             self.load_playlists_from_firebase()
             self.refresh_playlist_section()
             
@@ -2072,8 +2084,24 @@ class App(ctk.CTk):
             self.next_playlist_number = 1
             return
 
-        firebase = FirebaseManager()
-        playlists = firebase.get_user_playlists(self.current_user)
+        # Read from the snapshot mirror once it has its initial data; until then
+        # fetch in the background and keep what is shown
+        mirror = get_firestore_mirror(self.current_user)
+        if mirror and mirror.is_ready():
+            self.set_playlists(mirror.get_playlists())
+            return
+        if not self.playlists:
+            self.set_playlists(None)
+        username = self.current_user
+
+        def loaded(playlists):
+            if self.logged_in and self.current_user == username:
+                self.set_playlists(playlists)
+                self.refresh_playlist_cards()
+        call_async('get_user_playlists', username, widget=self, callback=loaded)
+
+    def set_playlists(self, playlists):
+        """Show "Saved Songs" followed by the given custom playlists (None: none known yet)"""
         # Always add "Saved Songs" as the first playlist
         saved_songs_playlist = {
             "name": "Saved Songs",
@@ -2090,6 +2118,122 @@ class App(ctk.CTk):
             self.playlists = [saved_songs_playlist]
             self.next_playlist_number = 1
 
+    def start_data_mirror(self):
+        """Start mirroring the user's playlists and liked songs from Firestore"""
+        mirror = start_firestore_mirror(self.current_user)
+        if mirror is not None:
+            mirror.subscribe(self.on_mirror_changed, widget=self)
+
+    def get_song_count(self, playlist):
+        """Song count for a playlist card without a Firestore read.
+
+        Saved Songs uses the FirebaseManager's liked count (None until known);
+        other playlists use their maintained song_count counter.
+        """
+        if playlist.get("is_default"):
+            if not self.logged_in:
+                return len(playlist["songs"])
+            manager = get_firebase_manager_if_ready()
+            return manager.get_liked_count(self.current_user, load=False) if manager else None
+        return playlist.get("song_count", len(playlist["songs"]))
+
+    def format_song_count(self, count):
+        if count is None:
+            return ""
+        return f"{count} song{'s' if count != 1 else ''}"
+
+    def on_mirror_changed(self, event, delta):
+        """Apply playlist/liked-song changes pushed by the Firestore mirror (Tk thread).
+
+        Counts and renames are applied to the affected card in place; only an
+        added or removed playlist rebuilds the card row.
+        """
+        if not self.logged_in:
+            return
+        if event == 'ready' or (event == 'playlists' and (delta['added'] or delta['removed'])):
+            print(f"[DEBUG] Mirror update: {event}")
+            self.on_playlist_updated()
+            return
+        if event == 'liked':
+            # Only the Saved Songs count shows liked songs on this page
+            if self.playlists and self.playlists[0].get("is_default"):
+                self._update_playlist_card("Saved Songs", count=self.get_song_count(self.playlists[0]))
+            return
+        if event != 'playlists':
+            return
+        for old_name, new_name in delta['renamed']:
+            self._update_playlist_card(old_name, name=new_name)
+        for name, count in delta['counts'].items():
+            self._update_playlist_card(name, count=count)
+
+    def on_journal_event(self, event, entries):
+        """Undo playlist adds the write journal could not sync (Tk thread).
+
+        The add was reported as done when it was queued; e.g. if the playlist
+        was deleted on another device meanwhile, say so and reload the cards.
+        """
+        if event != 'parked' or not self.logged_in:
+            return
+        adds = [e for e in entries if e['op'] == 'playlist_add' and e['username'] == self.current_user]
+        for entry in adds:
+            self.show_error_message(f"Could not add '{entry['song'].get('title')}' to '{entry['playlist_name']}'")
+        if adds:
+            self.on_playlist_updated()
+
+    def _update_playlist_card(self, playlist_name, name=None, count=None):
+        """Change one playlist's name or song count, in self.playlists and on its card"""
+        widgets = self._playlist_card_widgets.get(playlist_name)
+        if widgets is not None:
+            playlist = widgets['playlist']
+        else:
+            playlist = next((p for p in self.playlists if p["name"] == playlist_name), None)
+            if playlist is None:
+                return
+        if count is not None and not playlist.get("is_default"):
+            playlist["song_count"] = count
+        if name is not None:
+            playlist["name"] = name
+        if widgets is None or not widgets['count_label'].winfo_exists():
+            return
+        if count is not None:
+            widgets['count_label'].configure(text=self.format_song_count(count))
+        if name is not None:
+            name_label = widgets['name_label']
+            self.stop_marquee_effect(name_label)
+            name_label.configure(text=name)
+            name_label.original_text = name
+            self._playlist_card_widgets[name] = self._playlist_card_widgets.pop(playlist_name)
+            widgets['check_marquee']()
+
+    def print_debug_state(self, event=None):
+        """Print the state of shared background services to the console"""
+        from RequestGovernorClass import get_request_governor
+        print("[DEBUG] Request governor:")
+        print(get_request_governor().describe())
+        print("[DEBUG] Extraction pool:")
+        print(get_extraction_pool().describe())
+        mirror = get_firestore_mirror()
+        if mirror is not None:
+            print("[DEBUG] Firestore mirror:")
+            print(mirror.describe())
+        print("[DEBUG] Write journal:")
+        manager = get_firebase_manager_if_ready()
+        print(manager.journal.describe() if manager and manager.journal else "Not started")
+        print("[DEBUG] Firebase I/O:")
+        print(describe_io())
+        print("[DEBUG] Animations:")
+        print(get_animation_scheduler(self).describe())
+        print(get_marquee_manager(self).describe())
+        print("[DEBUG] Layout passes:")
+        print(get_layout_coordinator(self).describe())
+        if hasattr(self, 'search_screen') and self.search_screen.winfo_exists():
+            print(f"[DEBUG] Search results list: {self.search_screen.results_list.describe()}")
+        watchdog = get_stall_watchdog()
+        if watchdog is not None:
+            print("[DEBUG] UI stalls:")
+            print(watchdog.describe())
+            print(f"[DEBUG] Stall log written to {watchdog.export()}")
+
     def __del__(self):
         """Cleanup when app is destroyed"""
         if hasattr(self, 'search_executor'):
@@ -2099,7 +2243,7 @@ class App(ctk.CTk):
         """Called when a playlist is updated (song added/removed)"""
         print("Playlist updated - refreshing playlist data")
         
-        # Reload playlists from Firebase to get updated counts
+        # Reload playlists (from the mirror's memory once it is ready)
         self.load_playlists_from_firebase()
         
         # Only refresh the playlist cards if we're currently showing the main frame
@@ -2110,4 +2254,5 @@ class App(ctk.CTk):
 
 if __name__ == "__main__":
     app = App()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()
+    get_extraction_pool().shutdown()
\ No newline at end of file
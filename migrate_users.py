@@ -0,0 +1,18 @@
+"""One-off migration: move user documents to hashed-username document IDs.
+
+Accounts registered before user documents were keyed by hashed username live
+under auto-generated IDs. Logins migrate those lazily; this script moves all of
+them at once. It is safe to run more than once.
+
+    python migrate_users.py
+"""
+from FirebaseClass import get_firebase_manager
+
+
+def main():
+    firebase = get_firebase_manager()
+    firebase.migrate_users()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,8 @@ from io import BytesIO
 import threading
 import time
 import vlc
-import yt_dlp
 import pygame
+from ExtractionPoolClass import get_extraction_pool, ExtractionError
 
 class MusicPlayerContainer(ctk.CTkFrame):
     def __init__(self, parent, song_data, playlist=None, current_index=0, *args, **kwargs):
@@ -104,30 +104,14 @@ class MusicPlayerContainer(ctk.CTkFrame):
                 
                 youtube_url = f"https://www.youtube.com/watch?v={video_id}"
                 
-                # Extract audio stream URL with cookie fallbacks if YouTube challenges
-                def extract_with_cookies(url: str):
-                    # First try without cookies
-                    try:
-                        with yt_dlp.YoutubeDL(base_ydl_opts) as ydl:
-                            return ydl.extract_info(url, download=False)
-                    except Exception as e_first:
-                        lower_msg = str(e_first).lower()
-                        need_cookies = ('confirm you' in lower_msg and 'bot' in lower_msg) or ('sign in to confirm' in lower_msg) or ('429' in lower_msg)
-                        if not need_cookies:
-                            raise
-                        # Try common browsers for cookies
-                        for browser_name in ['edge', 'chrome', 'chromium', 'brave', 'firefox']:
-                            try:
-                                opts = dict(base_ydl_opts)
-                                opts['cookiesfrombrowser'] = (browser_name,)
-                                with yt_dlp.YoutubeDL(opts) as ydl:
-                                    return ydl.extract_info(url, download=False)
-                            except Exception:
-                                continue
-                        # If all cookie attempts fail, re-raise the original
-                        raise e_first
-
-                info = extract_with_cookies(youtube_url)
+                # Extract audio stream URL in a worker process (with cookie fallbacks if YouTube challenges)
+                info = get_extraction_pool().extract(
+                    youtube_url,
+                    base_ydl_opts,
+                    cookie_browsers=['edge', 'chrome', 'chromium', 'brave', 'firefox']
+                )
+                if not info or not info.get('url'):
+                    raise ExtractionError("No stream URL returned")
                 self.stream_url = info['url']
                 self.total_duration = info.get('duration', 0)
                 print(f"Loaded stream for: {info.get('title', 'Unknown Title')}")
@@ -587,84 +571,85 @@ class MusicPlayerContainer(ctk.CTkFrame):
                 'merge_output_format': 'mp4',
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
-                    info = ydl.extract_info(youtube_url, download=False)
-                    if not info:
-                        raise Exception("No video info returned")
-                        
-                    # If we got merged format info
-                    if 'url' in info:
-                        print(f"Selected format: {info.get('format', 'Unknown')} - {info.get('width', 'Unknown')}x{info.get('height', 'Unknown')}")
-                        return info['url']
-                    
-                    # If we need to pick from individual formats
-                    formats = info.get('formats', [])
-                    if not formats:
-                        raise Exception("No formats available")
-                    
-                    # Try to find best video format with these priorities:
-                    # 1. 1080p with any codec
-                    # 2. 720p as fallback
-                    # 3. Any video format
-                    
-                    video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('url')]
-                    
-                    if not video_formats:
-                        raise Exception("No video formats found")
-                    
-                    # Sort by height (descending) and prefer certain codecs
-                    def format_score(fmt):
-                        height = fmt.get('height', 0) or 0
-                        width = fmt.get('width', 0) or 0
-                        vcodec = fmt.get('vcodec', '') or ''
-                        
-                        score = height * 1000 + width
-                        
-                        # Prefer certain codecs (small bonus)
-                        if 'avc' in vcodec or 'h264' in vcodec:
-                            score += 50
-                        elif 'vp9' in vcodec:
-                            score += 30
-                        elif 'av01' in vcodec:
-                            score += 20
-                        
-                        return score
+            # Extraction and format sorting run in a worker process so the Tk thread keeps the GIL
+            pool = get_extraction_pool()
+            try:
+                info = pool.extract(youtube_url, ydl_opts)
+                if not info:
+                    raise Exception("No video info returned")
                     
-                    video_formats.sort(key=format_score, reverse=True)
+                # If we got merged format info
+                if 'url' in info:
+                    print(f"Selected format: {info.get('format', 'Unknown')} - {info.get('width', 'Unknown')}x{info.get('height', 'Unknown')}")
+                    return info['url']
+                
+                # If we need to pick from individual formats
+                formats = info.get('formats', [])
+                if not formats:
+                    raise Exception("No formats available")
+                
+                # Try to find best video format with these priorities:
+                # 1. 1080p with any codec
+                # 2. 720p as fallback
+                # 3. Any video format
+                
+                video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('url')]
+                
+                if not video_formats:
+                    raise Exception("No video formats found")
+                
+                # Sort by height (descending) and prefer certain codecs
+                def format_score(fmt):
+                    height = fmt.get('height', 0) or 0
+                    width = fmt.get('width', 0) or 0
+                    vcodec = fmt.get('vcodec', '') or ''
                     
-                    # Pick the best format
-                    best_format = video_formats[0]
-                    print(f"Selected video format: {best_format.get('format_id', 'Unknown')} - "
-                        f"{best_format.get('width', 'Unknown')}x{best_format.get('height', 'Unknown')} "
-                        f"({best_format.get('vcodec', 'Unknown codec')})")
+                    score = height * 1000 + width
                     
-                    return best_format['url']
+                    # Prefer certain codecs (small bonus)
+                    if 'avc' in vcodec or 'h264' in vcodec:
+                        score += 50
+                    elif 'vp9' in vcodec:
+                        score += 30
+                    elif 'av01' in vcodec:
+                        score += 20
                     
-                except Exception as e:
-                    print(f"Error in primary format selection: {e}")
+                    return score
+                
+                video_formats.sort(key=format_score, reverse=True)
+                
+                # Pick the best format
+                best_format = video_formats[0]
+                print(f"Selected video format: {best_format.get('format_id', 'Unknown')} - "
+                    f"{best_format.get('width', 'Unknown')}x{best_format.get('height', 'Unknown')} "
+                    f"({best_format.get('vcodec', 'Unknown codec')})")
+                
+                return best_format['url']
+                
+            except Exception as e:
+                print(f"Error in primary format selection: {e}")
+                
+                # Fallback: try even simpler format selection
+                try:
+                    ydl_opts['format'] = 'best[height<=720]/best'
+                    info = pool.extract(youtube_url, ydl_opts)
+                    if info and 'url' in info:
+                        print("Using fallback format (720p or best available)")
+                        return info['url']
                     
-                    # Fallback: try even simpler format selection
-                    try:
-                        ydl_opts['format'] = 'best[height<=720]/best'
-                        info = ydl.extract_info(youtube_url, download=False)
-                        if info and 'url' in info:
-                            print("Using fallback format (720p or best available)")
-                            return info['url']
+                    # Last resort: just get any video format
+                    formats = info.get('formats', []) if info else []
+                    video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('url')]
+                    if video_formats:
+                        fallback_format = video_formats[0]
+                        print(f"Using last resort format: {fallback_format.get('format_id', 'Unknown')}")
+                        return fallback_format['url']
                         
-                        # Last resort: just get any video format
-                        formats = info.get('formats', []) if info else []
-                        video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('url')]
-                        if video_formats:
-                            fallback_format = video_formats[0]
-                            print(f"Using last resort format: {fallback_format.get('format_id', 'Unknown')}")
-                            return fallback_format['url']
-                            
-                    except Exception as fallback_error:
-                        print(f"Fallback format selection failed: {fallback_error}")
+                except Exception as fallback_error:
+                    print(f"Fallback format selection failed: {fallback_error}")
+                
+                return None
                     
-                    return None
-                        
         except Exception as e:
             print(f"Error getting video URL: {e}")
             return None
@@ -3,15 +3,27 @@ from PIL import Image, ImageTk
 import requests
 from io import BytesIO
 import threading
-import yt_dlp
 import re
 import json
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from FirebaseClass import FirebaseManager
+from FirebaseClass import get_firebase_manager, call_async
+from EnhancementSchedulerClass import EnhancementScheduler
+from RequestGovernorClass import get_request_governor, CircuitOpenError
+from ExtractionPoolClass import get_extraction_pool
+from SongListModelClass import SongListModel
+from FirestoreMirrorClass import get_firestore_mirror
+from VirtualListClass import VirtualList
 import time
 import asyncio
 import aiohttp
 
+# Height of one song row, including the margin around its card
+ROW_HEIGHT = 115
+
+# Decoded thumbnails kept per screen; older ones are downloaded again if scrolled back to
+THUMBNAIL_CACHE_SIZE = 200
+
 class PlaylistScreen(ctk.CTkFrame):
     def __init__(self, parent, current_user, song_selection_callback, playlist_name="Saved Songs", back_callback=None, *args, **kwargs):
         print(f"[DEBUG] PlaylistScreen.__init__ called with playlist_name: {playlist_name}")
@@ -26,18 +38,24 @@ class PlaylistScreen(ctk.CTkFrame):
         print(f"[DEBUG] current_user: {current_user}")
         print(f"[DEBUG] firebase_manager: {self.firebase_manager}")
         
-        # Track window resize state
-        self._resize_in_progress = False
-        self._resize_after_id = None
-        
         # Song data cache with better structure
         self.song_data_cache = {}
         self.loading_songs = False
         
         # Optimized thread pool with more workers for faster parallel processing
         self.executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="song_loader")
+        
+        # Background metadata enhancement ranked by distance from the visible rows
+        self.enhancement_scheduler = EnhancementScheduler(self._enhance_song, rate=3.0, burst=3, max_workers=2, name="song_enhancer")
+        self._viewport_update_pending = False
         self.bind("<Destroy>", self._on_destroy)
         
+        # Shared per-host rate limiter / circuit breaker for all outbound YouTube requests
+        self.governor = get_request_governor()
+        
+        # yt-dlp extractions run in worker processes so they do not hold the Tk thread's GIL
+        self.extraction_pool = get_extraction_pool()
+        
         # Session for connection reuse
         self.session = requests.Session()
         self.session.headers.update({
@@ -60,6 +78,13 @@ class PlaylistScreen(ctk.CTkFrame):
         # Create content area
         self.create_content_area()
         
+        # Apply adds/removes pushed by the Firestore mirror without reloading
+        self._mirror_unsubscribe = None
+        self._watched_mirror = None
+        mirror = get_firestore_mirror(self.current_user) if self.current_user else None
+        if mirror is not None:
+            self._mirror_unsubscribe = mirror.subscribe(self._on_mirror_changed, widget=self)
+        
         # Load songs based on playlist type
         if self.playlist_name == "Saved Songs":
             self.load_liked_songs()
@@ -120,74 +145,55 @@ class PlaylistScreen(ctk.CTkFrame):
     def create_content_area(self):
         """Create the content area for displaying songs"""
         print("[DEBUG] create_content_area called")
-        # Create a frame to hold the canvas and scrollbar
-        self.canvas_container = ctk.CTkFrame(self.main_container, fg_color="transparent")
-        self.canvas_container.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
-        self.canvas_container.grid_rowconfigure(0, weight=1)
-        self.canvas_container.grid_columnconfigure(0, weight=1)
-        
-        # Create canvas with scrollbar
-        self.canvas = ctk.CTkCanvas(
-            self.canvas_container,
-            bg="#1a1a1a",
-            highlightthickness=0
-        )
-        
-        self.scrollbar = ctk.CTkScrollbar(
-            self.canvas_container,
-            orientation="vertical",
-            command=self.canvas.yview
-        )
-        
-        self.scrollable_frame = ctk.CTkFrame(
-            self.canvas,
-            fg_color="transparent"
-        )
-        
-        # Configure the scrollable frame
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(
-                scrollregion=self.canvas.bbox("all")
-            )
+        # Only the rows in view (plus a few either side) exist as widgets; they
+        # are re-bound to other songs as the list scrolls, so opening and
+        # scrolling cost the same for 20 songs or 2,000
+        self.song_list = VirtualList(
+            self.main_container,
+            row_height=ROW_HEIGHT,
+            create_row=self._create_song_row,
+            bind_row=self._bind_song_row,
+            separator_color="#333333",
+            on_viewport_changed=lambda first, last: self._schedule_viewport_update(),
+            autohide_scrollbar=True,
+            bottom_padding=60,
+            layout_rows=self._layout_song_rows
         )
-        
-        # Pack the canvas and scrollbar
-        self.canvas.grid(row=0, column=0, sticky="nsew")
-        self.scrollbar.grid(row=0, column=1, sticky="ns")
-        
-        # Create window in canvas for the scrollable frame
-        self.canvas_window = self.canvas.create_window(
-            (0, 0),
-            window=self.scrollable_frame,
-            anchor="nw",
-            tags=("scrollable_frame",)
-        )
-        
-        # Configure canvas scrolling
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.song_list.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
+        self.canvas = self.song_list.canvas
+        self.scrollbar = self.song_list.scrollbar
         
         # Mouse wheel binding for scrolling
         self._bind_mousewheel_events()
         
-        # Bind events
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-        self.bind("<Configure>", self._on_window_configure)
+        # Loading/empty/error view laid over the list
+        self._state_container = None
+        
+        # Thumbnails by videoId, most recently shown last
+        self._thumbnails = OrderedDict()
+        self._thumbnails_loading = set()
+        self._thumbnails_failed = set()
+        # videoIds bound to a row right now; read by loader threads to skip rows
+        # that scrolled away before their turn
+        self._shown_video_ids = frozenset()
         
-        # Initialize cards list
-        self.cards = []
+        # Song rows: keyed model (videoId -> song); the list mirrors its order
+        self.song_model = SongListModel()
+        self.song_model.add_listener(self._on_song_model_changed)
         print("[DEBUG] create_content_area completed")
 
     def _bind_mousewheel_events(self):
         """Bind mouse wheel events to multiple widgets for better coverage"""
         widgets_to_bind = [
-            self.main_container, self, self.canvas, self.scrollable_frame
+            self.main_container, self
         ]
         
         for widget in widgets_to_bind:
-            widget.bind("<MouseWheel>", self._on_mousewheel)
-            widget.bind("<Button-4>", self._on_mousewheel)  # Linux scroll up
-            widget.bind("<Button-5>", self._on_mousewheel)  # Linux scroll down
+            self._bind_mousewheel_to_widget(widget)
+        
+        # The canvas and every row share one delegated binding per sequence
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.song_list.bind_rows(sequence, lambda event, index: self._on_mousewheel(event))
         
         # Make sure canvas can receive focus
         self.canvas.bind("<Button-1>", lambda e: self.canvas.focus_set())
@@ -234,8 +240,12 @@ class PlaylistScreen(ctk.CTkFrame):
         
         return song_data
     
-    def fetch_song_data_batch_parallel(self, urls, max_workers=20):
-        """OPTIMIZED: Fetch song data for multiple URLs in parallel with improved duration/views extraction"""
+    def fetch_song_data_batch_parallel(self, urls):
+        """Fetch song data for multiple URLs in parallel on the screen's executor.
+        
+        Outbound requests go through the shared request governor, which limits rate
+        and concurrency per host and fails fast while YouTube is throttling us.
+        """
         def fetch_single_fast(url):
             video_id = self.extract_video_id(url)
             if not video_id:
@@ -262,7 +272,7 @@ class PlaylistScreen(ctk.CTkFrame):
                 # Method 1: oEmbed API for title and uploader
                 try:
                     oembed_url = f"https://www.youtube.com/oembed?url={url}&format=json"
-                    response = self.session.get(oembed_url, timeout=2)
+                    response = self.governor.get(self.session, oembed_url, timeout=2)
                     if response.status_code == 200:
                         data = response.json()
                         song_data['title'] = data.get('title', 'Unknown Title')[:100]
@@ -273,7 +283,8 @@ class PlaylistScreen(ctk.CTkFrame):
                 
                 # Method 2: Enhanced YouTube page scraping with multiple patterns
                 try:
-                    page_response = self.session.get(
+                    page_response = self.governor.get(
+                        self.session,
                         f"https://www.youtube.com/watch?v={video_id}", 
                         timeout=3,
                         headers={
@@ -351,15 +362,16 @@ class PlaylistScreen(ctk.CTkFrame):
                             'no_warnings': True,
                             'extract_flat': False,
                             'skip_download': True,
-                            'ignoreerrors': True,
+                            # Errors must raise so the governor sees 429s and network failures
+                            'ignoreerrors': False,
                             'noplaylist': True,
                             'socket_timeout': 8,
                             'retries': 1,
                             'fragment_retries': 0,
                             'no_check_certificate': True,
                         }
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            info = ydl.extract_info(url, download=False)
+                        with self.governor.guard('www.youtube.com'):
+                            info = self.extraction_pool.extract(url, ydl_opts)
                             if info:
                                 if needs_title:
                                     song_data['title'] = info.get('title', f'Video {video_id[:8]}')[:100]
@@ -397,13 +409,13 @@ class PlaylistScreen(ctk.CTkFrame):
                 song_data['is_loading'] = True
                 return song_data
         
-        # Process all URLs in parallel
+        # Process all URLs in parallel on the screen's own executor (no second pool);
+        # the governor decides how many of them actually reach YouTube at once
         results = []
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fast_fetch") as executor:
-            # Submit all tasks
-            future_to_url = {executor.submit(fetch_single_fast, url): url for url in urls}
-            
-            # Collect results as they complete
+        future_to_url = {self.executor.submit(fetch_single_fast, url): url for url in urls}
+        
+        # Collect results as they complete
+        try:
             for future in as_completed(future_to_url, timeout=60):
                 try:
                     result = future.result(timeout=10)
@@ -411,130 +423,166 @@ class PlaylistScreen(ctk.CTkFrame):
                         results.append(result)
                 except Exception as e:
                     print(f"[DEBUG] Future failed: {e}")
+        except Exception as e:
+            print(f"[DEBUG] Parallel fetch did not finish: {e}")
         
+        print(f"[DEBUG] Request governor state:\n{self.governor.describe()}")
         return results
     
-    def enhance_song_data_background(self, song_data_list):
-        """OPTIMIZED: Background enhancement with better yt-dlp extraction for missing data"""
-        def enhance_batch(batch):
-            for song_data in batch:
-                try:
-                    video_id = song_data['videoId']
+    def _needs_enhancement(self, song_data):
+        """Return True if any displayed field is still a placeholder"""
+        return (song_data.get('duration') == "Loading..." or
+                song_data.get('view_count') == "Loading..." or
+                song_data.get('title') == "Loading..." or
+                song_data.get('uploader') == "Loading...")
+
+    def _enhance_song(self, song_data):
+        """Fill in missing fields for one song with yt-dlp (runs on a scheduler worker)"""
+        try:
+            video_id = song_data['videoId']
+            
+            # Skip if already fully loaded
+            needs_duration = song_data.get('duration') == "Loading..."
+            needs_views = song_data.get('view_count') == "Loading..."
+            needs_title = song_data.get('title') == "Loading..."
+            needs_uploader = song_data.get('uploader') == "Loading..."
+            
+            if not (needs_duration or needs_views or needs_title or needs_uploader):
+                return
+            
+            print(f"[DEBUG] Background enhancing {video_id} with yt-dlp - needs duration: {needs_duration}, views: {needs_views}")
+            
+            # Use yt-dlp for comprehensive data extraction
+            ydl_opts = {
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': False,
+                'skip_download': True,
+                # Errors must raise so the governor sees 429s and network failures
+                'ignoreerrors': False,
+                'noplaylist': True,
+                'socket_timeout': 8,
+                'retries': 1,
+                'fragment_retries': 0,
+                'no_check_certificate': True,
+            }
+            
+            with self.governor.guard('www.youtube.com'):
+                info = self.extraction_pool.extract(song_data['url'], ydl_opts)
+                
+                if info:
+                    # Update missing fields
+                    if needs_title:
+                        song_data['title'] = info.get('title', f'Video {video_id[:8]}')[:100]
                     
-                    # Skip if already fully loaded
-                    needs_duration = song_data.get('duration') == "Loading..."
-                    needs_views = song_data.get('view_count') == "Loading..."
-                    needs_title = song_data.get('title') == "Loading..."
-                    needs_uploader = song_data.get('uploader') == "Loading..."
+                    if needs_uploader:
+                        song_data['uploader'] = info.get('uploader', info.get('channel', 'Unknown'))[:50]
                     
-                    if not (needs_duration or needs_views or needs_title or needs_uploader):
-                        continue
+                    if needs_duration:
+                        duration_seconds = info.get('duration')
+                        if duration_seconds:
+                            song_data['duration'] = self.format_duration(duration_seconds)
+                            print(f"[DEBUG] yt-dlp extracted duration for {video_id}: {song_data['duration']}")
+                        else:
+                            song_data['duration'] = "Live/Unknown"
                     
-                    print(f"[DEBUG] Background enhancing {video_id} with yt-dlp - needs duration: {needs_duration}, views: {needs_views}")
+                    if needs_views:
+                        view_count = info.get('view_count')
+                        if view_count:
+                            song_data['view_count'] = self.format_views(view_count)
+                            print(f"[DEBUG] yt-dlp extracted views for {video_id}: {song_data['view_count']}")
+                        else:
+                            song_data['view_count'] = "Views hidden"
                     
-                    # Use yt-dlp for comprehensive data extraction
-                    ydl_opts = {
-                        'quiet': True,
-                        'no_warnings': True,
-                        'extract_flat': False,
-                        'skip_download': True,
-                        'ignoreerrors': True,
-                        'noplaylist': True,
-                        'socket_timeout': 8,
-                        'retries': 1,
-                        'fragment_retries': 0,
-                        'no_check_certificate': True,
-                    }
+                    song_data['is_loading'] = False
+                    self.song_data_cache[video_id] = song_data
                     
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(song_data['url'], download=False)
-                        
-                        if info:
-                            # Update missing fields
-                            if needs_title:
-                                song_data['title'] = info.get('title', f'Video {video_id[:8]}')[:100]
-                            
-                            if needs_uploader:
-                                song_data['uploader'] = info.get('uploader', info.get('channel', 'Unknown'))[:50]
-                            
-                            if needs_duration:
-                                duration_seconds = info.get('duration')
-                                if duration_seconds:
-                                    song_data['duration'] = self.format_duration(duration_seconds)
-                                    print(f"[DEBUG] yt-dlp extracted duration for {video_id}: {song_data['duration']}")
-                                else:
-                                    song_data['duration'] = "Live/Unknown"
-                            
-                            if needs_views:
-                                view_count = info.get('view_count')
-                                if view_count:
-                                    song_data['view_count'] = self.format_views(view_count)
-                                    print(f"[DEBUG] yt-dlp extracted views for {video_id}: {song_data['view_count']}")
-                                else:
-                                    song_data['view_count'] = "Views hidden"
-                            
-                            song_data['is_loading'] = False
-                            self.song_data_cache[video_id] = song_data
-                            
-                            # Update UI immediately
-                            self.after(0, lambda data=song_data: self.update_song_card(data))
-                            
-                        else:
-                            # yt-dlp failed, set reasonable defaults
-                            if needs_duration:
-                                song_data['duration'] = "Unknown"
-                            if needs_views:
-                                song_data['view_count'] = "Views unavailable"
-                            if needs_title:
-                                song_data['title'] = f"Video {video_id[:8]}"
-                            if needs_uploader:
-                                song_data['uploader'] = "Unknown"
-                            
-                            song_data['is_loading'] = False
-                            self.after(0, lambda data=song_data: self.update_song_card(data))
-                
-                except Exception as e:
-                    print(f"[DEBUG] Background enhance failed for {song_data.get('videoId', 'unknown')}: {e}")
-                    # Set fallback values
-                    if song_data.get('duration') == "Loading...":
+                    # Update UI immediately
+                    self.after(0, lambda data=song_data: self.update_song_card(data))
+                    
+                else:
+                    # yt-dlp failed, set reasonable defaults
+                    if needs_duration:
                         song_data['duration'] = "Unknown"
-                    if song_data.get('view_count') == "Loading...":
+                    if needs_views:
                         song_data['view_count'] = "Views unavailable"
-                    if song_data.get('title') == "Loading...":
-                        song_data['title'] = f"Video {song_data.get('videoId', 'Unknown')[:8]}"
-                    if song_data.get('uploader') == "Loading...":
+                    if needs_title:
+                        song_data['title'] = f"Video {video_id[:8]}"
+                    if needs_uploader:
                         song_data['uploader'] = "Unknown"
                     
                     song_data['is_loading'] = False
                     self.after(0, lambda data=song_data: self.update_song_card(data))
         
+        except CircuitOpenError as e:
+            # YouTube is throttling us; keep the placeholders and try again once the circuit can close
+            print(f"[DEBUG] Background enhance deferred for {song_data.get('videoId', 'unknown')}: {e}")
+            self.after(int(e.retry_in * 1000) + 100, lambda: self._requeue_enhancement(song_data))
+        
+        except Exception as e:
+            print(f"[DEBUG] Background enhance failed for {song_data.get('videoId', 'unknown')}: {e}")
+            # Set fallback values
+            if song_data.get('duration') == "Loading...":
+                song_data['duration'] = "Unknown"
+            if song_data.get('view_count') == "Loading...":
+                song_data['view_count'] = "Views unavailable"
+            if song_data.get('title') == "Loading...":
+                song_data['title'] = f"Video {song_data.get('videoId', 'Unknown')[:8]}"
+            if song_data.get('uploader') == "Loading...":
+                song_data['uploader'] = "Unknown"
+            
+            song_data['is_loading'] = False
+            self.after(0, lambda data=song_data: self.update_song_card(data))
+
+    def enhance_song_data_background(self, song_data_list):
+        """Queue background enhancement, visible rows first, rate limited by token bucket"""
         # Filter songs that need enhancement
         songs_needing_enhancement = [
-            song for song in song_data_list 
-            if (song.get('duration') == "Loading..." or
-                song.get('view_count') == "Loading..." or
-                song.get('title') == "Loading..." or
-                song.get('uploader') == "Loading...")
+            song for song in song_data_list if self._needs_enhancement(song)
         ]
         
         if not songs_needing_enhancement:
             print("[DEBUG] No songs need background enhancement")
             return
         
-        print(f"[DEBUG] Starting background enhancement for {len(songs_needing_enhancement)} songs")
+        print(f"[DEBUG] Queueing background enhancement for {len(songs_needing_enhancement)} songs")
         
-        # Process in small batches to avoid overwhelming yt-dlp
-        batch_size = 3
-        
-        def process_batches():
-            for i in range(0, len(songs_needing_enhancement), batch_size):
-                batch = songs_needing_enhancement[i:i + batch_size]
-                enhance_batch(batch)
-                # Small delay between batches to be nice to YouTube
-                time.sleep(1.0)
+        # Rank by row index so the scheduler can order by distance from the viewport
+        for position, song in enumerate(songs_needing_enhancement):
+            video_id = song.get('videoId')
+            if not video_id:
+                continue
+            index = self.song_model.index_of(video_id)
+            self.enhancement_scheduler.submit(video_id, index if index >= 0 else position, song)
         
-        # Run in background thread
-        threading.Thread(target=process_batches, daemon=True).start()
+        # Rank against what is on screen right now
+        self._schedule_viewport_update()
+
+    def _requeue_enhancement(self, song_data):
+        """Put a deferred song back on the enhancement queue at its current row"""
+        video_id = song_data.get('videoId')
+        index = self.song_model.index_of(video_id)
+        if index >= 0:
+            self.enhancement_scheduler.submit(video_id, index, song_data)
+
+    def _schedule_viewport_update(self):
+        """Coalesce viewport updates into one per idle cycle"""
+        if self._viewport_update_pending:
+            return
+        self._viewport_update_pending = True
+        self.after_idle(self._update_enhancement_viewport)
+
+    def _update_enhancement_viewport(self):
+        """Tell the enhancement scheduler which rows are currently visible"""
+        self._viewport_update_pending = False
+        if len(self.song_model) == 0 or not self.winfo_exists():
+            return
+        try:
+            first, last = self.song_list.visible_range()
+            if last >= first:
+                self.enhancement_scheduler.set_viewport(first, last)
+        except Exception as e:
+            print(f"[DEBUG] Error updating enhancement viewport: {e}")
     
     def load_liked_songs(self):
         """OPTIMIZED: Load liked songs with ultra-fast display"""
@@ -555,38 +603,42 @@ class PlaylistScreen(ctk.CTkFrame):
             try:
                 if self.firebase_manager is None:
                     try:
-                        self.firebase_manager = FirebaseManager()
+                        self.firebase_manager = get_firebase_manager()
                     except Exception as e:
-                        print(f"[DEBUG] Error initializing FirebaseManager: {e}")
+                        print(f"[DEBUG] Error initializing Firebase: {e}")
                         self.after(0, lambda: self.show_error_state("Failed to initialize Firebase"))
                         return
                 
-                # Get liked URLs from Firebase
-                liked_urls = self.firebase_manager.get_user_liked_songs(self.current_user)
-                print(f"[DEBUG] Got {len(liked_urls) if liked_urls else 0} liked URLs")
+                # Get liked songs (with any stored metadata) from the mirror or Firebase
+                mirror = get_firestore_mirror(self.current_user)
+                if mirror and mirror.is_ready():
+                    liked_entries = mirror.get_liked_entries()
+                else:
+                    liked_entries = self.firebase_manager.get_user_liked_song_entries(self.current_user)
+                print(f"[DEBUG] Got {len(liked_entries) if liked_entries else 0} liked songs")
                 
-                if not liked_urls:
+                if not liked_entries:
                     self.after(0, lambda: self.show_empty_state("No liked songs yet"))
                     return
                 
-                # OPTIMIZED: Get data for all songs in parallel with higher worker count
-                print(f"[DEBUG] Starting parallel fetch for {len(liked_urls)} songs...")
+                # Only songs saved without metadata need YouTube lookups
                 fetch_start = time.time()
                 
-                instant_song_data = self.fetch_song_data_batch_parallel(liked_urls, max_workers=24)
+                instant_song_data, fetched = self._resolve_song_entries(liked_entries)
                 
                 fetch_time = time.time() - fetch_start
-                print(f"[DEBUG] Parallel fetch completed in {fetch_time:.2f}s, got {len(instant_song_data)} songs")
+                print(f"[DEBUG] Resolved {len(instant_song_data)} songs in {fetch_time:.2f}s ({len(fetched)} fetched from YouTube)")
                 
                 # Display immediately
                 display_start = time.time()
-                self.after(0, lambda: self.display_songs(instant_song_data))
+                self.after(0, lambda: self._display_and_enhance(instant_song_data))
                 display_time = time.time() - display_start
                 
                 total_time = time.time() - start_time
                 print(f"[DEBUG] Total load time: {total_time:.2f}s (fetch: {fetch_time:.2f}s, display: {display_time:.2f}s)")
                 
-                # Details are loaded synchronously; no background enhancement
+                # Store what we just fetched so the next load needs no YouTube calls
+                self._backfill_metadata(fetched, None)
                 
             except Exception as e:
                 print(f"[DEBUG] Error in load_songs_ultra_fast: {e}")
@@ -616,59 +668,48 @@ class PlaylistScreen(ctk.CTkFrame):
             try:
                 if self.firebase_manager is None:
                     try:
-                        self.firebase_manager = FirebaseManager()
+                        self.firebase_manager = get_firebase_manager()
                     except Exception as e:
-                        print(f"[DEBUG] Error initializing FirebaseManager: {e}")
+                        print(f"[DEBUG] Error initializing Firebase: {e}")
                         self.after(0, lambda: self.show_error_state("Failed to initialize Firebase"))
                         return
                 
-                # Get playlist songs from Firebase
-                playlist_songs = self.firebase_manager.get_playlist_songs(self.current_user, self.playlist_name)
+                # Watch this playlist's songs through the mirror (its first snapshot is
+                # the only read); fall back to reading the songs directly
+                playlist_songs = None
+                mirror = get_firestore_mirror(self.current_user)
+                if mirror and mirror.wait_ready(timeout=5) and mirror.watch_playlist(self.playlist_name):
+                    self._watched_mirror = mirror
+                    playlist_songs = mirror.get_playlist_songs(self.playlist_name, timeout=10)
+                if playlist_songs is None:
+                    playlist_songs = self.firebase_manager.get_playlist_songs(self.current_user, self.playlist_name)
                 print(f"[DEBUG] Got {len(playlist_songs) if playlist_songs else 0} songs from Firebase")
                 
                 if not playlist_songs:
                     self.after(0, lambda: self.show_empty_state(f"Playlist '{self.playlist_name}' is empty"))
                     return
                 
-                # Extract URLs for parallel fetching
-                urls = [song_obj['url'] for song_obj in playlist_songs if 'url' in song_obj]
+                # Only songs saved without metadata need YouTube lookups
+                print(f"[DEBUG] Resolving {len(playlist_songs)} playlist songs...")
+                fetch_start = time.time()
+                
+                instant_song_data, fetched = self._resolve_song_entries(playlist_songs)
                 
-                if not urls:
+                if not instant_song_data:
                     self.after(0, lambda: self.show_empty_state(f"No valid songs in playlist '{self.playlist_name}'"))
                     return
                 
-                # OPTIMIZED: Fetch all song data in parallel
-                print(f"[DEBUG] Starting parallel fetch for {len(urls)} playlist songs...")
-                fetch_start = time.time()
-                
-                instant_song_data = self.fetch_song_data_batch_parallel(urls, max_workers=24)
-                
                 fetch_time = time.time() - fetch_start
-                print(f"[DEBUG] Parallel fetch completed in {fetch_time:.2f}s")
-                
-                # Merge any additional data from Firebase
-                firebase_data_map = {song_obj['url']: song_obj for song_obj in playlist_songs}
-                
-                for song_data in instant_song_data:
-                    firebase_song = firebase_data_map.get(song_data['url'], {})
-                    
-                    # Only override if Firebase has better data
-                    if 'title' in firebase_song and firebase_song['title']:
-                        song_data['title'] = firebase_song['title']
-                    if 'uploader' in firebase_song and firebase_song['uploader']:
-                        song_data['uploader'] = firebase_song['uploader']
-                    if 'duration' in firebase_song and firebase_song['duration']:
-                        song_data['duration'] = firebase_song['duration']
-                    if 'added_at' in firebase_song:
-                        song_data['added_at'] = firebase_song['added_at']
+                print(f"[DEBUG] Resolved playlist songs in {fetch_time:.2f}s ({len(fetched)} fetched from YouTube)")
                 
                 total_time = time.time() - start_time
                 print(f"[DEBUG] Custom playlist load time: {total_time:.2f}s")
                 
-                # Display immediately
-                self.after(0, lambda: self.display_songs(instant_song_data))
+                # Store what we just fetched so the next load needs no YouTube calls
+                self._backfill_metadata(fetched, self.playlist_name)
                 
-                # Details are loaded synchronously; no background enhancement
+                # Display immediately; songs whose details could not be fetched are retried in the background
+                self.after(0, lambda: self._display_and_enhance(instant_song_data))
                 
             except Exception as e:
                 print(f"[DEBUG] Error in load_custom_songs_ultra_fast: {e}")
@@ -679,6 +720,124 @@ class PlaylistScreen(ctk.CTkFrame):
         # Start loading in background thread
         threading.Thread(target=load_custom_songs_ultra_fast, daemon=True).start()
 
+    def _song_data_from_entry(self, entry):
+        """Build display song data from a stored entry that already has metadata"""
+        video_id = entry.get('videoId') or self.extract_video_id(entry.get('url', ''))
+        song_data = {
+            'title': entry.get('title'),
+            'thumbnail_url': entry.get('thumbnail_url') or f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg",
+            'videoId': video_id,
+            'uploader': entry.get('uploader'),
+            'duration': entry.get('duration'),
+            'view_count': entry.get('view_count', ""),
+            'url': entry.get('url') or f"https://www.youtube.com/watch?v={video_id}",
+            'is_loading': False
+        }
+        if 'added_at' in entry:
+            song_data['added_at'] = entry['added_at']
+        self.song_data_cache[video_id] = song_data
+        return song_data
+
+    def _resolve_song_entries(self, entries):
+        """Turn stored song entries into display data, fetching only entries without metadata.
+        
+        Returns (songs in stored order, songs that had to be fetched from YouTube).
+        """
+        resolved = {}
+        missing_urls = []
+        order = []
+        for entry in entries:
+            url = entry.get('url')
+            video_id = entry.get('videoId') or (self.extract_video_id(url) if url else None)
+            if not video_id:
+                continue
+            order.append(video_id)
+            if self.firebase_manager.is_song_entry_complete(entry):
+                resolved[video_id] = self._song_data_from_entry(entry)
+            else:
+                missing_urls.append(url or f"https://www.youtube.com/watch?v={video_id}")
+        
+        fetched = []
+        if missing_urls:
+            print(f"[DEBUG] Starting parallel fetch for {len(missing_urls)} songs without stored metadata...")
+            fetched = self.fetch_song_data_batch_parallel(missing_urls)
+            for song_data in fetched:
+                resolved[song_data['videoId']] = song_data
+        
+        # Parallel fetch completes out of order; restore the stored order
+        return [resolved[video_id] for video_id in order if video_id in resolved], fetched
+
+    def _backfill_metadata(self, fetched_songs, playlist_name):
+        """Persist metadata fetched from YouTube onto entries saved without it"""
+        if not fetched_songs or not self.firebase_manager:
+            return
+        
+        call_async(
+            'backfill_song_metadata', self.current_user, fetched_songs, playlist_name,
+            errback=lambda e: print(f"[DEBUG] Metadata backfill failed: {e}")
+        )
+
+    def _on_mirror_changed(self, event, delta):
+        """Apply a change pushed by the Firestore mirror to the shown list (Tk thread)"""
+        if not self.winfo_exists():
+            return
+        if self.playlist_name == "Saved Songs":
+            if event == 'liked':
+                self._apply_entry_delta(delta['added'], delta['removed'], delta['updated'])
+            return
+        
+        if event != 'playlists':
+            return
+        for old_name, new_name in delta['renamed']:
+            if old_name == self.playlist_name:
+                self.playlist_name = new_name
+                self.playlist_name_label.configure(text=new_name)
+        if self.playlist_name in delta['removed']:
+            self.show_empty_state(f"Playlist '{self.playlist_name}' was deleted")
+            return
+        song_delta = delta['songs'].get(self.playlist_name)
+        if song_delta:
+            self._apply_entry_delta(song_delta['added'], song_delta['removed'], [])
+    
+    def _apply_entry_delta(self, added, removed, updated):
+        """Remove, update and append rows for changed stored entries"""
+        for video_id in removed:
+            if video_id in self.song_model:
+                self._remove_song_card({'videoId': video_id})
+        
+        for entry in updated:
+            if self.firebase_manager and self.firebase_manager.is_song_entry_complete(entry):
+                song_data = self._song_data_from_entry(entry)
+                if song_data['videoId'] in self.song_model:
+                    self.song_model.update(song_data)
+        
+        added = [entry for entry in added if (entry.get('videoId') or self.extract_video_id(entry.get('url', ''))) not in self.song_model]
+        if not added or self.firebase_manager is None:
+            return
+        
+        def resolve_added():
+            songs, fetched = self._resolve_song_entries(added)
+            self._backfill_metadata(fetched, None if self.playlist_name == "Saved Songs" else self.playlist_name)
+            self.after(0, lambda: self._append_songs(songs))
+        
+        threading.Thread(target=resolve_added, daemon=True).start()
+    
+    def _append_songs(self, songs):
+        """Append songs to a list that is already displayed"""
+        if not self.winfo_exists():
+            return
+        if len(self.song_model) == 0:
+            self._display_and_enhance(songs)
+            return
+        for song_data in songs:
+            self.song_model.append(song_data)
+        self.enhance_song_data_background(songs)
+    
+    def _display_and_enhance(self, song_data_list):
+        """Display songs, then queue enhancement for any still showing placeholders"""
+        self.display_songs(song_data_list)
+        self.enhance_song_data_background(song_data_list)
+
     def update_song_card(self, song_data):
         """Update a specific song card with enhanced data"""
         video_id = song_data.get('videoId')
@@ -687,40 +846,9 @@ class PlaylistScreen(ctk.CTkFrame):
         
         print(f"[DEBUG] Updating card for {video_id} with duration: {song_data.get('duration', 'N/A')}")
         
-        # Find the card to update
-        for card in self.cards:
-            if hasattr(card, '_song_data') and card._song_data.get('videoId') == video_id:
-                # Update the stored song data
-                card._song_data = song_data
-                
-                # Update the title if it exists and has changed
-                if hasattr(card, '_title') and card._title.winfo_exists():
-                    current_title = card._title.cget("text")
-                    if current_title != song_data['title'] and not song_data.get('is_loading', False):
-                        card._title.configure(text=song_data['title'])
-                
-                # Update details label with improved logic
-                if hasattr(card, '_details_label') and card._details_label.winfo_exists():
-                    details = self.build_details_text(song_data)
-                    card._details_label.configure(text=details)
-                    print(f"[DEBUG] Updated details for {video_id}: {details}")
-                else:
-                    # Fallback: find details label manually
-                    content_frame = None
-                    for child in card.winfo_children():
-                        if isinstance(child, ctk.CTkFrame) and child.cget("fg_color") == "transparent":
-                            content_frame = child
-                            break
-                    
-                    if content_frame:
-                        # Find and update details label
-                        for child in content_frame.winfo_children():
-                            if isinstance(child, ctk.CTkLabel) and child.cget("text_color") == "gray":
-                                details = self.build_details_text(song_data)
-                                child.configure(text=details)
-                                print(f"[DEBUG] Updated details text via fallback: {details}")
-                                break
-                break
+        # Keep the model current, then touch only this song's row
+        if video_id in self.song_model:
+            self.song_model.update(song_data)
     
     def build_details_text(self, song_data):
         """Build the details text for a song card - FIXED to always show available data"""
@@ -762,9 +890,7 @@ class PlaylistScreen(ctk.CTkFrame):
                 details.append("Views unavailable")
         
         if details:
-            result = " • ".join(details)
-            print(f"[DEBUG] Built details text: '{result}' for video {song_data.get('videoId', 'unknown')}")
-            return result
+            return " • ".join(details)
         elif song_data.get('is_loading', False):
             return "Loading details..."
         else:
@@ -807,12 +933,10 @@ class PlaylistScreen(ctk.CTkFrame):
         """Show loading state while fetching songs"""
         print("[DEBUG] show_loading_state called")
         # Clear existing content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_song_rows()
         
         # Create loading container
-        loading_container = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
-        loading_container.pack(expand=True, fill="both", pady=50)
+        loading_container = self._show_state_container()
         
         # Loading text
         loading_text = ctk.CTkLabel(
@@ -837,19 +961,15 @@ class PlaylistScreen(ctk.CTkFrame):
         )
         spinner.pack(expand=True)
         print("[DEBUG] show_loading_state completed")
-        # Recalculate scroll region to possibly disable scrolling when loading view is small
-        self.after_idle(self._update_scroll_region)
     
     def show_empty_state(self, message):
         """Show empty state when no songs are found"""
         print(f"[DEBUG] show_empty_state called with message: {message}")
         # Clear existing content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_song_rows()
         
         # Create empty state container
-        empty_container = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
-        empty_container.pack(expand=True, fill="both", pady=50)
+        empty_container = self._show_state_container()
         
         # Empty state icon
         empty_icon = ctk.CTkLabel(
@@ -870,19 +990,15 @@ class PlaylistScreen(ctk.CTkFrame):
         empty_text.pack(pady=10)
         
         print("[DEBUG] show_empty_state completed")
-        # Ensure scroll is disabled if content doesn't exceed canvas
-        self.after_idle(self._update_scroll_region)
 
     def show_error_state(self, message):
         """Show error state when loading fails"""
         print(f"[DEBUG] show_error_state called with message: {message}")
         # Clear existing content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_song_rows()
         
         # Create error state container
-        error_container = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
-        error_container.pack(expand=True, fill="both", pady=50)
+        error_container = self._show_state_container()
         
         # Error icon
         error_icon = ctk.CTkLabel(
@@ -903,63 +1019,71 @@ class PlaylistScreen(ctk.CTkFrame):
         error_text.pack(pady=10)
         
         print("[DEBUG] show_error_state completed")
-        # Ensure scroll is disabled if error view doesn't exceed canvas
-        self.after_idle(self._update_scroll_region)
+    
+    def _show_state_container(self):
+        """Frame over the (emptied) list for a loading, empty or error view"""
+        backdrop = ctk.CTkFrame(self.song_list, fg_color="#1a1a1a", corner_radius=0)
+        backdrop.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self._state_container = backdrop
+        container = ctk.CTkFrame(backdrop, fg_color="transparent")
+        container.pack(expand=True, fill="both", pady=50)
+        return container
     
     def display_songs(self, song_data_list):
         """Display the list of songs"""
         print(f"[DEBUG] display_songs called with {len(song_data_list)} songs")
-        # Clear existing content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Reset cards list
-        self.cards = []
-        
-        # Configure grid for scrollable frame
-        self.scrollable_frame.columnconfigure(0, weight=1)
         
         if not song_data_list:
             # Handle empty state
             self.show_empty_state("No songs found")
             return
         
-        # Create song cards
-        for idx, song_data in enumerate(song_data_list):
-            self._add_song_card(song_data, idx)
+        # Rows are bound by the model listener
+        self.song_model.reset(song_data_list)
+        print("[DEBUG] display_songs completed")
+
+    def _clear_song_rows(self):
+        """Remove any state view and every row from the list"""
+        if self._state_container is not None:
+            self._state_container.destroy()
+            self._state_container = None
+        self.song_list.set_items([])
+
+    def _on_song_model_changed(self, event, **details):
+        """Apply a model change to the list; only rows on screen are touched"""
+        if event == 'reset':
+            self._clear_song_rows()
+            self.song_list.set_items(details['songs'])
+        
+        elif event == 'insert':
+            self.song_list.insert_item(details['index'], details['song'])
         
-        # Remove the last separator if it exists
-        if len(song_data_list) > 0:
-            last_separator_row = (len(song_data_list) - 1) * 2 + 1
-            separators = self.scrollable_frame.grid_slaves(row=last_separator_row, column=0)
-            for separator in separators:
-                if isinstance(separator, ctk.CTkFrame) and separator.cget("height") == 1:
-                    separator.destroy()
+        elif event == 'remove':
+            self.song_list.remove_item(details['index'])
+            self.enhancement_scheduler.discard(details['key'])
         
-        # Update scroll region after all cards are added
-        self.after_idle(self._update_scroll_region)
-        print("[DEBUG] display_songs completed")
+        elif event == 'update':
+            self.song_list.update_item(details['index'], details['song'])
+        
+        elif event == 'move':
+            self.song_list.move_item(details['old_index'], details['new_index'])
+            self.enhancement_scheduler.update_index(details['key'], details['new_index'])
+
+    def _create_song_row(self, parent):
+        """Build one reusable song row; _bind_song_row fills it with a song.
 
-    def _add_song_card(self, song_data, idx):
-        """Create a single song card with optimized image loading"""
-        # Create main card frame with dynamic width
+        Button commands read the row's current song when clicked, so they stay
+        valid when the row is recycled.
+        """
         card = ctk.CTkFrame(
-            self.scrollable_frame,
+            parent,
             fg_color="#222222",
             corner_radius=10,
             height=100
         )
-        
-        # Store card reference and song data
-        card._title = None
-        card._details_label = None
-        card._song_data = song_data
-        
-        # Bind mouse wheel events to the card
-        self._bind_mousewheel_to_widget(card)
+        card._song_data = None
         
         # Configure grid for the card to take full width
-        card.grid(row=idx*2, column=0, sticky="nsew", padx=15, pady=5)
         card.grid_columnconfigure(1, weight=1)
         card.grid_columnconfigure(2, weight=0, minsize=70)
         card.grid_columnconfigure(3, weight=0, minsize=50)
@@ -969,93 +1093,55 @@ class PlaylistScreen(ctk.CTkFrame):
         thumb_container.grid(row=0, column=0, rowspan=2, padx=10, pady=10, sticky="nsw")
         thumb_container.grid_propagate(False)
         
-        # Bind mouse wheel to thumbnail container
-        self._bind_mousewheel_to_widget(thumb_container)
-        
         # Thumbnail label
-        thumb = ctk.CTkLabel(thumb_container, text="")
+        thumb = ctk.CTkLabel(thumb_container, text="", font=ctk.CTkFont(size=30))
         thumb.pack(expand=True, fill="both")
-        
-        # Bind mouse wheel to thumbnail label
-        self._bind_mousewheel_to_widget(thumb)
-        
-        # OPTIMIZED: Load thumbnail with connection reuse and caching
-        self._load_thumbnail_optimized(thumb, song_data['thumbnail_url'])
+        card._thumb = thumb
         
         # Content frame that expands with window
         content_frame = ctk.CTkFrame(card, fg_color="transparent")
         content_frame.grid(row=0, column=1, rowspan=2, sticky="nsew", padx=(0, 20), pady=10)
         content_frame.columnconfigure(0, weight=1)
         
-        # Bind mouse wheel to content frame
-        self._bind_mousewheel_to_widget(content_frame)
-        
-        # Title with dynamic wrapping
-        title_text = song_data['title']
-        if song_data.get('is_loading', False) and title_text == "Loading...":
-            title_text = f"Loading... (ID: {song_data.get('videoId', 'Unknown')[:8]})"
-        
+        # Title on one line, elided to the row width: rows have a fixed height
+        # (ROW_HEIGHT), so a wrapped title would be cut off
         title = ctk.CTkLabel(
             content_frame,
-            text=title_text,
+            text="",
             font=ctk.CTkFont(size=16, weight="bold"),
             anchor="w",
             justify="left",
             wraplength=0
         )
         title.grid(row=0, column=0, sticky="nsw", pady=(0, 5))
-        
-        # Bind mouse wheel to title label
-        self._bind_mousewheel_to_widget(title)
-        
         card._title = title
+        card._title_text = ""
+        card._title_width = None
         
-        # Build details text using the improved method
-        details_text = self.build_details_text(song_data)
-            
         details_label = ctk.CTkLabel(
             content_frame,
-            text=details_text,
+            text="",
             font=ctk.CTkFont(size=14),
             text_color="gray",
             anchor="w",
             justify="left"
         )
         details_label.grid(row=1, column=0, sticky="nsw")
-        
-        # Bind mouse wheel to details label
-        self._bind_mousewheel_to_widget(details_label)
-        
         card._details_label = details_label
         
         # Unlike/Remove button (different behavior for Saved Songs vs custom playlists)
-        if self.playlist_name == "Saved Songs":
-            remove_button = ctk.CTkButton(
-                card,
-                text="♥",
-                width=40,
-                height=40,
-                corner_radius=20,
-                fg_color="#FF6B6B",
-                hover_color="#FF5252",
-                text_color="#FFFFFF",
-                font=ctk.CTkFont(size=14),
-                command=lambda: self._on_remove_from_playlist_clicked(song_data, remove_button)
-            )
-        else:
-            remove_button = ctk.CTkButton(
-                card,
-                text="🗑",
-                width=40,
-                height=40,
-                corner_radius=20,
-                fg_color="#FF6B6B",
-                hover_color="#FF5252",
-                text_color="#FFFFFF",
-                font=ctk.CTkFont(size=14),
-                command=lambda: self._on_remove_from_playlist_clicked(song_data, remove_button)
-            )
-
+        remove_button = ctk.CTkButton(
+            card,
+            text="♥" if self.playlist_name == "Saved Songs" else "🗑",
+            width=40,
+            height=40,
+            corner_radius=20,
+            fg_color="#FF6B6B",
+            hover_color="#FF5252",
+            text_color="#FFFFFF",
+            font=ctk.CTkFont(size=14),
+            command=lambda: self._on_remove_from_playlist_clicked(card._song_data, remove_button)
+        )
         remove_button.grid(row=0, column=2, rowspan=2, padx=(0, 10), pady=15, sticky="nsew")
         
         # Play button (right-aligned)
@@ -1071,86 +1157,128 @@ class PlaylistScreen(ctk.CTkFrame):
             font=ctk.CTkFont(size=20, weight="bold"),
             border_width=0,
             border_spacing=0,
-            command=lambda: self._on_song_selected(song_data)
+            command=lambda: self._on_song_selected(card._song_data)
         )
         play_btn.grid(row=0, column=3, rowspan=2, padx=(0, 15), pady=15, sticky="nsew")
         
-        # Add a separator between items
-        separator = ctk.CTkFrame(
-            self.scrollable_frame,
-            height=1,
-            fg_color="#333333"
-        )
-        separator.grid(row=idx*2 + 1, column=0, sticky="ew", padx=20, pady=2)
-        
-        # Bind mouse wheel to separator too
-        self._bind_mousewheel_to_widget(separator)
-        
-        self.cards.append(card)
+        return card
+
+    def _layout_song_rows(self, cards, width):
+        """Re-elide titles for a new row width (the list calls this for shown rows only)"""
+        title_width = max(100, width - 270)
+        for card in cards:
+            card._title_width = title_width
+            self._show_title(card)
+
+    def _show_title(self, card):
+        """Show the row's title, cut to one line with an ellipsis if it is too wide"""
+        text = card._title_text
+        font = card._title.cget("font")
+        if card._title_width is not None and font.measure(text) > card._title_width:
+            # Longest prefix that fits with the ellipsis (binary search on length)
+            low, high = 0, len(text)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if font.measure(text[:middle].rstrip() + "…") <= card._title_width:
+                    low = middle
+                else:
+                    high = middle - 1
+            text = text[:low].rstrip() + "…"
+        card._title.configure(text=text)
+
+    def _bind_song_row(self, card, index, song_data):
+        """Show a song in a pooled row"""
+        card._song_data = song_data
         
-        # Update wraplength on window resize
-        def update_wraplength(event):
-            available_width = max(100, card.winfo_width() - 270)
-            title.configure(wraplength=available_width)
-            
-        card.bind('<Configure>', update_wraplength)
+        title_text = song_data['title']
+        if song_data.get('is_loading', False) and title_text == "Loading...":
+            title_text = f"Loading... (ID: {song_data.get('videoId', 'Unknown')[:8]})"
+        card._title_text = title_text
+        self._show_title(card)
+        card._details_label.configure(text=self.build_details_text(song_data))
+        self._shown_video_ids = frozenset(c._song_data.get('videoId') for _, c in self.song_list.bound_rows())
+        self._show_thumbnail(card, song_data)
 
     def _bind_mousewheel_to_widget(self, widget):
         """Helper to bind mouse wheel events to a widget"""
         widget.bind("<MouseWheel>", self._on_mousewheel)
-        widget.bind("<Button-4>", self._on_mousewheel)
-        widget.bind("<Button-5>", self._on_mousewheel)
+        widget.bind("<Button-4>", self._on_mousewheel)  # Linux scroll up
+        widget.bind("<Button-5>", self._on_mousewheel)  # Linux scroll down
 
-    def _load_thumbnail_optimized(self, thumb_label, thumbnail_url):
-        """OPTIMIZED: Load thumbnail with session reuse and better error handling"""
-        def load_image_async():
-            try:
-                # Use the shared session for connection reuse
-                response = self.session.get(thumbnail_url, timeout=3, stream=True)
-                response.raise_for_status()
-                
-                # Process image
-                img = Image.open(BytesIO(response.content))
-                img.thumbnail((120, 80), Image.Resampling.LANCZOS)
-                tk_image = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-                
-                def update_image():
-                    if thumb_label.winfo_exists():
-                        thumb_label.configure(image=tk_image)
-                        thumb_label.image = tk_image  # Keep reference
-                
-                self.after(0, update_image)
-                
-            except Exception as e:
-                print(f"[DEBUG] Error loading thumbnail {thumbnail_url}: {e}")
-                # Set a placeholder or default image
-                def set_placeholder():
-                    if thumb_label.winfo_exists():
-                        thumb_label.configure(text="🎵", font=ctk.CTkFont(size=30))
-                
-                self.after(0, set_placeholder)
+    def _show_thumbnail(self, card, song_data):
+        """Show the cached thumbnail for a row, or load it in the background"""
+        video_id = song_data.get('videoId')
+        image = self._thumbnails.get(video_id)
+        if image is not None:
+            self._thumbnails.move_to_end(video_id)
+            card._thumb.configure(image=image, text="")
+            return
+        # The row may still show the previous song's thumbnail
+        card._thumb.configure(image=self._blank_thumbnail(),
+                              text="🎵" if video_id in self._thumbnails_failed else "")
+        if video_id in self._thumbnails_loading or video_id in self._thumbnails_failed:
+            return
+        self._thumbnails_loading.add(video_id)
+        self.executor.submit(self._load_thumbnail_optimized, video_id, song_data['thumbnail_url'])
+
+    def _blank_thumbnail(self):
+        """Transparent stand-in shown while a recycled row's thumbnail loads"""
+        if getattr(self, '_blank_thumbnail_image', None) is None:
+            blank = Image.new("RGBA", (120, 80), (0, 0, 0, 0))
+            self._blank_thumbnail_image = ctk.CTkImage(light_image=blank, dark_image=blank, size=blank.size)
+        return self._blank_thumbnail_image
+
+    def _load_thumbnail_optimized(self, video_id, thumbnail_url):
+        """OPTIMIZED: Load thumbnail with session reuse and better error handling (worker thread)"""
+        if video_id not in self._shown_video_ids:
+            self.after(0, lambda: self._thumbnail_loaded(video_id, None, skipped=True))
+            return
+        tk_image = None
+        try:
+            # Use the shared session for connection reuse, paced by the request governor
+            response = self.governor.get(self.session, thumbnail_url, timeout=3)
+            response.raise_for_status()
+            
+            # Process image
+            img = Image.open(BytesIO(response.content))
+            img.thumbnail((120, 80), Image.Resampling.LANCZOS)
+            tk_image = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+        except Exception as e:
+            print(f"[DEBUG] Error loading thumbnail {thumbnail_url}: {e}")
         
-        # Submit to thread pool
-        self.executor.submit(load_image_async)
+        try:
+            self.after(0, lambda: self._thumbnail_loaded(video_id, tk_image))
+        except Exception:
+            # The screen was destroyed
+            pass
+
+    def _thumbnail_loaded(self, video_id, tk_image, skipped=False):
+        """Cache a loaded thumbnail and show it on the row bound to its song, if any"""
+        self._thumbnails_loading.discard(video_id)
+        if not self.winfo_exists():
+            return
+        if skipped:
+            # Scrolled back into view meanwhile; the loop below queues it again
+            pass
+        elif tk_image is None:
+            # Rows show a placeholder note for songs whose thumbnail failed
+            self._thumbnails_failed.add(video_id)
+        else:
+            self._thumbnails[video_id] = tk_image
+            while len(self._thumbnails) > THUMBNAIL_CACHE_SIZE:
+                self._thumbnails.popitem(last=False)
+        for _, card in self.song_list.bound_rows():
+            if card._song_data.get('videoId') == video_id:
+                self._show_thumbnail(card, card._song_data)
     
     def _on_song_selected(self, song_data):
         """Called when a song is selected from the playlist"""
         if self.song_selection_callback:
-            # Find the index of the selected song in the current results
-            current_index = 0
-            for i, card in enumerate(self.cards):
-                if hasattr(card, '_song_data') and card._song_data.get('videoId') == song_data.get('videoId'):
-                    current_index = i
-                    break
-            
-            # Get all song data from cards
-            all_songs = []
-            for card in self.cards:
-                if hasattr(card, '_song_data'):
-                    all_songs.append(card._song_data)
+            # Find the index of the selected song in the current list
+            current_index = max(0, self.song_model.index_of(song_data.get('videoId')))
             
             # Call the callback with song data, playlist, and current index
-            self.song_selection_callback(song_data, all_songs, current_index)
+            self.song_selection_callback(song_data, self.song_model.songs(), current_index)
     
     def _on_remove_from_playlist_clicked(self, song_data, remove_button):
         """Handle remove from playlist button click"""
@@ -1164,127 +1292,27 @@ class PlaylistScreen(ctk.CTkFrame):
             return
         
         if self.playlist_name == "Saved Songs":
-            # Remove from liked songs (uses unlike_song method)
-            success = self.firebase_manager.unlike_song(self.current_user, video_id)
-            if success:
-                print(f"Removed '{song_data.get('title')}' from liked songs")
-                self._remove_song_card(song_data)
-            else:
-                print(f"Failed to remove '{song_data.get('title')}' from liked songs")
+            # Unlike locally now; the write journal syncs it in the background
+            self.firebase_manager.queue_like(self.current_user, song_data, False)
+            print(f"Removed '{song_data.get('title')}' from liked songs")
+            self._remove_song_card(song_data)
         else:
-            # Remove from custom playlist (uses remove_song_from_playlist method)
-            success, message = self.firebase_manager.remove_song_from_playlist(
-                self.current_user, 
-                self.playlist_name, 
-                video_id
-            )
-            if success:
-                print(message)
-                self._remove_song_card(song_data)
-            else:
-                print(f"Failed to remove song: {message}")
+            # Remove from custom playlist through the write journal
+            message = self.firebase_manager.queue_playlist_remove(self.current_user, self.playlist_name, video_id)
+            print(message)
+            self._remove_song_card(song_data)
     
     def _remove_song_card(self, song_data):
         """Remove a song card from the UI"""
-        # Find and remove the card
-        for i, card in enumerate(self.cards):
-            if hasattr(card, '_song_data') and card._song_data.get('videoId') == song_data.get('videoId'):
-                # Remove the card and its separator
-                card.destroy()
-                self.cards.pop(i)
-                
-                # Remove separator if it exists
-                separator = self.scrollable_frame.grid_slaves(row=i*2 + 1, column=0)
-                if separator:
-                    separator[0].destroy()
-                
-                # Update the remaining cards' grid positions
-                for j in range(i, len(self.cards)):
-                    self.cards[j].grid(row=j*2, column=0, sticky="nsew", padx=15, pady=5)
-                    # Update separator position for remaining cards
-                    if j < len(self.cards) - 1:
-                        # Find the separator that should be at position j*2 + 1
-                        separators_to_move = self.scrollable_frame.grid_slaves(row=(j+1)*2 + 1, column=0)
-                        for sep in separators_to_move:
-                            if isinstance(sep, ctk.CTkFrame) and sep.cget("height") == 1:
-                                sep.grid(row=j*2 + 1, column=0, sticky="ew", padx=20, pady=2)
-                
-                # Check if we should show empty state
-                if len(self.cards) == 0:
-                    if self.playlist_name == "Saved Songs":
-                        self.show_empty_state("No liked songs yet")
-                    else:
-                        self.show_empty_state(f"Playlist '{self.playlist_name}' is empty")
-                else:
-                    # Update scroll region after removal
-                    self.after_idle(self._update_scroll_region)
-                break
-    
-    def _on_canvas_configure(self, event):
-        """Update the canvas window width when the canvas is resized"""
-        if self._resize_in_progress:
+        if self.song_model.remove(song_data.get('videoId')) is None:
             return
-            
-        if event.width > 1:  # Ensure we have a valid width
-            self.canvas.itemconfig("scrollable_frame", width=event.width)
-            
-            # Update scroll region after configuring width
-            self.after_idle(self._update_scroll_region)
-    
-    def _update_scroll_region(self):
-        """Enable scrolling only when content truly exceeds the canvas height."""
-        try:
-            # Force layout calculations
-            self.scrollable_frame.update_idletasks()
-
-            # Use canvas bbox for precise content height
-            bbox = self.canvas.bbox("all")
-            content_height_raw = (bbox[3] - bbox[1]) if bbox else 0
-            canvas_height = self.canvas.winfo_height()
-
-            # Allow a small margin so an item at the bottom can still scroll up
-            margin = 2
-            bottom_padding = 60  # extra space only when content overflows
-
-            if content_height_raw <= max(0, canvas_height - margin):
-                # Content fits – disable scrolling
-                self.canvas.configure(scrollregion=(0, 0, 0, 0))
-                self.scrollbar.grid_remove()
-                print("[DEBUG] Content fits, scrolling disabled but events remain bound")
+        
+        # Check if we should show empty state
+        if len(self.song_model) == 0:
+            if self.playlist_name == "Saved Songs":
+                self.show_empty_state("No liked songs yet")
             else:
-                # Content exceeds canvas – enable scrolling, add bottom padding
-                if bbox:
-                    padded_bbox = (bbox[0], bbox[1], bbox[2], bbox[3] + bottom_padding)
-                    self.canvas.configure(scrollregion=padded_bbox)
-                self.scrollbar.grid(row=0, column=1, sticky="ns")
-                print("[DEBUG] Content exceeds canvas, scrolling enabled")
-
-        except Exception as e:
-            print(f"[DEBUG] Error updating scroll region: {e}")
-
-    def _on_window_configure(self, event):
-        """Handle window resize with debounce"""
-        if self._resize_after_id:
-            self.after_cancel(self._resize_after_id)
-            
-        self._resize_after_id = self.after(200, self._process_resize)
-    
-    def _process_resize(self):
-        """Process resize after a short delay to prevent excessive updates"""
-        self._resize_in_progress = True
-        try:
-            # Update card layouts first
-            for card in self.cards:
-                if hasattr(card, '_title') and card._title.winfo_exists():
-                    available_width = max(100, card.winfo_width() - 220)
-                    card._title.configure(wraplength=available_width)
-            
-            # Then update scroll region
-            self._update_scroll_region()
-            
-        finally:
-            self._resize_in_progress = False
-            self._resize_after_id = None
+                self.show_empty_state(f"Playlist '{self.playlist_name}' is empty")
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling with better logic"""
@@ -1331,6 +1359,16 @@ class PlaylistScreen(ctk.CTkFrame):
     
     def _on_destroy(self, event=None):
         """Cleanup when the object is destroyed"""
+        if getattr(self, '_mirror_unsubscribe', None):
+            self._mirror_unsubscribe()
+            self._mirror_unsubscribe = None
+        if getattr(self, '_watched_mirror', None):
+            self._watched_mirror.unwatch_playlist(self.playlist_name)
+            self._watched_mirror = None
+        
+        if hasattr(self, 'enhancement_scheduler'):
+            self.enhancement_scheduler.stop()
+        
         if hasattr(self, 'executor'):
             try:
                 self.executor.shutdown(wait=False)
@@ -2,27 +2,60 @@ import customtkinter as ctk
 from PIL import Image, ImageTk
 import requests
 from io import BytesIO
-import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from playerClass import MusicPlayerContainer
-from FirebaseClass import FirebaseManager
+from FirebaseClass import get_firebase_manager_if_ready, call_async
+from RequestGovernorClass import get_request_governor
+from FirestoreMirrorClass import get_firestore_mirror
+from VirtualListClass import VirtualList
+
+# Height of one result row, including the margin around its card
+ROW_HEIGHT = 120
+
+# Decoded thumbnails kept in memory; older ones are downloaded again if scrolled back to
+THUMBNAIL_CACHE_SIZE = 200
+
+# videoId -> CTkImage, most recently shown last (Tk thread only)
+_thumbnail_cache = OrderedDict()
+_thumbnail_executor = None
+_blank_thumbnail = None
+
+
+def _get_thumbnail_executor() -> ThreadPoolExecutor:
+    global _thumbnail_executor
+    if _thumbnail_executor is None:
+        _thumbnail_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search_thumbs")
+    return _thumbnail_executor
+
+
+def _get_blank_thumbnail():
+    """Transparent stand-in shown while a recycled card's thumbnail loads"""
+    global _blank_thumbnail
+    if _blank_thumbnail is None:
+        blank = Image.new("RGBA", (120, 80), (0, 0, 0, 0))
+        _blank_thumbnail = ctk.CTkImage(light_image=blank, dark_image=blank, size=blank.size)
+    return _blank_thumbnail
+
 
 class SearchScreen(ctk.CTkFrame):
     def __init__(self, parent, results, load_more_callback=None, current_user=None, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
-        self.results = results
+        self.results = list(results)
         self.load_more_callback = load_more_callback
         self.current_user = current_user
-        self.firebase_manager = FirebaseManager() if current_user else None
         self.loading_more = False
         self.no_more_results = False
+        # Bumped by set_results so pages requested for an earlier query are dropped
+        self._generation = 0
+        self._loading_overlay = None
         self.configure(fg_color="transparent")
         
-        # Track window resize state
-        self._resize_in_progress = False
-        self._resize_after_id = None
-        
-        # Selection state and colors
+        # Selection state and colors; the selection follows the song, not the
+        # pooled card that happens to show it
         self._selected_card = None
+        self._selected_video_id = None
+        self._hover_index = None
         self._card_color_default = "#222222"
         self._card_color_hover = "#333333"
         self._card_color_selected = "#444444"
@@ -41,62 +74,45 @@ class SearchScreen(ctk.CTkFrame):
         self.main_container.grid_rowconfigure(0, weight=1)
         self.main_container.grid_columnconfigure(0, weight=1)
         
-        # Create a frame to hold the canvas and scrollbar
-        self.canvas_container = ctk.CTkFrame(self.main_container, fg_color="transparent")
-        self.canvas_container.grid(row=0, column=0, sticky="nsew")
-        self.canvas_container.grid_rowconfigure(0, weight=1)
-        self.canvas_container.grid_columnconfigure(0, weight=1)
-        
-        # Create canvas with scrollbar
-        self.canvas = ctk.CTkCanvas(
-            self.canvas_container,
-            bg="#1a1a1a",
-            highlightthickness=0
-        )
-        
-        self.scrollbar = ctk.CTkScrollbar(
-            self.canvas_container,
-            orientation="vertical",
-            command=self.canvas.yview
-        )
-        
-        self.scrollable_frame = ctk.CTkFrame(
-            self.canvas,
-            fg_color="transparent"
-        )
-        
-        # Configure the scrollable frame
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(
-                scrollregion=self.canvas.bbox("all")
-            )
-        )
-        
-        # Pack the canvas and scrollbar
-        self.canvas.grid(row=0, column=0, sticky="nsew")
-        self.scrollbar.grid(row=0, column=1, sticky="ns")
-        
-        # Create window in canvas for the scrollable frame
-        self.canvas_window = self.canvas.create_window(
-            (0, 0),
-            window=self.scrollable_frame,
-            anchor="nw",
-            tags=("scrollable_frame",)
+        # Only the cards in view (plus a few either side) exist as widgets; they
+        # are re-bound to other results as the list scrolls
+        self.results_list = VirtualList(
+            self.main_container,
+            row_height=ROW_HEIGHT,
+            create_row=self._create_card,
+            bind_row=self._bind_card,
+            separator_color="#333333",
+            layout_rows=self._layout_cards
         )
+        self.results_list.grid(row=0, column=0, sticky="nsew")
+        self.canvas = self.results_list.canvas
+        self.scrollbar = self.results_list.scrollbar
         
-        # Configure canvas scrolling
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # Hover, select and context menu for all cards: one delegated handler
+        # each, hit-testing the row under the pointer by its y position
+        for sequence in ("<Enter>", "<Motion>", "<Leave>"):
+            self.results_list.bind_rows(sequence, self._on_results_pointer)
+        self.results_list.bind_rows("<Button-1>", self._on_results_click)
+        self.results_list.bind_rows("<Button-3>", self._on_results_right_click)
         
         # Bind events
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-        self.bind("<Configure>", self._on_window_configure)
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind('<Enter>', self._check_scroll_end)
         
-        # Initialize cards list
-        self.cards = []
+        # videoIds of every result, for deduplicating further pages
+        self._video_ids = set()
+        # videoIds bound to a card right now; read by thumbnail workers to skip
+        # downloads for rows that scrolled away before their turn
+        self._shown_video_ids = frozenset()
+        self._thumbnails_loading = set()
+        
         self.create_results_grid()
+        
+        # Cards read like state from memory; load the liked set once if needed
+        # (call_async also waits for Firebase initialization off the Tk thread).
+        # Hearts stay disabled until it has loaded.
+        if current_user and not self._liked_set_manager():
+            self._load_liked_set()
 
         self._menu_open = False
         self._scroll_disabled = False
@@ -104,6 +120,11 @@ class SearchScreen(ctk.CTkFrame):
         self.context_menu = None
         self.submenu = None
     
+    @property
+    def firebase_manager(self):
+        """The shared FirebaseManager once it is initialized (None before, or when logged out)"""
+        return get_firebase_manager_if_ready() if self.current_user else None
+
     def set_song_selection_callback(self, callback):
         """Set callback function to be called when a song is selected"""
         self.song_selection_callback = callback
@@ -176,42 +197,123 @@ class SearchScreen(ctk.CTkFrame):
             self.after(50, lambda: self._on_like_button_clicked(song_data, like_button))
             return
         
-        if not self.current_user or not self.firebase_manager:
+        if not self.current_user:
             print("User not logged in")
             return
         
-        # Toggle like status
-        success, is_liked, message = self.firebase_manager.toggle_song_like(self.current_user, song_data)
-        
-        if success and like_button:
-            # Update button appearance with consistent sizing
-            if is_liked:
-                like_button.configure(
-                    text="♥",
-                    fg_color="#FF6B6B",
-                    hover_color="#FF5252",
-                    font=ctk.CTkFont(size=14)  # Smaller font for filled heart
-                )
-            else:
-                like_button.configure(
-                    text="♡",
-                    fg_color="#333333",
-                    hover_color="#444444",
-                    font=ctk.CTkFont(size=16)  # Normal font for empty heart
-                )
-            print(message)
-        else:
-            print(f"Error: {message}")
+        # Without the liked set the current state is unknown and toggling
+        # could queue the opposite of what the user meant
+        manager = self._liked_set_manager()
+        if manager is None:
+            print("Liked songs not loaded yet")
+            return
+        
+        # Toggle locally right away; the write journal syncs it in the background
+        video_id = song_data.get('videoId')
+        if not video_id:
+            print("Error: No video ID found")
+            return
+        was_liked = manager.liked_status(self.current_user, [video_id], load=False)[video_id]
+        is_liked = manager.queue_like(self.current_user, song_data, not was_liked)
+        
+        if like_button and like_button.winfo_exists():
+            self._apply_like_style(like_button, is_liked)
+        print(f"{'Added' if is_liked else 'Removed'} '{song_data.get('title')}' {'to' if is_liked else 'from'} liked songs")
+    
+    def _like_style(self, is_liked):
+        """Text, font and colors for a like button"""
+        # Use consistent heart symbols with appropriate font sizes
+        if is_liked:
+            return {
+                'text': "♥",
+                'font': ctk.CTkFont(size=14),  # Smaller font for filled heart
+                'fg_color': "#FF6B6B",
+                'hover_color': "#FF5252",
+            }
+        return {
+            'text': "♡",
+            'font': ctk.CTkFont(size=16),  # Normal font for empty heart
+            'fg_color': "#333333",
+            'hover_color': "#444444",
+        }
+    
+    def _apply_like_style(self, like_button, is_liked):
+        """Update like button appearance with consistent sizing
+        
+        Args:
+            like_button: Like button of a card
+            is_liked: Like state, or None while it is unknown (button disabled)
+        """
+        if getattr(like_button, "_is_liked", None) == is_liked:
+            return
+        like_button._is_liked = is_liked
+        like_button.configure(state="disabled" if is_liked is None else "normal",
+                              **self._like_style(bool(is_liked)))
+    
+    def _liked_set_manager(self):
+        """FirebaseManager if the user's liked set is in memory, else None"""
+        manager = self.firebase_manager
+        if manager and manager.is_liked_set_loaded(self.current_user):
+            return manager
+        return None
+    
+    def _load_liked_set(self):
+        """Load the user's liked songs in the background, then refresh the hearts"""
+        call_async('load_liked_set', self.current_user, widget=self,
+                   callback=lambda liked: self._on_liked_set_loaded(),
+                   errback=lambda e: self._on_liked_set_loaded(e))
     
+    def _on_liked_set_loaded(self, error=None):
+        if self._liked_set_manager():
+            self._refresh_like_buttons()
+            return
+        # The read failed; hearts stay disabled until a retry succeeds
+        print(f"[DEBUG] Could not load liked songs, retrying: {error}")
+        self.after(5000, self._load_liked_set)
+    
+    def _refresh_like_buttons(self):
+        """Apply in-memory like state to the like buttons on screen"""
+        manager = self._liked_set_manager()
+        if not self.winfo_exists() or not manager:
+            return
+        cards = [card for _, card in self.results_list.bound_rows() if card._like_button is not None]
+        video_ids = [card._result.get('videoId') for card in cards]
+        status = manager.liked_status(self.current_user, video_ids, load=False)
+        for card, video_id in zip(cards, video_ids):
+            self._apply_like_style(card._like_button, status.get(video_id, False))
+    
+    def _on_results_pointer(self, event, index):
+        """Hover highlight follows the row under the pointer"""
+        if self.current_user:
+            self._set_hover_index(index)
+
+    def _on_results_click(self, event, index):
+        """Left-click anywhere on a card (outside its buttons) selects it"""
+        card = self.results_list.row_for_index(index) if index is not None else None
+        if card is not None:
+            self._select_card(card)
+
+    def _on_results_right_click(self, event, index):
+        if index is None or not self.current_user:
+            return
+        # Select the card that was right-clicked
+        self._on_results_click(event, index)
+        self._on_right_click(event, self.results_list.items[index])
+
+    def _set_hover_index(self, index):
+        """Move the hover highlight to the card showing index (None clears it)"""
+        if index == self._hover_index:
+            return
+        old_card = self.results_list.row_for_index(self._hover_index) if self._hover_index is not None else None
+        self._hover_index = index
+        if old_card is not None and not old_card._is_selected:
+            self._set_card_visual(old_card, "default")
+        card = self.results_list.row_for_index(index) if index is not None else None
+        if card is not None and not card._is_selected:
+            self._set_card_visual(card, "hover")
+
     def _on_right_click(self, event, song_data):
         """Handle right-click on song card to show context menu"""
-        # Select the card that was right-clicked
-        try:
-            card = self._get_card_from_event(event)
-            if card is not None:
-                self._select_card(card)
-        except Exception:
-            pass
         if not self.current_user or not self.add_to_playlist_callback:
             return
         
@@ -305,9 +407,8 @@ class SearchScreen(ctk.CTkFrame):
             toplevel,
             self,
             self.main_container,
-            self.canvas_container,
-            self.canvas,
-            self.scrollable_frame
+            self.results_list,
+            self.canvas
         ]
         
         for widget in widgets_to_bind:
@@ -325,9 +426,8 @@ class SearchScreen(ctk.CTkFrame):
             toplevel,
             self,
             self.main_container,
-            self.canvas_container,
-            self.canvas,
-            self.scrollable_frame
+            self.results_list,
+            self.canvas
         ]
         
         for widget in widgets_to_unbind:
@@ -387,12 +487,15 @@ class SearchScreen(ctk.CTkFrame):
             print("User not logged in or Firebase manager not available")
             return
         
-        # Call Firebase method to add song to playlist
-        success, message = self.firebase_manager.add_song_to_playlist(
-            self.current_user, 
-            playlist['name'], 
-            song_data
-        )
+        # Skip songs the mirror already shows in the playlist; otherwise queue the
+        # add in the write journal (duplicates are also rejected when it syncs)
+        mirror = get_firestore_mirror(self.current_user)
+        existing = mirror.get_playlist_songs(playlist['name'], timeout=0) if mirror else None
+        if existing and any(s.get('videoId') == song_data.get('videoId') for s in existing):
+            success, message = False, f"Song '{song_data.get('title')}' is already in playlist '{playlist['name']}'"
+        else:
+            success = True
+            message = self.firebase_manager.queue_playlist_add(self.current_user, playlist['name'], song_data)
         
         if success:
             # Show success message in context menu
@@ -427,41 +530,13 @@ class SearchScreen(ctk.CTkFrame):
         # Hide menus after a delay
         self.after(900, self._hide_all_menus)
     
-    def _on_canvas_configure(self, event):
-        """Update the canvas window width when the canvas is resized"""
-        if self._resize_in_progress:
-            return
-            
-        if event.width > 1:  # Ensure we have a valid width
-            self.canvas.itemconfig("scrollable_frame", width=event.width)
-    
-    def _on_window_configure(self, event):
-        """Handle window resize with debounce"""
-        if self._resize_after_id:
-            self.after_cancel(self._resize_after_id)
-            
-        self._resize_after_id = self.after(200, self._process_resize)
-    
-    def _process_resize(self):
-        """Process resize after a short delay to prevent excessive updates"""
-        self._resize_in_progress = True
-        try:
-            # Update canvas scroll region
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            
-            # Update card layouts
-            for card in self.cards:
-                if hasattr(card, '_title') and card._title.winfo_exists():
-                    available_width = max(100, card.winfo_width() - 220)
-                    card._title.configure(wraplength=available_width)
-        finally:
-            self._resize_in_progress = False
-            self._resize_after_id = None
-    
     def _on_mousewheel(self, event):
         if getattr(self, "_menu_open", False):
             return "break"
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # A different row is now under the (unmoved) pointer
+        if self.current_user:
+            self._set_hover_index(self.results_list.index_at(*self.winfo_pointerxy()))
         self._check_scroll_end(event)
 
     def _check_scroll_end(self, event=None):
@@ -474,61 +549,91 @@ class SearchScreen(ctk.CTkFrame):
             if last > 0.98:
                 self.loading_more = True
                 self._show_loading_more()
-                self.load_more_callback(self._on_more_results)
+                generation = self._generation
+                self.load_more_callback(lambda results: self._on_more_results(results, generation))
         except Exception:
             pass
 
     def _show_loading_more(self):
-        # Add a loading label at the end
-        self.loading_label = ctk.CTkLabel(self.scrollable_frame, text="Loading more...", font=ctk.CTkFont(size=14))
-        self.loading_label.grid(row=len(self.cards)*2, column=0, sticky="ew", padx=20, pady=10)
-        self.scrollable_frame.update_idletasks()
+        self.results_list.set_footer("Loading more...")
 
     def _hide_loading_more(self):
-        if hasattr(self, 'loading_label') and self.loading_label:
-            self.loading_label.destroy()
-            self.loading_label = None
+        self.results_list.set_footer(None)
 
-    def _on_more_results(self, new_results):
+    def _on_more_results(self, new_results, generation=None):
+        if generation is not None and generation != self._generation:
+            # A page for the previous query; set_results already reset the state
+            return
         self._hide_loading_more()
         self.loading_more = False
         if not new_results:
             self.no_more_results = True
             # Optionally show a message at the end
-            end_label = ctk.CTkLabel(self.scrollable_frame, text="No more results.", font=ctk.CTkFont(size=14), text_color="gray")
-            end_label.grid(row=len(self.cards)*2, column=0, sticky="ew", padx=20, pady=10)
+            self.results_list.set_footer("No more results.", text_color="gray")
             return
         self.append_results(new_results)
 
     def create_results_grid(self):
-        # Configure grid for scrollable frame
-        self.scrollable_frame.columnconfigure(0, weight=1)
-        for idx, result in enumerate(self.results):
-            self._add_card(result, idx)
+        self._video_ids.update(result.get('videoId') for result in self.results)
+        self.results_list.set_items(self.results)
+
+    def set_results(self, results):
+        """Show a new query's results in this screen, re-binding the pooled cards"""
+        if self.context_menu or self.submenu:
+            self._hide_all_menus()
+        self._generation += 1
+        self.results = list(results)
+        self._video_ids = set()
+        self.loading_more = False
+        self.no_more_results = False
+        self._selected_video_id = None
+        self._selected_card = None
+        self.results_list.set_footer(None)
+        self.create_results_grid()
+
+    def show_loading_overlay(self):
+        """Cover the results while a new search runs; returns the overlay's content frame.
+
+        The overlay is built once and kept, so callers only need to fill the
+        returned frame when it is empty.
+        """
+        if self._loading_overlay is None:
+            self._loading_overlay = ctk.CTkFrame(self, fg_color="black", corner_radius=0)
+            self._loading_content = ctk.CTkFrame(self._loading_overlay, fg_color="transparent")
+            self._loading_content.pack(expand=True, fill="both")
+        if self.context_menu or self.submenu:
+            self._hide_all_menus()
+        self._loading_overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self._loading_overlay.lift()
+        return self._loading_content
+
+    def hide_loading_overlay(self):
+        if self._loading_overlay is not None:
+            self._loading_overlay.place_forget()
 
     def append_results(self, new_results):
-        start_idx = len(self.cards)
-        for i, result in enumerate(new_results):
-            self._add_card(result, start_idx + i)
-        self.scrollable_frame.update_idletasks()
+        self.results.extend(new_results)
+        self._video_ids.update(result.get('videoId') for result in new_results)
+        self.results_list.append_items(new_results)
 
-    def _add_card(self, result, idx):
-        # Create main card frame with dynamic width
+    def _create_card(self, parent):
+        """Build one reusable card; _bind_card fills it with a result.
+
+        Button commands look up the card's current result when they fire, so
+        they stay valid when the card is recycled.
+        """
         card = ctk.CTkFrame(
-            self.scrollable_frame,
+            parent,
             fg_color=self._card_color_default,
             corner_radius=10,
             height=100
         )
-        
-        # Store card reference
-        card._title = None  # Will store the title widget reference
-        card._content_frame = None
-        card._thumb_container = None
+        card._result = None
+        card._video_id = None
+        card._visual = "default"
         card._is_selected = False
         
         # Configure grid for the card to take full width
-        card.grid(row=idx*2, column=0, sticky="nsew", padx=15, pady=5)
         card.grid_columnconfigure(1, weight=1)  # Make the content area expandable
         card.grid_columnconfigure(2, weight=0, minsize=70)  # Make the button column just wide enough
         card.grid_columnconfigure(3, weight=0, minsize=50)  # Make room for like button
@@ -542,23 +647,7 @@ class SearchScreen(ctk.CTkFrame):
         # Thumbnail label
         thumb = ctk.CTkLabel(thumb_container, text="")
         thumb.pack(expand=True, fill="both")
-        
-        # Load thumbnail in background
-        def load_image_async():
-            try:
-                response = requests.get(result['thumbnail_url'], timeout=5)
-                img = Image.open(BytesIO(response.content))
-                img.thumbnail((120, 80), Image.Resampling.LANCZOS)
-                tk_image = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-                def update_image():
-                    if thumb.winfo_exists():  # Check if widget still exists
-                        thumb.configure(image=tk_image)
-                        thumb.image = tk_image
-                self.after(0, update_image)
-            except Exception as e:
-                print(f"Error loading image: {e}")
-        
-        threading.Thread(target=load_image_async, daemon=True).start()
+        card._thumb = thumb
         
         # Content frame that expands with window
         content_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -569,69 +658,44 @@ class SearchScreen(ctk.CTkFrame):
         # Title with dynamic wrapping
         title = ctk.CTkLabel(
             content_frame,
-            text=result['title'],
+            text="",
             font=ctk.CTkFont(size=16, weight="bold"),
             anchor="w",
             justify="left",
             wraplength=0  # Will be updated on resize
         )
         title.grid(row=0, column=0, sticky="nsw", pady=(0, 5))
-        
-        # Store title reference on card for later updates
         card._title = title
         
         # Additional info (uploader, duration, views)
-        details = []
-        if 'uploader' in result and result['uploader']:
-            details.append(result['uploader'])
-        if 'duration' in result and result['duration']:
-            details.append(result['duration'])
-        if 'view_count' in result and result['view_count']:
-            details.append(result['view_count'])
-            
-        if details:
-            details_text = " • ".join(details)
-            details_label = ctk.CTkLabel(
-                content_frame,
-                text=details_text,
-                font=ctk.CTkFont(size=14),
-                text_color="gray",
-                anchor="w",
-                justify="left"
-            )
-            details_label.grid(row=1, column=0, sticky="nsw")
+        details_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=ctk.CTkFont(size=14),
+            text_color="gray",
+            anchor="w",
+            justify="left"
+        )
+        details_label.grid(row=1, column=0, sticky="nsw")
+        card._details = details_label
         
         # Like button (only show if user is logged in)
         like_button = None
-        if self.current_user and self.firebase_manager:
-            # Check if song is already liked
-            is_liked = self.firebase_manager.is_song_liked(self.current_user, result.get('videoId'))
-            
-            # Use consistent heart symbols with appropriate font sizes
-            if is_liked:
-                like_text = "♥"
-                like_font = ctk.CTkFont(size=14)  # Smaller font for filled heart
-                like_color = "#FF6B6B"
-                like_hover = "#FF5252"
-            else:
-                like_text = "♡"
-                like_font = ctk.CTkFont(size=16)  # Normal font for empty heart
-                like_color = "#333333"
-                like_hover = "#444444"
-            
+        if self.current_user:
             like_button = ctk.CTkButton(
                 card,
-                text=like_text,
                 width=40,
                 height=40,
                 corner_radius=20,
-                fg_color=like_color,
-                hover_color=like_hover,
                 text_color="#FFFFFF",
-                font=like_font,
-                command=lambda: self._on_like_button_clicked(result, like_button)  # Simplified command
+                command=lambda: self._on_like_button_clicked(card._result, like_button),
+                state="disabled",
+                **self._like_style(False)
             )
+            # Like state unknown until _bind_card
+            like_button._is_liked = None
             like_button.grid(row=0, column=2, rowspan=2, padx=(0, 10), pady=15, sticky="nsew")
+        card._like_button = like_button
         
         # Play button (right-aligned)
         play_btn = ctk.CTkButton(
@@ -646,86 +710,108 @@ class SearchScreen(ctk.CTkFrame):
             font=ctk.CTkFont(size=20, weight="bold"),
             border_width=0,
             border_spacing=0,
-            command=lambda: self._on_play_button_clicked(card, result)  # Simplified command
+            command=lambda: self._on_play_button_clicked(card, card._result)
         )
         play_btn.grid(row=0, column=3, rowspan=2, padx=(0, 15), pady=15, sticky="nsew")
         
-        # Hover + right-click across entire card area (FIXED - excludes buttons)
-        hover_on = self._card_color_hover
-        hover_off = self._card_color_default
-
-        def set_hover(is_on: bool):
-            # Avoid overriding selection
-            if getattr(card, "_is_selected", False):
-                return
-            color = hover_on if is_on else hover_off
-            card.configure(fg_color=color)
-            content_frame.configure(fg_color=color if is_on else "transparent")
-            thumb_container.configure(fg_color=color if is_on else "transparent")
-
-        def on_enter(_): set_hover(True)
-
-        def on_leave(e):
-            w = self.winfo_containing(e.x_root, e.y_root)
-            if not w or not self._is_descendant_of(w, card):
-                set_hover(False)
-
-        def bind_recursive(widget):
-            # FIXED: Skip buttons to avoid event conflicts
-            if isinstance(widget, ctk.CTkButton):
-                return
-                
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-            widget.bind("<Button-3>", lambda ev: self._on_right_click(ev, result))
-            for child in widget.winfo_children():
-                bind_recursive(child)
-
-        if self.current_user:
-            bind_recursive(card)
-
-        # Allow selecting a card with left-click (but exclude buttons) - FIXED
-        def bind_select_recursive(widget):
-            # FIXED: Skip buttons to avoid event conflicts
-            if isinstance(widget, ctk.CTkButton):
-                return
-                
-            widget.bind("<Button-1>", lambda ev: self._select_card(card))
-            for child in widget.winfo_children():
-                bind_select_recursive(child)
+        # Hover, select and right-click are handled for all cards by the
+        # delegated handlers bound in __init__; titles are wrapped by _layout_cards
+        return card
 
-        bind_select_recursive(card)
+    def _layout_cards(self, cards, width):
+        """Re-wrap titles for a new card width (the list calls this for shown cards only)"""
+        # Available width for the title: total width - thumbnail(120) - like button(40) - play button(60) - paddings(50)
+        wraplength = max(100, width - 270)
+        for card in cards:
+            card._title.configure(wraplength=wraplength)
 
-        # Add a separator between items
-        if idx < len(self.results) - 1 or idx < len(self.cards) + len(self.results) - 1:
-            separator = ctk.CTkFrame(
-                self.scrollable_frame,
-                height=1,
-                fg_color="#333333"
-            )
-            separator.grid(row=idx*2 + 1, column=0, sticky="ew", padx=20, pady=2)
+    def _bind_card(self, card, index, result):
+        """Show result in a pooled card"""
+        card._result = result
+        card._video_id = result.get('videoId')
+        card._title.configure(text=result['title'])
+        
+        details = []
+        if 'uploader' in result and result['uploader']:
+            details.append(result['uploader'])
+        if 'duration' in result and result['duration']:
+            details.append(result['duration'])
+        if 'view_count' in result and result['view_count']:
+            details.append(result['view_count'])
+        card._details.configure(text=" • ".join(details))
         
-        self.cards.append(card)
+        if card._like_button is not None:
+            # Like state comes from the in-memory liked set (no network I/O here)
+            video_id = card._video_id
+            manager = self._liked_set_manager()
+            is_liked = manager.liked_status(self.current_user, [video_id], load=False)[video_id] if manager else None
+            self._apply_like_style(card._like_button, is_liked)
         
-        # Store videoId for deduplication
-        if not hasattr(self, '_video_ids'):
-            self._video_ids = set()
-        self._video_ids.add(result.get('videoId'))
+        selected = card._video_id is not None and card._video_id == self._selected_video_id
+        if selected:
+            self._selected_card = card
+        elif card is self._selected_card:
+            self._selected_card = None
+        self._set_card_selected_visual(card, selected)
+        if not selected and index == self._hover_index:
+            self._set_card_visual(card, "hover")
         
-        # Update wraplength on window resize
-        def update_wraplength(event):
-            # Calculate available width for the title (total width - thumbnail - buttons - paddings)
-            available_width = max(100, card.winfo_width() - 270)  # 270 = thumbnail(120) + like button(40) + play button(60) + paddings(50)
-            title.configure(wraplength=available_width)
-            
-        # Bind to card resize
-        card.bind('<Configure>', update_wraplength)
+        self._shown_video_ids = frozenset(c._video_id for _, c in self.results_list.bound_rows())
+        self._show_thumbnail(card, result)
+
+    def _show_thumbnail(self, card, result):
+        """Show the cached thumbnail, or clear it and download it in the background"""
+        video_id = card._video_id
+        image = _thumbnail_cache.get(video_id)
+        if image is not None:
+            _thumbnail_cache.move_to_end(video_id)
+        card._thumb.configure(image=image or _get_blank_thumbnail())
+        if image is not None or not result.get('thumbnail_url') or video_id in self._thumbnails_loading:
+            return
+        self._thumbnails_loading.add(video_id)
+        _get_thumbnail_executor().submit(self._load_thumbnail, video_id, result['thumbnail_url'])
+
+    def _load_thumbnail(self, video_id, url):
+        """Download and decode a thumbnail (worker thread)"""
+        tk_image = None
+        # Rows that scrolled away while queued are not worth the download
+        skipped = video_id not in self._shown_video_ids
+        if not skipped:
+            try:
+                response = get_request_governor().get(requests, url, timeout=5)
+                img = Image.open(BytesIO(response.content))
+                img.thumbnail((120, 80), Image.Resampling.LANCZOS)
+                tk_image = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+            except Exception as e:
+                print(f"Error loading image: {e}")
+        try:
+            self.after(0, lambda: self._thumbnail_loaded(video_id, tk_image, skipped))
+        except Exception:
+            # The screen was destroyed
+            pass
+
+    def _thumbnail_loaded(self, video_id, tk_image, skipped=False):
+        self._thumbnails_loading.discard(video_id)
+        if not self.winfo_exists():
+            return
+        if skipped:
+            # Scrolled back into view meanwhile: queue it again
+            for _, card in self.results_list.bound_rows():
+                if card._video_id == video_id:
+                    self._show_thumbnail(card, card._result)
+            return
+        if tk_image is None:
+            return
+        _thumbnail_cache[video_id] = tk_image
+        while len(_thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            _thumbnail_cache.popitem(last=False)
+        for _, card in self.results_list.bound_rows():
+            if card._video_id == video_id:
+                card._thumb.configure(image=tk_image)
         
     def get_all_video_ids(self):
-        # Return all video IDs currently shown
-        if hasattr(self, '_video_ids'):
-            return list(self._video_ids)
-        return []
+        # Return the video IDs of all results, shown or scrolled away
+        return list(self._video_ids)
 
     def _is_descendant_of(self, widget, parent):
         while widget is not None:
@@ -734,51 +820,35 @@ class SearchScreen(ctk.CTkFrame):
             widget = widget.master
         return False
 
-    def _get_card_from_event(self, event):
-        """Return the enclosing card (from self.cards) for a given event, if any."""
-        widget = getattr(event, "widget", None)
-        while widget is not None:
-            if widget in self.cards:
-                return widget
-            widget = getattr(widget, "master", None)
-        # Fallback via pointer position
+    def _set_card_visual(self, card, visual):
+        """Color a card and its inner containers for 'default', 'hover' or 'selected'"""
+        if card._visual == visual:
+            return
+        card._visual = visual
+        color = {
+            'default': self._card_color_default,
+            'hover': self._card_color_hover,
+            'selected': self._card_color_selected,
+        }[visual]
+        inner = "transparent" if visual == "default" else color
         try:
-            under_pointer = self.winfo_containing(event.x_root, event.y_root)
-            widget = under_pointer
-            while widget is not None:
-                if widget in self.cards:
-                    return widget
-                widget = getattr(widget, "master", None)
+            card.configure(fg_color=color)
+            card._content_frame.configure(fg_color=inner)
+            card._thumb_container.configure(fg_color=inner)
         except Exception:
             pass
-        return None
 
     def _set_card_selected_visual(self, card, selected):
         """Apply or clear selected visuals for a card and its inner containers."""
         if card is None or not hasattr(card, "winfo_exists") or not card.winfo_exists():
             return
         card._is_selected = bool(selected)
-        if selected:
-            try:
-                card.configure(fg_color=self._card_color_selected)
-                if hasattr(card, "_content_frame") and card._content_frame.winfo_exists():
-                    card._content_frame.configure(fg_color=self._card_color_selected)
-                if hasattr(card, "_thumb_container") and card._thumb_container.winfo_exists():
-                    card._thumb_container.configure(fg_color=self._card_color_selected)
-            except Exception:
-                pass
-        else:
-            try:
-                card.configure(fg_color=self._card_color_default)
-                if hasattr(card, "_content_frame") and card._content_frame.winfo_exists():
-                    card._content_frame.configure(fg_color="transparent")
-                if hasattr(card, "_thumb_container") and card._thumb_container.winfo_exists():
-                    card._thumb_container.configure(fg_color="transparent")
-            except Exception:
-                pass
+        self._set_card_visual(card, "selected" if selected else "default")
 
     def _select_card(self, card):
-        """Select the given card and clear any previous selection."""
+        """Select the given card's song and clear any previous selection."""
+        if card._result is not None:
+            self._selected_video_id = card._result.get('videoId')
         if card is self._selected_card:
             self._set_card_selected_visual(card, True)
             return
@@ -885,20 +955,31 @@ class SearchScreen(ctk.CTkFrame):
         canvas.bind("<MouseWheel>", _on_submenu_mousewheel)
         inner.bind("<MouseWheel>", _on_submenu_mousewheel)
 
-        playlists = self.firebase_manager.get_user_playlists(self.current_user) or []
-        for p in playlists:
-            btn = ctk.CTkButton(
-                inner,
-                text=p["name"],
-                font=ctk.CTkFont(size=13),
-                fg_color="#333333",
-                hover_color="#444444",
-                anchor="w",
-                height=30,
-                command=lambda pl=p: self._add_to_playlist(pl, song_data)
-            )
-            # Changed from padx=4 to padx=1 to reduce gap to scrollbar
-            btn.pack(fill="x", padx=1, pady=2)
+        def add_playlist_buttons(playlists):
+            for p in playlists:
+                btn = ctk.CTkButton(
+                    inner,
+                    text=p["name"],
+                    font=ctk.CTkFont(size=13),
+                    fg_color="#333333",
+                    hover_color="#444444",
+                    anchor="w",
+                    height=30,
+                    command=lambda pl=p: self._add_to_playlist(pl, song_data)
+                )
+                # Changed from padx=4 to padx=1 to reduce gap to scrollbar
+                btn.pack(fill="x", padx=1, pady=2)
+
+        # Playlists come from the Firestore mirror's memory when it has loaded;
+        # otherwise the submenu opens empty and fills in when the read returns
+        mirror = get_firestore_mirror(self.current_user)
+        if mirror and mirror.is_ready():
+            add_playlist_buttons(mirror.get_playlists())
+        else:
+            def fill_submenu(playlists):
+                add_playlist_buttons(playlists or [])
+                bind_submenu_events(inner)
+            call_async('get_user_playlists', self.current_user, widget=inner, callback=fill_submenu)
 
         # Fixed hover event handling for the submenu
         def _submenu_enter(event):
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+# The app modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FirebaseClass import FirebaseManager
+from InMemoryFirestoreClass import InMemoryFirestore
+
+USERNAME = "alice"
+PASSWORD = "correct horse"
+
+
+def make_song(video_id, title=None):
+    return {
+        'videoId': video_id,
+        'title': title or f"Song {video_id}",
+        'uploader': "Uploader",
+        'duration': "3:00",
+        'url': f"https://www.youtube.com/watch?v={video_id}",
+    }
+
+
+@pytest.fixture
+def backend():
+    return InMemoryFirestore()
+
+
+@pytest.fixture
+def manager(backend):
+    """FirebaseManager over the in-memory backend with a registered user"""
+    manager = FirebaseManager(backend)
+    success, result = manager.register_user(USERNAME, PASSWORD)
+    assert success, result
+    yield manager
+    if manager.journal is not None:
+        manager.journal.stop()
@@ -0,0 +1,45 @@
+from BannerAnimationClass import BannerPalette
+
+COLORS = ["#FF0000", "#00FF00", "#0000FF"]
+
+
+def rgb_at(palette, table, progress):
+    offset = palette.index(progress)
+    return tuple(table[offset:offset + 3])
+
+
+def test_table_size_and_offsets():
+    palette = BannerPalette(COLORS, steps_per_color=8)
+    assert palette.size == 24
+    assert len(palette.table(1.0)) == 24 * 3
+    assert palette.index(0.0) == 0
+    assert palette.index(1.0) == 0
+    assert palette.index(0.5) == 12 * 3
+
+
+def test_cycle_matches_direct_blend():
+    palette = BannerPalette(COLORS, steps_per_color=8)
+    table = palette.table(1.0)
+    assert rgb_at(palette, table, 0.0) == (255, 0, 0)
+    # Each color's span blends to the next color over its first half
+    r, g, b = palette.blend(COLORS[0], COLORS[1], 0.5)
+    assert rgb_at(palette, table, 2 / 24) == (int(r * 255), int(g * 255), int(b * 255))
+    assert rgb_at(palette, table, 4 / 24) == (0, 255, 0)
+
+
+def test_intensity_scales_and_tables_are_cached():
+    palette = BannerPalette(COLORS, steps_per_color=8, intensity_levels=3)
+    assert set(palette.table(0.0)) == {0}
+    half = palette.table(0.5)
+    assert rgb_at(palette, half, 0.0) == (127, 0, 0)
+    # Out-of-range intensities clamp; equal levels share one table
+    assert palette.table(2.0) is palette.table(1.0)
+    assert palette.table(0.45) is half
+    assert palette.describe().endswith("levels_built=3/3")
+
+
+def test_ease_endpoints():
+    palette = BannerPalette(COLORS, steps_per_color=1)
+    assert palette.ultra_smooth_ease_v2(0) == 0
+    assert abs(palette.ultra_smooth_ease_v2(1) - 1) < 1e-9
+    assert palette.ultra_smooth_ease_v2(-1) == 0
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from EnhancementSchedulerClass import EnhancementScheduler
+
+
+@pytest.fixture
+def scheduler():
+    """Scheduler whose worker blocks on a gate so the queue can be inspected"""
+    gate = threading.Event()
+    done = []
+    finished = threading.Semaphore(0)
+
+    def worker(payload):
+        gate.wait(5)
+        done.append(payload)
+        finished.release()
+
+    scheduler = EnhancementScheduler(worker, rate=1000, burst=1000, max_workers=1)
+    scheduler.gate = gate
+    scheduler.done = done
+    scheduler.finished = finished
+    yield scheduler
+    gate.set()
+    scheduler.stop()
+
+
+def run_all(scheduler, count):
+    scheduler.gate.set()
+    for _ in range(count):
+        assert scheduler.finished.acquire(timeout=5)
+    return scheduler.done
+
+
+def block_worker(scheduler):
+    """Occupy the single worker with a job so later submissions queue up"""
+    scheduler.submit('blocker', 0, 'blocker')
+    while scheduler.pending_count():
+        threading.Event().wait(0.005)
+
+
+def test_jobs_run_nearest_to_viewport_first(scheduler):
+    block_worker(scheduler)
+    scheduler.set_viewport(10, 12)
+    for index in (0, 30, 11, 14, 7):
+        scheduler.submit(index, index, index)
+
+    assert run_all(scheduler, 6) == ['blocker', 11, 14, 7, 0, 30]
+
+
+def test_viewport_change_reranks_pending_jobs(scheduler):
+    block_worker(scheduler)
+    for index in (0, 50, 100):
+        scheduler.submit(index, index, index)
+    scheduler.set_viewport(95, 105)
+
+    assert run_all(scheduler, 4) == ['blocker', 100, 50, 0]
+
+
+def test_resubmit_replaces_and_discard_drops(scheduler):
+    block_worker(scheduler)
+    scheduler.submit('a', 0, 'old')
+    scheduler.submit('a', 0, 'new')
+    scheduler.submit('b', 1, 'b')
+    scheduler.discard('b')
+    assert scheduler.pending_count() == 1
+
+    assert run_all(scheduler, 2) == ['blocker', 'new']
+
+
+def test_update_index_moves_job(scheduler):
+    block_worker(scheduler)
+    scheduler.submit('a', 5, 'a')
+    scheduler.submit('b', 9, 'b')
+    scheduler.update_index('b', 0)
+
+    assert run_all(scheduler, 3) == ['blocker', 'b', 'a']
+
+
+def test_job_discarded_while_waiting_for_a_token_returns_it():
+    done = []
+    scheduler = EnhancementScheduler(done.append, rate=0.001, burst=1, max_workers=1)
+    try:
+        # Empty the bucket so the worker claims the job and waits for a token
+        assert scheduler.bucket.try_acquire()
+        scheduler.submit('a', 0, 'a')
+        threading.Event().wait(0.05)
+        scheduler.discard('a')
+        scheduler.bucket.refund()
+        threading.Event().wait(0.3)
+
+        assert done == []
+        assert scheduler.bucket.snapshot()['tokens'] == 1
+    finally:
+        scheduler.stop()
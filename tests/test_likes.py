@@ -0,0 +1,133 @@
+import threading
+
+from FirebaseClass import FirebaseManager
+from FirestoreMirrorClass import FirestoreMirror
+from conftest import USERNAME, make_song
+
+
+def liked_ids(manager):
+    return [entry['videoId'] for entry in manager.get_user_liked_song_entries(USERNAME)]
+
+
+def stored_count(manager):
+    # A fresh manager has nothing cached, so this reads the counter in Firestore
+    return FirebaseManager(manager.backend).get_liked_count(USERNAME)
+
+
+def test_like_and_unlike(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a'), make_song('b')], [])
+    assert liked_ids(manager) == ['a', 'b']
+    assert stored_count(manager) == 2
+
+    manager.apply_like_changes(USERNAME, [], ['a'])
+    assert liked_ids(manager) == ['b']
+    assert stored_count(manager) == 1
+
+
+def test_like_is_idempotent(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a')], [])
+    manager.apply_like_changes(USERNAME, [make_song('a')], [])
+    manager.apply_like_changes(USERNAME, [], ['missing'])
+    assert liked_ids(manager) == ['a']
+    assert stored_count(manager) == 1
+
+
+def test_like_and_unlike_in_one_batch_keeps_count(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a'), make_song('b')], [])
+    # The same video liked and unliked (twice) in one batch ends up unliked
+    manager.apply_like_changes(USERNAME, [make_song('b'), make_song('c'), make_song('c')], ['b', 'b'])
+    assert liked_ids(manager) == ['a', 'c']
+    assert stored_count(manager) == 2
+
+
+def test_like_is_one_write_without_reads(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a')], [])
+    stats = manager.backend.stats
+    before = (stats['round_trips'], stats['reads'])
+    assert manager.like_song(USERNAME, make_song('b'))
+    assert manager.unlike_song(USERNAME, 'a')
+    assert (stats['round_trips'] - before[0], stats['reads'] - before[1]) == (2, 0)
+
+
+def test_batch_with_songs_changed_elsewhere_keeps_count(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a'), make_song('b')], [])
+    # Another device already liked 'a' again and unliked 'b'
+    other = FirebaseManager(manager.backend)
+    other.apply_like_changes(USERNAME, [], ['b'])
+    manager.apply_like_changes(USERNAME, [make_song('a'), make_song('c')], ['b'])
+    assert liked_ids(manager) == ['a', 'c']
+    assert stored_count(manager) == 2
+    assert manager.unlike_song(USERNAME, 'missing')
+
+
+def test_video_ids_needing_quoting(manager):
+    manager.apply_like_changes(USERNAME, [make_song('-x1'), make_song('9abc')], [])
+    manager.apply_like_changes(USERNAME, [], ['-x1'])
+    assert liked_ids(manager) == ['9abc']
+    assert manager.get_user_liked_song_entries(USERNAME)[0]['title'] == "Song 9abc"
+
+
+def test_liked_status_and_count_from_memory(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a')], [])
+    manager.load_liked_set(USERNAME)
+    assert manager.is_liked_set_loaded(USERNAME)
+
+    reads = manager.backend.stats['reads']
+    assert manager.liked_status(USERNAME, ['a', 'b'], load=False) == {'a': True, 'b': False}
+    assert manager.get_liked_count(USERNAME, load=False) == 1
+    assert manager.backend.stats['reads'] == reads
+
+
+def test_more_likes_than_fit_in_one_document(manager):
+    songs = [make_song(f"v{i:05d}") for i in range(12000)]
+    for start in range(0, len(songs), 500):
+        manager.apply_like_changes(USERNAME, songs[start:start + 500], [])
+    assert stored_count(manager) == 12000
+    assert len(manager.load_liked_set(USERNAME, refresh=True)) == 12000
+
+
+def test_legacy_liked_document_is_migrated(manager):
+    encrypted_username = manager._encrypt_data(USERNAME)
+    manager.db.collection('liked_songs').document(encrypted_username).set({
+        'username': encrypted_username,
+        'liked_urls': [manager._song_url('a'), manager._song_url('b')],
+        'liked_meta': {'b': manager.build_song_entry(make_song('b'))},
+    })
+
+    fresh = FirebaseManager(manager.backend)
+    entries = fresh.get_user_liked_song_entries(USERNAME)
+    assert [entry['videoId'] for entry in entries] == ['a', 'b']
+    assert entries[1]['title'] == "Song b"
+    fresh.apply_like_changes(USERNAME, [make_song('c')], ['a'])
+    assert liked_ids(fresh) == ['b', 'c']
+    assert stored_count(manager) == 2
+
+    data = manager.db.collection('liked_songs').document(encrypted_username).get().to_dict()
+    assert 'liked_urls' not in data and 'liked_meta' not in data
+
+
+def test_mirror_receives_like_deltas(manager):
+    manager.apply_like_changes(USERNAME, [make_song('a')], [])
+    mirror = FirestoreMirror(USERNAME, manager)
+    events = []
+    received = threading.Event()
+
+    def on_change(event, delta):
+        events.append((event, delta))
+        if event == 'liked':
+            received.set()
+
+    mirror.subscribe(on_change)
+    mirror.start()
+    try:
+        assert mirror.wait_ready(5)
+        assert [entry['videoId'] for entry in mirror.get_liked_entries()] == ['a']
+
+        manager.apply_like_changes(USERNAME, [make_song('b')], ['a'])
+        assert received.wait(5)
+        delta = events[-1][1]
+        assert [entry['videoId'] for entry in delta['added']] == ['b']
+        assert delta['removed'] == ['a']
+        assert manager.liked_status(USERNAME, ['a', 'b'], load=False) == {'a': False, 'b': True}
+    finally:
+        mirror.stop()
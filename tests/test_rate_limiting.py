@@ -0,0 +1,106 @@
+import threading
+import time
+
+from ExtractionPoolClass import ExtractionError
+from RateLimiterClass import TokenBucket
+from RequestGovernorClass import CircuitBreaker, CircuitOpenError, RequestGovernor
+
+
+def test_bucket_allows_burst_then_refills():
+    bucket = TokenBucket(rate=100, capacity=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    assert 0 < bucket.wait_time() <= 0.01
+    time.sleep(0.02)
+    assert bucket.try_acquire()
+
+
+def test_bucket_acquire_times_out_and_stops():
+    bucket = TokenBucket(rate=0.001, capacity=1)
+    assert bucket.acquire()
+    assert not bucket.acquire(timeout=0.05)
+    stop = threading.Event()
+    stop.set()
+    assert not bucket.acquire(stop_event=stop)
+
+
+def test_bucket_set_rate_shrinks_tokens():
+    bucket = TokenBucket(rate=1, capacity=10)
+    bucket.set_rate(2, capacity=2)
+    assert bucket.snapshot()['tokens'] == 2
+    assert bucket.snapshot()['rate'] == 2
+
+
+def test_breaker_opens_at_threshold_and_probes_once():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow() == 0
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow() > 0
+
+    time.sleep(0.06)
+    assert breaker.allow() == 0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one probe at a time
+    assert breaker.allow() > 0
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+
+def test_breaker_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow() == 0
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_released_probe_can_be_claimed_again():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow() == 0
+    breaker.release_probe()
+    assert breaker.allow() == 0
+
+
+def test_guard_ignores_per_request_errors():
+    governor = RequestGovernor()
+    governor.configure_host('example.com', rate=1000, burst=100, max_concurrency=4, failure_threshold=2)
+    for _ in range(3):
+        try:
+            with governor.guard('example.com'):
+                raise ValueError("Video unavailable")
+        except ValueError:
+            pass
+    assert governor._policy('example.com').breaker.state == CircuitBreaker.CLOSED
+
+
+def test_guard_opens_on_transport_errors():
+    governor = RequestGovernor()
+    governor.configure_host('example.com', rate=1000, burst=100, max_concurrency=4, failure_threshold=2)
+    for _ in range(2):
+        try:
+            with governor.guard('example.com'):
+                raise ConnectionError("connection reset")
+        except ConnectionError:
+            pass
+    try:
+        with governor.guard('example.com'):
+            raise AssertionError("request sent while the circuit is open")
+    except CircuitOpenError as e:
+        assert e.host == 'example.com'
+
+
+def test_guard_counts_yt_dlp_rate_limit_errors():
+    governor = RequestGovernor()
+    governor.configure_host('www.youtube.com', rate=1000, burst=100, max_concurrency=4, failure_threshold=1)
+    try:
+        with governor.guard('www.youtube.com'):
+            raise ExtractionError("ERROR: [youtube] abc: HTTP Error 429: Too Many Requests")
+    except ExtractionError:
+        pass
+    policy = governor._policy('www.youtube.com')
+    assert policy.overloads == 1
+    assert policy.breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,57 @@
+from SongListModelClass import SongListModel
+
+
+def song(video_id):
+    return {'videoId': video_id}
+
+
+def make_model(*video_ids):
+    model = SongListModel()
+    model.reset([song(v) for v in video_ids])
+    events = []
+    model.add_listener(lambda event, **details: events.append((event, details.get('key'))))
+    return model, events
+
+
+def test_reset_drops_duplicates_and_missing_keys():
+    model = SongListModel()
+    model.reset([song('a'), song('b'), song('a'), {'title': "no id"}])
+    assert model.keys() == ['a', 'b']
+    assert 'a' in model and 'c' not in model
+
+
+def test_insert_remove_and_index_of():
+    model, events = make_model('a', 'b', 'c')
+    assert model.insert(1, song('x')) == 1
+    assert model.keys() == ['a', 'x', 'b', 'c']
+    assert [model.index_of(k) for k in ('a', 'x', 'b', 'c', 'missing')] == [0, 1, 2, 3, -1]
+
+    assert model.remove('a') == song('a')
+    assert model.remove('a') is None
+    assert [model.index_of(k) for k in ('x', 'b', 'c')] == [0, 1, 2]
+    assert events == [('insert', 'x'), ('remove', 'a')]
+
+
+def test_insert_existing_key_updates_in_place():
+    model, events = make_model('a', 'b')
+    updated = {'videoId': 'b', 'title': "new"}
+    assert model.insert(0, updated) == 1
+    assert model.keys() == ['a', 'b']
+    assert model.get('b') is updated
+    assert events == [('update', 'b')]
+
+
+def test_move_clamps_and_reindexes():
+    model, events = make_model('a', 'b', 'c', 'd')
+    assert model.move('a', 99)
+    assert model.keys() == ['b', 'c', 'd', 'a']
+    assert model.index_of('a') == 3 and model.index_of('b') == 0
+    assert not model.move('missing', 0)
+    assert events == [('move', 'a')]
+
+
+def test_failing_listener_does_not_stop_others():
+    model, events = make_model()
+    model._listeners.insert(0, lambda event, **details: 1 / 0)
+    model.append(song('a'))
+    assert events == [('insert', 'a')]
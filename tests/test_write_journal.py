@@ -0,0 +1,155 @@
+import json
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from WriteJournalClass import WriteJournal
+from conftest import USERNAME, make_song
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "journal")
+
+
+@pytest.fixture
+def make_journal(manager, journal_path):
+    """Journals whose background thread never flushes on its own (tests call _flush_once)"""
+    journals = []
+
+    def make(firebase_manager=manager, **kwargs):
+        kwargs.setdefault('path', journal_path)
+        journal = WriteJournal(firebase_manager, flush_delay=3600, **kwargs)
+        journals.append(journal)
+        return journal
+
+    yield make
+    for journal in journals:
+        journal.stop()
+
+
+def liked_ids(manager):
+    return [entry['videoId'] for entry in manager.get_user_liked_song_entries(USERNAME)]
+
+
+def test_flush_applies_likes_as_one_batch(manager, make_journal):
+    journal = make_journal()
+    manager.attach_journal(journal)
+    manager.queue_like(USERNAME, make_song('a'), True)
+    manager.queue_like(USERNAME, make_song('b'), True)
+    manager.queue_like(USERNAME, make_song('a'), False)
+
+    journal._flush_once()
+
+    assert liked_ids(manager) == ['b']
+    assert journal.pending() == []
+    assert journal.stats['batches'] == 1
+
+
+def test_entries_survive_a_restart(manager, make_journal, journal_path):
+    make_journal().append('like', USERNAME, song=make_song('a'))
+
+    journal = make_journal()
+    assert [entry['op'] for entry in journal.pending()] == ['like']
+    journal._flush_once()
+    assert liked_ids(manager) == ['a']
+    with open(journal_path, encoding='utf-8') as f:
+        assert f.read() == ""
+
+
+def test_memory_only_journal_writes_no_file(manager, make_journal):
+    journal = make_journal(path=None, persistent=False)
+    assert journal.path is None
+    journal.append('like', USERNAME, song=make_song('a'))
+    journal._flush_once()
+    assert liked_ids(manager) == ['a']
+
+
+def test_playlist_edits_flush_in_order(manager, make_journal):
+    assert manager.create_playlist(USERNAME, "Mix")
+    journal = make_journal()
+    journal.append('playlist_add', USERNAME, playlist_name="Mix", song=make_song('a'))
+    journal.append('playlist_add', USERNAME, playlist_name="Mix", song=make_song('b'))
+    journal.append('playlist_remove', USERNAME, playlist_name="Mix", video_id='a')
+
+    journal._flush_once()
+
+    assert [song['videoId'] for song in manager.get_playlist_songs(USERNAME, "Mix")] == ['b']
+    assert journal.pending() == []
+
+
+class FlakyManager:
+    """Stands in for FirebaseManager; fails like batches with the given error per user"""
+
+    def __init__(self, manager, errors):
+        self.manager = manager
+        self.errors = errors
+
+    def __getattr__(self, name):
+        return getattr(self.manager, name)
+
+    def apply_like_changes(self, username, liked, unliked):
+        if username in self.errors:
+            raise self.errors[username]
+        return self.manager.apply_like_changes(username, liked, unliked)
+
+
+def test_transient_failure_keeps_entries_for_retry(manager, make_journal):
+    assert manager.create_playlist(USERNAME, "Mix")
+    flaky = FlakyManager(manager, {'bob': google_exceptions.ServiceUnavailable("down")})
+    journal = make_journal(flaky)
+    journal.append('like', 'bob', song=make_song('x'))
+    journal.append('like', USERNAME, song=make_song('a'))
+    journal.append('playlist_add', USERNAME, playlist_name="Mix", song=make_song('b'))
+
+    with pytest.raises(google_exceptions.ServiceUnavailable):
+        journal._flush_once()
+
+    # The failing user's likes hold back nothing else
+    assert [entry['username'] for entry in journal.pending()] == ['bob']
+    assert liked_ids(manager) == ['a']
+    assert [song['videoId'] for song in manager.get_playlist_songs(USERNAME, "Mix")] == ['b']
+
+
+@pytest.mark.parametrize('error', [
+    google_exceptions.PermissionDenied("no"),
+    AttributeError("bug"),
+])
+def test_permanent_failure_is_parked(manager, make_journal, journal_path, error):
+    journal = make_journal(FlakyManager(manager, {'bob': error}))
+    journal.append('like', 'bob', song=make_song('x'))
+
+    journal._flush_once()
+
+    assert journal.pending() == []
+    assert journal.stats['parked'] == 1
+    with open(journal_path + ".parked", encoding='utf-8') as f:
+        parked = [json.loads(line) for line in f]
+    assert [entry['song']['videoId'] for entry in parked] == ['x']
+
+
+def test_add_to_missing_playlist_is_parked_and_reported(manager, make_journal):
+    journal = make_journal()
+    reported = []
+    journal.subscribe(lambda event, entries: reported.append((event, [e['op'] for e in entries])))
+    journal.append('playlist_add', USERNAME, playlist_name="Gone", song=make_song('a'))
+    journal.append('playlist_remove', USERNAME, playlist_name="Gone", video_id='b')
+
+    journal._flush_once()
+
+    # The remove wanted the song gone and it is; the add was lost
+    assert journal.pending() == []
+    assert journal.stats['parked'] == 1
+    assert reported == [('parked', ['playlist_add'])]
+
+
+def test_repeated_add_counts_as_applied(manager, make_journal):
+    assert manager.create_playlist(USERNAME, "Mix")
+    manager.apply_playlist_add(USERNAME, "Mix", make_song('a'))
+    journal = make_journal()
+    journal.append('playlist_add', USERNAME, playlist_name="Mix", song=make_song('a'))
+
+    journal._flush_once()
+
+    assert journal.pending() == []
+    assert journal.stats['parked'] == 0